@@ -1,3 +1,5 @@
+import importlib
+
 from .api import (
     AlationAPI,
     AlationAPIError,
@@ -9,7 +11,9 @@ from .sdk import (
     AlationAIAgentSDK,
     AlationTools,
 )
-from .tools import csv_str_to_tool_list
+from .cache import TTLCache
+from .retry import RetryPolicy
+from .metrics import get_metrics, render_openmetrics
 
 __all__ = [
     "AgentSDKOptions",
@@ -17,8 +21,31 @@ __all__ = [
     "AlationTools",
     "AlationAPI",
     "AlationAPIError",
+    "AsyncAlationAIAgentSDK",
+    "AsyncAlationAPI",
     "ServiceAccountAuthParams",
     "BearerTokenAuthParams",
+    "RetryPolicy",
     "SessionAuthParams",
+    "TTLCache",
     "csv_str_to_tool_list",
+    "get_metrics",
+    "render_openmetrics",
 ]
+
+# Imported on first use: the async client pulls in httpx, and tools.py holds the
+# tool descriptions. Neither is needed to create and use the sync SDK.
+_LAZY_ATTRIBUTES = {
+    "AsyncAlationAPI": ".async_api",
+    "AsyncAlationAIAgentSDK": ".async_sdk",
+    "csv_str_to_tool_list": ".tools",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
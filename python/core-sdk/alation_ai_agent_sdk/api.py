@@ -1,10 +1,30 @@
+import base64
+import concurrent.futures
+import contextvars
+import copy
+import functools
+import hashlib
 import time
 import logging
+import threading
 import urllib.parse
 import json
 import requests
+import requests.adapters
 import requests.exceptions
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+import urllib3.connectionpool
+import urllib3.exceptions
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from http import HTTPStatus
 from .types import (
     ServiceAccountAuthParams,
@@ -14,18 +34,51 @@ from .types import (
 )
 from .utils import SDK_VERSION
 from .errors import AlationAPIError, AlationErrorClassifier
+from .cache import FileCache, TTLCache, default_cache_dir
+from .sse import SSEDecoder, SSEEvent
+from .json_codec import JSONCodec, get_json_codec
+from .retry import RetryPolicy, RetryState, parse_retry_after
+from .response_stats import current_response_stats
+from .tracing import (
+    inject_trace_context,
+    set_http_status,
+    start_as_current_span,
+    start_http_span,
+    trace_stream,
+)
+from .timings import (
+    PHASE_AUTH,
+    PHASE_DECODE,
+    PHASE_FIRST_BYTE,
+    PHASE_REQUEST,
+    PHASE_STREAM,
+    PhaseTimings,
+    PhaseTimingsCallback,
+)
+from .metrics import (
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_RETRIES,
+    TOKEN_REFRESHES,
+    endpoint_label,
+)
 
 from alation_ai_agent_sdk.lineage import (
     LineageBatchSizeType,
     LineageDesignTimeType,
+    LineageGraphProcessingOptions,
     LineageGraphProcessingType,
     LineageOTypeFilterType,
     LineagePagination,
+    LineageResponseGraphNode,
     LineageRootNode,
     LineageExcludedSchemaIdsType,
     LineageTimestampType,
     LineageDirectionType,
+    parse_lineage_page,
 )
+from alation_ai_agent_sdk.lineage_graph import LineageCollapser
 
 AUTH_METHOD_SERVICE_ACCOUNT = "service_account"
 AUTH_METHOD_BEARER_TOKEN = "bearer_token"
@@ -37,6 +90,152 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONNECT_TIMEOUT_IN_SECONDS = 60
 DEFAULT_READ_TIMEOUT_IN_SECONDS = 300
 
+# Connection pool defaults. pool_connections is the number of per-host pools kept,
+# pool_maxsize the number of keep-alive connections kept per host.
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_IDLE_TIMEOUT_IN_SECONDS = 60
+
+# Tokens are re-minted this many seconds before their recorded expiry
+DEFAULT_TOKEN_EXPIRY_MARGIN_IN_SECONDS = 60
+# How long before the expiry margin a background refresh renews the token
+DEFAULT_BACKGROUND_TOKEN_REFRESH_LEAD_IN_SECONDS = 30
+
+# Responses of the nearly static instruction endpoints are cached in-process
+DEFAULT_INSTRUCTION_CACHE_TTL_IN_SECONDS = 900
+DEFAULT_INSTRUCTION_CACHE_MAXSIZE = 64
+
+# License and version info persisted with persist_instance_info is reused this long
+DEFAULT_INSTANCE_INFO_CACHE_TTL_IN_SECONDS = 3600
+# A failed instance info fetch isn't attempted again for this long
+DEFAULT_INSTANCE_INFO_RETRY_INTERVAL_IN_SECONDS = 60
+
+# Read size for SSE responses that don't use chunked transfer encoding
+SSE_READ_CHUNK_SIZE = 512
+
+
+def get_jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the `exp` claim (epoch seconds) from a JWT without verifying its signature.
+
+    Returns None when the token is not a JWT or carries no numeric `exp` claim.
+    """
+    try:
+        payload_segment = token.split(".")[1]
+        padded = payload_segment + "=" * (-len(payload_segment) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+class _IdleExpiringPoolMixin:
+    """
+    Closes a pooled connection that sat idle for longer than keepalive_idle_timeout
+    when it is next taken, since the server or a load balancer has likely closed it
+    already; the pool then reconnects it. Idle time counts from when the connection
+    was returned, and connections in use elsewhere are left alone.
+    """
+
+    def __init__(self, *args, keepalive_idle_timeout: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keepalive_idle_timeout = keepalive_idle_timeout
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        idle_since = getattr(conn, "_idle_since", None)
+        if (
+            idle_since is not None
+            and time.monotonic() - idle_since > self.keepalive_idle_timeout
+        ):
+            logger.debug("Dropping idle keep-alive connection")
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        if conn is not None:
+            conn._idle_since = time.monotonic()
+        super()._put_conn(conn)
+
+
+class _IdleExpiringHTTPConnectionPool(
+    _IdleExpiringPoolMixin, urllib3.connectionpool.HTTPConnectionPool
+):
+    pass
+
+
+class _IdleExpiringHTTPSConnectionPool(
+    _IdleExpiringPoolMixin, urllib3.connectionpool.HTTPSConnectionPool
+):
+    pass
+
+
+class _KeepAliveHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter whose pools drop connections idle past keepalive_idle_timeout."""
+
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ["keepalive_idle_timeout"]
+
+    def __init__(self, *args, keepalive_idle_timeout: float, **kwargs):
+        self.keepalive_idle_timeout = keepalive_idle_timeout
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": functools.partial(
+                _IdleExpiringHTTPConnectionPool,
+                keepalive_idle_timeout=self.keepalive_idle_timeout,
+            ),
+            "https": functools.partial(
+                _IdleExpiringHTTPSConnectionPool,
+                keepalive_idle_timeout=self.keepalive_idle_timeout,
+            ),
+        }
+
+
+def create_http_session(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    keepalive_idle_timeout: Optional[float] = None,
+) -> requests.Session:
+    """
+    A requests session with a keep-alive connection pool of the given size, as used
+    by AlationAPI. Pass it as `http_session` to share one pool between clients.
+    """
+    session = requests.Session()
+    adapter = _KeepAliveHTTPAdapter(
+        pool_connections=pool_connections
+        if pool_connections is not None
+        else DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize if pool_maxsize is not None else DEFAULT_POOL_MAXSIZE,
+        keepalive_idle_timeout=keepalive_idle_timeout
+        if keepalive_idle_timeout is not None
+        else DEFAULT_KEEPALIVE_IDLE_TIMEOUT_IN_SECONDS,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _instance_info_property(name: str, doc: str) -> property:
+    """
+    Property for a piece of instance info, fetched on first access unless
+    skip_instance_info was set.
+    """
+    attribute = f"_{name}"
+
+    def getter(self):
+        self._load_instance_info_on_access()
+        return getattr(self, attribute)
+
+    def setter(self, value):
+        setattr(self, attribute, value)
+
+    return property(getter, setter, doc=doc)
+
 
 class AlationAPI:
     """
@@ -48,8 +247,29 @@ class AlationAPI:
         base_url (str): Base URL for the Alation instance
         auth_method (str): Authentication method ("service_account", "bearer_token", or "session")
         auth_params (AuthParams): Parameters required for the chosen authentication method
+
+    All requests share a pooled keep-alive HTTP session. Call close() (or use the
+    instance as a context manager) to release the pooled connections. A session
+    passed as `http_session` is used instead, and is left open by close(), so many
+    clients can share one connection pool.
+
+    Instance info (is_cloud, alation_release_name, ...) is fetched on first access
+    rather than in the constructor. Call ensure_instance_info() to fetch it eagerly.
     """
 
+    is_cloud = _instance_info_property(
+        "is_cloud", "Whether the instance is Alation Cloud, None if unknown."
+    )
+    alation_release_name = _instance_info_property(
+        "alation_release_name", "Release name such as '2025.1.2', None if unknown."
+    )
+    alation_license_info = _instance_info_property(
+        "alation_license_info", "Response of /api/v1/license, None if unknown."
+    )
+    alation_version_info = _instance_info_property(
+        "alation_version_info", "Response of /full_version, None if unknown."
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -59,16 +279,114 @@ class AlationAPI:
         skip_instance_info: Optional[bool] = False,
         enable_streaming: Optional[bool] = False,
         decode_nested_json: Optional[bool] = False,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keepalive_idle_timeout: Optional[float] = None,
+        validate_token_on_server: Optional[bool] = False,
+        token_expiry_margin: Optional[float] = None,
+        background_token_refresh: Optional[bool] = False,
+        instruction_cache_ttl: Optional[float] = None,
+        instruction_cache_maxsize: Optional[int] = None,
+        instruction_cache: Optional[TTLCache] = None,
+        persist_instance_info: Optional[bool] = False,
+        instance_info_cache_dir: Optional[str] = None,
+        instance_info_cache_ttl: Optional[float] = None,
+        stream_event_types: Optional[Collection[str]] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        record_phase_timings: Optional[bool] = False,
+        phase_timings_callback: Optional[PhaseTimingsCallback] = None,
+        http_session: Optional[requests.Session] = None,
+        instance_info_cache: Optional[Union[TTLCache, FileCache]] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.access_token: Optional[str] = None
+        # Epoch seconds at which access_token expires, when known
+        self.access_token_expires_at: Optional[float] = None
+        # When enabled, every call introspects the token on the server instead of
+        # trusting the locally recorded expiry.
+        self.validate_token_on_server = validate_token_on_server
+        self.token_expiry_margin = (
+            token_expiry_margin
+            if token_expiry_margin is not None
+            else DEFAULT_TOKEN_EXPIRY_MARGIN_IN_SECONDS
+        )
+        # Serializes token refreshes so concurrent callers share a single mint
+        self._token_lock = threading.Lock()
+        # When enabled, the token is renewed on a timer shortly before it expires
+        self.background_token_refresh = background_token_refresh
+        self._token_refresh_timer: Optional[threading.Timer] = None
         self.auth_method = auth_method
         self.enable_streaming = enable_streaming
         self.decode_nested_json = decode_nested_json
-        self.is_cloud = None
-        self.alation_release_name = None
-        self.alation_version_info = None
+        # Encodes request bodies and decodes responses and SSE events
+        self.json_codec = get_json_codec(json_codec)
+        # Applied to every REST call, SSE stream (until the first byte) and token mint
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Per-phase latency of SSE and REST calls. When enabled it is returned in
+        # _meta["timings"]; the callback, when set, receives it for every call.
+        self.record_phase_timings = record_phase_timings
+        self.phase_timings_callback = phase_timings_callback
+        # When set, only SSE events whose `event:` type is listed are decoded and
+        # returned. Events without an `event:` field have the type "message".
+        self.stream_event_types = (
+            frozenset(stream_event_types) if stream_event_types is not None else None
+        )
+        self._is_cloud = None
+        self._alation_release_name = None
+        self._alation_license_info = None
+        self._alation_version_info = None
+        self._instance_info_pending = not skip_instance_info
+        # Monotonic time before which a failed fetch isn't attempted again
+        self._instance_info_retry_at: Optional[float] = None
+        self._instance_info_lock = threading.Lock()
+        # Optionally persist instance info on disk, keyed by base_url, so that
+        # short-lived processes can skip fetching it on startup. A cache may also be
+        # given to share the info between instances of the same process.
+        if instance_info_cache is not None:
+            self.instance_info_cache: Optional[Union[TTLCache, FileCache]] = (
+                instance_info_cache
+            )
+        elif persist_instance_info:
+            self.instance_info_cache = FileCache(
+                directory=instance_info_cache_dir or default_cache_dir(),
+                ttl=instance_info_cache_ttl
+                if instance_info_cache_ttl is not None
+                else DEFAULT_INSTANCE_INFO_CACHE_TTL_IN_SECONDS,
+            )
+        else:
+            self.instance_info_cache = None
         self.dist_version = dist_version
+        self.pool_connections = (
+            pool_connections
+            if pool_connections is not None
+            else DEFAULT_POOL_CONNECTIONS
+        )
+        self.pool_maxsize = (
+            pool_maxsize if pool_maxsize is not None else DEFAULT_POOL_MAXSIZE
+        )
+        self.keepalive_idle_timeout = (
+            keepalive_idle_timeout
+            if keepalive_idle_timeout is not None
+            else DEFAULT_KEEPALIVE_IDLE_TIMEOUT_IN_SECONDS
+        )
+        # Opt-in cache for the instruction endpoints, enabled by a positive
+        # instruction_cache_ttl or a given cache. A cache may be shared between
+        # instances since entries are keyed by base_url and auth identity.
+        if instruction_cache is not None:
+            self.instruction_cache: Optional[TTLCache] = instruction_cache
+        elif instruction_cache_ttl:
+            self.instruction_cache = TTLCache(
+                maxsize=instruction_cache_maxsize or DEFAULT_INSTRUCTION_CACHE_MAXSIZE,
+                ttl=instruction_cache_ttl,
+            )
+        else:
+            self.instruction_cache = None
+        # Owned by the caller: used as is and never closed here
+        self._shared_session = http_session
+        self._session: Optional[requests.Session] = None
+        self._http_adapter: Optional[requests.adapters.HTTPAdapter] = None
+        self._session_lock = threading.Lock()
 
         # Validate auth_method and auth_params
         if auth_method == AUTH_METHOD_SERVICE_ACCOUNT:
@@ -96,46 +414,176 @@ class AlationAPI:
 
         logger.debug(f"AlationAPI initialized with auth method: {self.auth_method}")
 
-        if not skip_instance_info:
-            self._fetch_and_cache_instance_info()
+    def __enter__(self) -> "AlationAPI":
+        return self
 
-    def _fetch_and_cache_instance_info(self):
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
         """
-        Fetches instance info (license and version) after authentication and caches in memory.
+        Close the pooled HTTP session and release its keep-alive connections.
+        Any scheduled background token refresh is cancelled.
+
+        The instance stays usable: a new session is created on the next request.
         """
-        self._with_valid_auth()
-        headers = self._get_request_headers()
-        try:
-            # License info
-            license_url = f"{self.base_url}/api/v1/license"
-            license_resp = requests.get(license_url, headers=headers, timeout=10)
-            license_resp.raise_for_status()
-            license_data = license_resp.json()
-            self.is_cloud = license_data.get("is_cloud", None)
-            self.alation_license_info = license_data
-        except Exception as e:
-            logger.warning(f"Could not fetch license info: {e}")
-            self.is_cloud = None
-            self.alation_license_info = None
+        self._cancel_background_token_refresh()
+        with self._session_lock:
+            session = self._session
+            self._session = None
+            self._http_adapter = None
+        if session is not None:
+            session.close()
+            logger.debug("AlationAPI HTTP session closed")
+
+    def _create_http_session(self) -> requests.Session:
+        session = create_http_session(
+            self.pool_connections, self.pool_maxsize, self.keepalive_idle_timeout
+        )
+        self._http_adapter = session.get_adapter("https://")
+        return session
+
+    def _get_http_session(self) -> requests.Session:
+        """
+        Get the shared HTTP session used by every endpoint, creating it on first use.
+
+        Connections idle for longer than keepalive_idle_timeout are reconnected before
+        their next request since the server or a load balancer has likely closed them
+        already. A shared session passed as `http_session` is returned as is.
+        """
+        if self._shared_session is not None:
+            return self._shared_session
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_http_session()
+            return self._session
+
+    def ensure_instance_info(self) -> None:
+        """
+        Fetch and cache instance info once, unless skip_instance_info was set.
+
+        The info is read from the on-disk cache when persist_instance_info is set
+        and a fresh entry exists for base_url. Concurrent callers share one fetch.
+        When the fetch fails, for example on authentication, the error is raised
+        and calls return right away for the next
+        DEFAULT_INSTANCE_INFO_RETRY_INTERVAL_IN_SECONDS.
+        """
+        if not self._should_fetch_instance_info():
+            return
+        with self._instance_info_lock:
+            if not self._should_fetch_instance_info():
+                return
+            try:
+                if not self._load_persisted_instance_info():
+                    self._fetch_and_cache_instance_info()
+                    self._persist_instance_info()
+            except Exception:
+                self._defer_instance_info_fetch()
+                raise
+            self._instance_info_pending = False
+
+    def _defer_instance_info_fetch(self) -> None:
+        self._instance_info_retry_at = (
+            time.monotonic() + DEFAULT_INSTANCE_INFO_RETRY_INTERVAL_IN_SECONDS
+        )
+
+    def _should_fetch_instance_info(self) -> bool:
+        return self._instance_info_pending and (
+            self._instance_info_retry_at is None
+            or time.monotonic() >= self._instance_info_retry_at
+        )
+
+    def _load_instance_info_on_access(self) -> None:
+        # Reading a property never raises; the info stays None until a fetch works
         try:
-            # Version info
-            version_url = f"{self.base_url}/full_version"
-            version_resp = requests.get(version_url, timeout=10)
-            version_resp.raise_for_status()
-            version_data = version_resp.json()
-            self.alation_release_name = version_data.get("ALATION_RELEASE_NAME", None)
-            self.alation_version_info = version_data
+            self.ensure_instance_info()
         except Exception as e:
-            logger.warning(f"Could not fetch version info: {e}")
-            self.alation_release_name = None
-            self.alation_version_info = None
+            logger.warning(f"Could not fetch instance info: {e}")
+
+    def _load_persisted_instance_info(self) -> bool:
+        if self.instance_info_cache is None:
+            return False
+        entry = self.instance_info_cache.get(self.base_url)
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(part), dict) for part in ("license", "version")
+        ):
+            return False
+        self._set_license_info(entry.get("license"))
+        self._set_version_info(entry.get("version"))
+        logger.debug(f"Loaded cached instance info for {self.base_url}")
+        return True
+
+    def _persist_instance_info(self) -> None:
+        # Partial results are not persisted so the next process retries them
+        if (
+            self.instance_info_cache is None
+            or self._alation_license_info is None
+            or self._alation_version_info is None
+        ):
+            return
+        self.instance_info_cache.set(
+            self.base_url,
+            {
+                "license": self._alation_license_info,
+                "version": self._alation_version_info,
+            },
+        )
+
+    def _set_license_info(self, license_data: Optional[Dict[str, Any]]) -> None:
+        self._alation_license_info = license_data
+        self._is_cloud = license_data.get("is_cloud") if license_data else None
+
+    def _set_version_info(self, version_data: Optional[Dict[str, Any]]) -> None:
+        self._alation_version_info = version_data
+        self._alation_release_name = (
+            version_data.get("ALATION_RELEASE_NAME") if version_data else None
+        )
+
+    def _get_instance_info_json(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        response = self._get_http_session().get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, dict):
+            raise ValueError(f"Unexpected response from {url}: {data!r}")
+        return data
+
+    def _fetch_and_cache_instance_info(self):
+        """
+        Fetches instance info (license and version) and caches in memory.
+
+        The version endpoint needs no authentication, so it is requested on a worker
+        thread while the token is validated and the license is requested.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            version_future = executor.submit(
+                self._get_instance_info_json, f"{self.base_url}/full_version"
+            )
+            self._with_valid_auth()
+            try:
+                license_data = self._get_instance_info_json(
+                    f"{self.base_url}/api/v1/license",
+                    headers=self._get_request_headers(),
+                )
+            except Exception as e:
+                logger.warning(f"Could not fetch license info: {e}")
+                license_data = None
+            try:
+                version_data = version_future.result()
+            except Exception as e:
+                logger.warning(f"Could not fetch version info: {e}")
+                version_data = None
+        self._set_license_info(license_data)
+        self._set_version_info(version_data)
 
     def _handle_request_error(
         self, exception: requests.RequestException, context: str, timeout=None
     ):
         """Utility function to handle request exceptions."""
 
-        alation_release_name = getattr(self, "alation_release_name", None)
+        # Read the cached value directly: error paths must not trigger a fetch
+        alation_release_name = getattr(self, "_alation_release_name", None)
         dist_version = getattr(self, "dist_version", None)
 
         if isinstance(exception, requests.exceptions.Timeout):
@@ -159,15 +607,24 @@ class AlationAPI:
                 dist_version=dist_version,
             )
 
-        status_code = getattr(
-            exception.response, "status_code", HTTPStatus.INTERNAL_SERVER_ERROR
-        )
-        response_text = getattr(
-            exception.response, "text", "No response received from server"
-        )
-        if exception.response is not None:
+        self._raise_for_error_response(exception, exception.response, context)
+
+    def _raise_for_error_response(self, exception: Exception, response: Any, context):
+        """
+        Raise an AlationAPIError classified from an error response.
+
+        Shared by the sync and async clients: `response` only needs `status_code`,
+        `text` and `json()`, and may be None when no response was received.
+        """
+        # Read the cached value directly: error paths must not trigger a fetch
+        alation_release_name = getattr(self, "_alation_release_name", None)
+        dist_version = getattr(self, "dist_version", None)
+
+        status_code = getattr(response, "status_code", HTTPStatus.INTERNAL_SERVER_ERROR)
+        response_text = getattr(response, "text", "No response received from server")
+        if response is not None:
             try:
-                parsed = exception.response.json()
+                parsed = response.json()
             except (json.JSONDecodeError, ValueError):
                 parsed = {"error": response_text}
         else:
@@ -202,32 +659,78 @@ class AlationAPI:
             }
         return meta
 
+    def _log_usage_limit_warning(self, response: Any) -> None:
+        response_meta = self._get_response_meta(response)
+        if response_meta:
+            # NOTE: We shifted from user seeing warnings to logging them as warnings
+            logger.warning(f"At or nearing usage limits: {json.dumps(response_meta)}")
+
+    def _load_response_json(self, response: Any) -> Any:
+        """Decode a response body with the configured JSON codec."""
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            return self.json_codec.loads(content)
+        return response.json()
+
     def _format_successful_response(
-        self, response: requests.Response
+        self, response: requests.Response, timings: Optional[PhaseTimings] = None
     ) -> Union[Dict[str, Any], str]:
         """
         Format a successful response from the Alation API.
         Returns:
-            Union[Dict[str, Any], str]: The formatted response data with entitlement info injected
+            Union[Dict[str, Any], str]: The formatted response data with entitlement info
+            and, when recorded, phase timings injected
         """
         if not (200 <= response.status_code < 300):
-            return response.json()
+            return self._load_response_json(response)
 
-        data = response.json()
+        stats = current_response_stats()
+        if stats is not None:
+            stats.bytes_read += len(response.content or b"")
+        data = self._load_response_json(response)
 
-        meta = self._get_response_meta(response)
+        meta = {}
+        headers_meta = self._get_response_meta(response)
         # Check for entitlement headers and inject meta information if present
+        if headers_meta:
+            meta["headers"] = headers_meta
+        if timings is not None:
+            timings.mark(PHASE_DECODE)
+            phase_timings = self._report_phase_timings(timings)
+            if phase_timings is not None:
+                meta["timings"] = phase_timings
         if meta:
             # Maintain backward compatibility by injecting meta into the existing response structure
             if isinstance(data, dict):
                 # If response is a dict, add _meta field (underscore prefix to avoid conflicts)
-                data["_meta"] = {"headers": meta}
+                data["_meta"] = meta
             elif isinstance(data, list):
                 # If response is a list, wrap it to include meta information
-                data = {"results": data, "_meta": {"headers": meta}}
+                data = {"results": data, "_meta": meta}
 
         return data
 
+    def _start_phase_timings(self, name: str) -> Optional[PhaseTimings]:
+        """A PhaseTimings for the call `name`, or None when timings are off."""
+        if self.record_phase_timings or self.phase_timings_callback is not None:
+            return PhaseTimings(name)
+        return None
+
+    def _report_phase_timings(
+        self, timings: PhaseTimings
+    ) -> Optional[Dict[str, float]]:
+        """
+        Pass the timings of a finished call to the callback. Returns them when they
+        should also be added to the result's _meta.
+        """
+        phase_timings = timings.as_dict()
+        if self.phase_timings_callback is not None:
+            try:
+                self.phase_timings_callback(timings.name, phase_timings)
+            except Exception as e:
+                logger.warning(f"phase_timings_callback failed for {timings.name}: {e}")
+        return phase_timings if self.record_phase_timings else None
+
     def _generate_access_token_with_refresh_token(self):
         """
         Generate a new access token using User ID and Refresh Token.
@@ -243,7 +746,7 @@ class AlationAPI:
         )
 
         try:
-            response = requests.post(
+            response = self._get_http_session().post(
                 url, json=payload, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
             )
             response.raise_for_status()
@@ -285,6 +788,29 @@ class AlationAPI:
         Generate a new JSON Web Token (JWT) using Client ID and Client Secret.
         Documentation: https://developer.alation.com/dev/reference/createtoken
         """
+        url, payload, headers = self._get_jwt_token_request()
+        logger.debug("Generating JWT token")
+        try:
+            response = self._send_with_retry(
+                lambda: self._get_http_session().post(
+                    url,
+                    data=payload,
+                    headers=headers,
+                    timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS,
+                ),
+                "post",
+                url,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self._handle_request_error(
+                e, "JWT token generation", timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            )
+
+        self._store_jwt_token_response(url, response)
+
+    def _get_jwt_token_request(self) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Return the url, form payload and headers used to mint a JWT."""
         url = f"{self.base_url}/oauth/v2/token/"
         payload = {
             "client_id": self.client_id,
@@ -295,20 +821,10 @@ class AlationAPI:
             "accept": "application/json",
             "content-type": "application/x-www-form-urlencoded",
         }
-        logger.debug("Generating JWT token")
-        try:
-            response = requests.post(
-                url,
-                data=payload,
-                headers=headers,
-                timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS,
-            )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            self._handle_request_error(
-                e, "JWT token generation", timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
-            )
+        return url, payload, headers
 
+    def _store_jwt_token_response(self, url: str, response: Any) -> None:
+        """Validate a successful token response and record the new token."""
         try:
             data = response.json()
         except ValueError:
@@ -336,8 +852,32 @@ class AlationAPI:
                 help_links=meta["help_links"],
             )
 
+        # Record the expiry first so readers never pair the new token with a stale expiry
+        self.access_token_expires_at = self._get_token_expires_at(data)
         self.access_token = data["access_token"]
+        TOKEN_REFRESHES.inc(auth_method=self.auth_method)
         logger.debug("JWT token generated from client ID and secret")
+        if self.background_token_refresh:
+            self._schedule_background_token_refresh()
+
+    def _get_token_expires_at(self, token_response: Dict[str, Any]) -> Optional[float]:
+        """
+        Determine when a freshly minted token expires.
+
+        Prefers the `expires_in` field of the token response and falls back to the
+        `exp` claim of the JWT itself. Returns None if neither is available.
+        """
+        expires_in = token_response.get("expires_in")
+        try:
+            if expires_in is not None:
+                return time.time() + float(expires_in)
+        except (TypeError, ValueError):
+            logger.debug(f"Ignoring non-numeric expires_in: {expires_in!r}")
+        return get_jwt_expiry(token_response.get("access_token"))
+
+    def _is_access_token_near_expiry(self) -> bool:
+        """Whether the token expires within the configured safety margin."""
+        return time.time() >= self.access_token_expires_at - self.token_expiry_margin
 
     def _generate_new_token(self):
         logger.info(
@@ -352,6 +892,64 @@ class AlationAPI:
                 resolution_hint="SDK improperly configured.",
             )
 
+    def _refresh_access_token(self, stale_token: Optional[str]) -> None:
+        """
+        Single-flight token refresh.
+
+        Callers pass the token they observed as invalid. Only one thread mints a new
+        token at a time; threads that were waiting on the lock find the token already
+        replaced and reuse it instead of minting another one.
+        """
+        with start_as_current_span(
+            "alation.auth.refresh", attributes={"alation.auth.method": self.auth_method}
+        ):
+            with self._token_lock:
+                if self.access_token is not None and self.access_token != stale_token:
+                    logger.debug("Access token was refreshed by another thread")
+                    return
+                self._generate_new_token()
+
+    def _schedule_background_token_refresh(self) -> None:
+        """
+        Schedule a refresh shortly before the current token reaches its expiry margin
+        so requests on the hot path don't wait on a token mint.
+        """
+        self._cancel_background_token_refresh()
+        if self.access_token_expires_at is None:
+            return
+        remaining = self.access_token_expires_at - time.time()
+        # Short-lived tokens are refreshed right away rather than after requests
+        # already treat them as expired, but never later than the expiry itself
+        delay = min(
+            max(
+                remaining
+                - self.token_expiry_margin
+                - DEFAULT_BACKGROUND_TOKEN_REFRESH_LEAD_IN_SECONDS,
+                1.0,
+            ),
+            max(remaining, 0.0),
+        )
+        timer = threading.Timer(
+            delay, self._background_token_refresh, args=(self.access_token,)
+        )
+        timer.daemon = True
+        self._token_refresh_timer = timer
+        timer.start()
+        logger.debug(f"Background token refresh scheduled in {delay:.0f}s")
+
+    def _cancel_background_token_refresh(self) -> None:
+        timer = self._token_refresh_timer
+        self._token_refresh_timer = None
+        if timer is not None:
+            timer.cancel()
+
+    def _background_token_refresh(self, stale_token: Optional[str]) -> None:
+        try:
+            self._refresh_access_token(stale_token)
+        except Exception as e:
+            # The next request falls back to refreshing on the hot path
+            logger.warning(f"Background token refresh failed: {e}")
+
     def _is_access_token_valid(self) -> bool:
         """
         Check if the access token is valid by making a request to the validation endpoint.
@@ -364,7 +962,7 @@ class AlationAPI:
         headers = {"accept": "application/json", "content-type": "application/json"}
 
         try:
-            response = requests.post(
+            response = self._get_http_session().post(
                 url,
                 json=payload,
                 headers=headers,
@@ -410,21 +1008,10 @@ class AlationAPI:
             }
         """
 
-        url = f"{self.base_url}/oauth/v2/introspect/?verify_token=true"
-
-        payload = {
-            "token": self.access_token,
-            "token_type_hint": "access_token",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-        }
-        headers = {
-            "accept": "application/json",
-            "content-type": "application/x-www-form-urlencoded",
-        }
+        url, payload, headers = self._get_jwt_introspection_request()
 
         try:
-            response = requests.post(
+            response = self._get_http_session().post(
                 url,
                 data=payload,
                 headers=headers,
@@ -461,6 +1048,23 @@ class AlationAPI:
                 original_exception=e,
             )
 
+    def _get_jwt_introspection_request(
+        self,
+    ) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Return the url, form payload and headers used to introspect the JWT."""
+        url = f"{self.base_url}/oauth/v2/introspect/?verify_token=true"
+        payload = {
+            "token": self.access_token,
+            "token_type_hint": "access_token",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+        headers = {
+            "accept": "application/json",
+            "content-type": "application/x-www-form-urlencoded",
+        }
+        return url, payload, headers
+
     def _token_is_valid_on_server(self):
         try:
             if self.auth_method == AUTH_METHOD_SERVICE_ACCOUNT:
@@ -469,14 +1073,13 @@ class AlationAPI:
             logger.error(f"Error validating token on server: {e}")
             return False
 
-    def _with_valid_auth(self, disallowed_methods: Optional[List[str]] = None):
+    def _requires_token_check(self, disallowed_methods: Optional[List[str]]) -> bool:
         """
-        Ensures authentication is ready for API calls.
+        Whether the configured auth method needs its token checked before a call.
 
-        For token-based auth (user_account, service_account): validates and refreshes tokens as needed.
-        For credential-based auth (bearer_token, session): assumes credentials are valid (validation happens at request time).
+        Raises:
+            AlationAPIError: If the auth method is not allowed for the operation.
         """
-
         # Certain API endpoints may only support specific auth methods
         if disallowed_methods is not None and self.auth_method in disallowed_methods:
             raise AlationAPIError(
@@ -485,20 +1088,211 @@ class AlationAPI:
                 resolution_hint="Use an alternative authorization method.",
             )
 
-        if self.auth_method in (AUTH_METHOD_BEARER_TOKEN, AUTH_METHOD_SESSION):
-            # For bearer tokens and session cookies, we assume they are valid
-            # Validation happens at the API request level
+        # For bearer tokens and session cookies, we assume they are valid
+        # Validation happens at the API request level
+        return self.auth_method not in (AUTH_METHOD_BEARER_TOKEN, AUTH_METHOD_SESSION)
+
+    def _trusts_local_token_expiry(self) -> bool:
+        """
+        The locally recorded expiry is trusted unless server-side validation is
+        requested or the expiry of the token is unknown.
+        """
+        return (
+            not self.validate_token_on_server
+            and self.access_token_expires_at is not None
+        )
+
+    def _with_valid_auth(self, disallowed_methods: Optional[List[str]] = None):
+        """
+        Ensures authentication is ready for API calls.
+
+        For token-based auth (user_account, service_account): validates and refreshes tokens as needed.
+        For credential-based auth (bearer_token, session): assumes credentials are valid (validation happens at request time).
+        """
+
+        if not self._requires_token_check(disallowed_methods):
             return
 
-        # For token-based authentication, check validity and refresh if needed
-        try:
-            if self.access_token and self._token_is_valid_on_server():
-                logger.debug("Access token is valid on server")
-                return
-        except Exception as e:
-            logger.error(f"Error checking token validity: {e}")
+        # For token-based authentication, check validity and refresh if needed.
+        token = self.access_token
+        if token:
+            if self._trusts_local_token_expiry():
+                if not self._is_access_token_near_expiry():
+                    return
+                logger.debug("Access token is expired or about to expire")
+            else:
+                try:
+                    if self._token_is_valid_on_server():
+                        logger.debug("Access token is valid on server")
+                        return
+                except Exception as e:
+                    logger.error(f"Error checking token validity: {e}")
+
+        self._refresh_access_token(token)
 
-        self._generate_new_token()
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        streaming: bool = False,
+        header_overrides: Optional[Dict[str, str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request over the pooled session with the current auth headers.
+
+        Connection errors and retryable statuses are retried according to the retry
+        policy (self.retry_policy unless one is passed).
+
+        A 401 for a service account token means it was revoked or expired ahead of the
+        recorded expiry, so the token is re-minted and the request is sent once more.
+        Concurrent 401s for the same token share a single re-mint.
+
+        With OpenTelemetry installed the call is a client span, with the re-mint as
+        a child span, and the request carries its traceparent header.
+        """
+        send = getattr(self._get_http_session(), method)
+        if "json" in kwargs:
+            # Encode the body with the configured codec rather than requests' json
+            kwargs["data"] = self.json_codec.dumpb(kwargs.pop("json"))
+            header_overrides = {
+                **(header_overrides or {}),
+                "Content-Type": "application/json",
+            }
+
+        def send_with_auth():
+            if streaming:
+                headers = self._get_streaming_request_headers()
+            else:
+                headers = self._get_request_headers(header_overrides)
+            inject_trace_context(headers)
+            return send(url, headers=headers, **kwargs)
+
+        with start_http_span(method, url) as span:
+            for attempt in range(2):
+                sent_token = self.access_token
+                response = self._send_with_retry(
+                    send_with_auth, method, url, retry_policy=retry_policy
+                )
+                if attempt == 0 and self._should_remint_token(response):
+                    logger.info(
+                        "Request was unauthorized. Re-minting the access token."
+                    )
+                    response.close()
+                    self._refresh_access_token(sent_token)
+                    continue
+                break
+            set_http_status(span, response.status_code)
+            return response
+
+    def _send_with_retry(
+        self,
+        send: Callable[[], requests.Response],
+        method: str,
+        url: str,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> requests.Response:
+        """
+        Call `send` until it returns a response that shouldn't be retried.
+
+        The last response is returned as is, error statuses included, so callers
+        classify it like any other; the last connection error is raised.
+        """
+        retry = (retry_policy or self.retry_policy).start(method)
+        endpoint = endpoint_label(urllib.parse.urlsplit(url).path)
+        while True:
+            started = self._start_http_attempt(endpoint)
+            status: Any = "error"
+            try:
+                response = send()
+                status = response.status_code
+            except requests.exceptions.ConnectionError as e:
+                delay = self._get_connection_error_retry_delay(retry, e)
+                if delay is None:
+                    raise
+                self._log_retry(method, url, f"failed to connect ({e})", delay, retry)
+                time.sleep(delay)
+                continue
+            finally:
+                self._finish_http_attempt(method, endpoint, started, status)
+            delay = self._get_response_retry_delay(response, retry)
+            if delay is None:
+                return response
+            self._log_retry(
+                method, url, f"returned {response.status_code}", delay, retry
+            )
+            response.close()
+            time.sleep(delay)
+
+    def _start_http_attempt(self, endpoint: str) -> float:
+        HTTP_IN_FLIGHT.inc(endpoint=endpoint)
+        return time.perf_counter()
+
+    def _finish_http_attempt(
+        self, method: str, endpoint: str, started: float, status: Any
+    ) -> None:
+        """Record the latency and status of one request attempt in the metrics."""
+        method = method.upper()
+        HTTP_IN_FLIGHT.dec(endpoint=endpoint)
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started, method=method, endpoint=endpoint
+        )
+        HTTP_REQUESTS.inc(method=method, endpoint=endpoint, status=status)
+
+    def _get_connection_error_retry_delay(
+        self, retry: RetryState, error: Exception
+    ) -> Optional[float]:
+        if not retry.policy.retry_on_connection_errors:
+            return None
+        if not retry.replay_safe and not self._is_connect_error(error):
+            return None
+        return retry.next_delay()
+
+    def _is_connect_error(self, error: Exception) -> bool:
+        """Whether `error` was raised before the request could be sent."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = error.args[0] if error.args else None
+        if isinstance(reason, urllib3.exceptions.MaxRetryError):
+            reason = reason.reason
+        # NewConnectionError, and the name resolution errors deriving from it,
+        # are subclasses of ConnectTimeoutError
+        return isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+    def _get_response_retry_delay(
+        self, response: Any, retry: RetryState
+    ) -> Optional[float]:
+        """Seconds to wait before retrying `response`, or None to keep it."""
+        status_code = getattr(response, "status_code", None)
+        if not retry.should_retry_status(status_code):
+            return None
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            # An exhausted quota won't recover by waiting
+            try:
+                response_body = self._load_response_json(response)
+            except ValueError:
+                response_body = None
+            if AlationErrorClassifier._is_quota_error(status_code, response_body):
+                return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return retry.next_delay(retry_after)
+
+    def _log_retry(
+        self, method: str, url: str, reason: str, delay: float, retry: RetryState
+    ) -> None:
+        path = urllib.parse.urlsplit(url).path
+        HTTP_RETRIES.inc(method=method.upper(), endpoint=endpoint_label(path))
+        logger.warning(
+            f"{method.upper()} {path} {reason}. Retrying in {delay:.2f}s "
+            f"(attempt {retry.attempts}/{retry.policy.max_attempts})"
+        )
+
+    def _should_remint_token(self, response: Any) -> bool:
+        return (
+            self.auth_method == AUTH_METHOD_SERVICE_ACCOUNT
+            and getattr(response, "status_code", None) == HTTPStatus.UNAUTHORIZED
+        )
 
     def _get_request_headers(
         self, header_overrides: Optional[Dict[str, str]] = None
@@ -594,8 +1388,8 @@ class AlationAPI:
         if not self._is_likely_json_value(value):
             return value
         try:
-            return json.loads(value)  # type: ignore[arg-type]
-        except (json.JSONDecodeError, TypeError):
+            return self.json_codec.loads(value)  # type: ignore[arg-type]
+        except (ValueError, TypeError):
             return value
 
     def _shallow_decode_collection(self, obj: Any) -> Any:
@@ -668,33 +1462,103 @@ class AlationAPI:
         model_message["parts"] = new_parts
         return data
 
+    def _iter_sse_events(
+        self, response: requests.Response, timings: Optional[PhaseTimings] = None
+    ) -> Generator[SSEEvent, None, None]:
+        response.raise_for_status()
+        # Chunked responses are read a whole chunk at a time as soon as it arrives.
+        # Reads of other responses block until chunk_size bytes are in, so keep it small.
+        chunk_size = (
+            None if getattr(response.raw, "chunked", False) else SSE_READ_CHUNK_SIZE
+        )
+        decoder = SSEDecoder()
+        stats = current_response_stats()
+        awaiting_first_byte = timings is not None
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if awaiting_first_byte:
+                timings.mark(PHASE_FIRST_BYTE)
+                awaiting_first_byte = False
+            if stats is not None:
+                stats.bytes_read += len(chunk)
+            yield from decoder.feed(chunk)
+        if timings is not None:
+            timings.mark(PHASE_STREAM)
+        yield from decoder.flush()
+
     def _iter_sse_response(
-        self, response: requests.Response, log_raw_stream_events: bool = False
+        self,
+        response: requests.Response,
+        log_raw_stream_events: bool = False,
+        timings: Optional[PhaseTimings] = None,
     ) -> Generator[Dict[str, Any], None, None]:
-        response.raise_for_status()
-        for line in response.iter_lines():
-            if not line:
+        event_types = self.stream_event_types
+        decode = self._get_sse_event_decoder(timings)
+        for sse_event in self._iter_sse_events(response, timings):
+            if event_types is not None and sse_event.event not in event_types:
                 continue
-            decoded_line = line.decode("utf-8")
-            if decoded_line.startswith("data:"):
-                if log_raw_stream_events:
-                    logger.info(f"SSE Event: {decoded_line}")
-                json_data_str = decoded_line[len("data:") :].strip()
-                try:
-                    event_data = json.loads(json_data_str)
-                    if self.decode_nested_json:
-                        event_data = self._decode_nested_json(event_data)
-                    # Process the parsed JSON event data
-                    yield event_data
-                except json.JSONDecodeError as e:
-                    # Skip invalid JSON and log error, but continue processing
-                    logger.error(f"Error decoding JSON: {e} in line: {json_data_str}")
-                    continue
+            event_data = decode(sse_event, log_raw_stream_events)
+            if event_data is not None:
+                yield event_data
+        if timings is not None:
+            self._report_phase_timings(timings)
+
+    def _log_raw_sse_event(self, sse_event: SSEEvent) -> None:
+        logger.info(
+            f"SSE Event: {sse_event.event} {sse_event.data.decode('utf-8', 'replace')}"
+        )
+
+    def _decode_sse_event(
+        self, sse_event: SSEEvent, log_raw_stream_events: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decode the JSON payload of an SSE event.
+
+        Returns None for events that aren't valid JSON.
+        """
+        if log_raw_stream_events:
+            self._log_raw_sse_event(sse_event)
+        try:
+            event_data = self.json_codec.loads(sse_event.data)
+        except ValueError as e:
+            # Skip invalid JSON and log error, but continue processing
+            logger.error(f"Error decoding JSON: {e} in event: {sse_event.data!r}")
+            return None
+        if self.decode_nested_json:
+            event_data = self._decode_nested_json(event_data)
+        return event_data
+
+    def _get_sse_event_decoder(
+        self, timings: Optional[PhaseTimings]
+    ) -> Callable[..., Optional[Dict[str, Any]]]:
+        """_decode_sse_event, timed as the decode phase when timings are recorded."""
+        if timings is None:
+            return self._decode_sse_event
+        return timings.timed(PHASE_DECODE, self._decode_sse_event)
+
+    def _decode_last_sse_event(
+        self, last_event: Optional[SSEEvent], timings: Optional[PhaseTimings] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decode the final event of a non-streaming call, adding the phase timings of
+        the call to its _meta when they are recorded.
+        """
+        if last_event is None:
+            event_data = None
+        else:
+            event_data = self._get_sse_event_decoder(timings)(last_event)
+        if timings is not None:
+            phase_timings = self._report_phase_timings(timings)
+            if phase_timings is not None and isinstance(event_data, dict):
+                meta = event_data.setdefault("_meta", {})
+                if isinstance(meta, dict):
+                    meta["timings"] = phase_timings
+        return event_data
 
     def _sse_stream_or_last_event(
         self,
         response: requests.Response,
         log_raw_stream_events: bool = False,
+        timings: Optional[PhaseTimings] = None,
     ) -> Generator[Dict[str, Any], None, None]:
         """
         Generator to yield events from a Server-Sent Events (SSE) response.
@@ -709,18 +1573,22 @@ class AlationAPI:
         if self.enable_streaming:
             # Streaming mode, yield events as they arrive
             yield from self._iter_sse_response(
-                response, log_raw_stream_events=log_raw_stream_events
+                response, log_raw_stream_events=log_raw_stream_events, timings=timings
             )
         else:
-            # Non-streaming mode: collect all events and yield once.
+            # Non-streaming mode: only the raw bytes of the most recent event are
+            # kept and decoded once the stream ends.
             # WARNING: There are an awful lot of tokens returned here that aren't particularly applicable.
             # TBD: Maybe clean these up to only return the payload instead of the whole message etc.
+            event_types = self.stream_event_types
             last_event = None
-            for event in self._iter_sse_response(
-                response, log_raw_stream_events=log_raw_stream_events
-            ):
-                last_event = event
-            yield last_event
+            for sse_event in self._iter_sse_events(response, timings):
+                if event_types is not None and sse_event.event not in event_types:
+                    continue
+                if log_raw_stream_events:
+                    self._log_raw_sse_event(sse_event)
+                last_event = sse_event
+            yield self._decode_last_sse_event(last_event, timings)
 
     def _safe_sse_post_request(
         self,
@@ -730,27 +1598,49 @@ class AlationAPI:
         timeouts: Optional[Tuple[Union[float, int], Union[float, int]]] = None,
         log_raw_stream_events: bool = False,
     ) -> Generator[Dict[str, Any], None, None]:
+        """
+        POST to an SSE endpoint and yield its events (or only the last one when
+        streaming is off), traced as one span while OpenTelemetry is installed.
+        """
+        return trace_stream(
+            f"alation.sse {tool_name}",
+            self._iter_sse_post_request(
+                tool_name, url, payload, timeouts, log_raw_stream_events
+            ),
+            attributes={"alation.tool.name": tool_name},
+        )
+
+    def _iter_sse_post_request(
+        self,
+        tool_name: str,
+        url: str,
+        payload: Dict[str, Any],
+        timeouts: Optional[Tuple[Union[float, int], Union[float, int]]] = None,
+        log_raw_stream_events: bool = False,
+    ) -> Generator[Dict[str, Any], None, None]:
+        timings = self._start_phase_timings(tool_name)
         self._with_valid_auth(disallowed_methods=["user_account", AUTH_METHOD_SESSION])
+        if timings is not None:
+            timings.mark(PHASE_AUTH)
 
-        headers = self._get_streaming_request_headers()
         if timeouts is None:
             timeouts = self._get_streaming_timeouts()
         try:
-            with requests.post(
+            with self._send_request(
+                "post",
                 url,
-                headers=headers,
+                streaming=True,
                 json=payload,
                 stream=True,
                 timeout=timeouts,
             ) as response:
-                response_meta = self._get_response_meta(response)
-                if response_meta:
-                    # NOTE: We shifted from user seeing warnings to logging them as warnings
-                    logger.warning(
-                        f"At or nearing usage limits: {json.dumps(response_meta)}"
-                    )
+                if timings is not None:
+                    timings.mark(PHASE_REQUEST)
+                self._log_usage_limit_warning(response)
                 yield from self._sse_stream_or_last_event(
-                    response, log_raw_stream_events=log_raw_stream_events
+                    response,
+                    log_raw_stream_events=log_raw_stream_events,
+                    timings=timings,
                 )
         except requests.exceptions.ReadTimeout as e:
             logger.error(f"Read timed out while using {tool_name}: {e}")
@@ -766,6 +1656,96 @@ class AlationAPI:
             logger.error(f"Error occurred while using {tool_name}: {e}")
             self._handle_request_error(e, f"{tool_name} - general error", timeout=0)
 
+    def _get_auth_identity(self) -> str:
+        """
+        Identify the credentials in use without exposing them, so cached responses
+        are never served across users.
+        """
+        if self.auth_method == AUTH_METHOD_SERVICE_ACCOUNT:
+            return f"{self.auth_method}:{self.client_id}"
+        if self.auth_method == AUTH_METHOD_SESSION:
+            secret = self.session_cookie
+        else:
+            secret = self.access_token or ""
+        digest = hashlib.sha256(secret.encode("utf-8")).hexdigest()
+        return f"{self.auth_method}:{digest}"
+
+    def _get_instruction_cache_key(self, url: str) -> Tuple:
+        return (
+            self.base_url,
+            url,
+            self._get_auth_identity(),
+            self.enable_streaming,
+            self.decode_nested_json,
+            self.stream_event_types,
+        )
+
+    def invalidate_instruction_cache(self) -> int:
+        """
+        Drop the cached instruction responses for this instance's base_url and
+        credentials. Returns the number of entries removed.
+        """
+        if self.instruction_cache is None:
+            return 0
+        base_url = self.base_url
+        identity = self._get_auth_identity()
+        return self.instruction_cache.invalidate(
+            lambda key: key[0] == base_url and key[2] == identity
+        )
+
+    def _cached_sse_post_request(
+        self,
+        tool_name: str,
+        url: str,
+        payload: Dict[str, Any],
+        chat_id: Optional[str] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Like _safe_sse_post_request but serves repeated calls from instruction_cache.
+        Calls made in a chat always reach the server so they are recorded in it.
+        """
+        if self.instruction_cache is None or chat_id is not None:
+            return self._safe_sse_post_request(
+                tool_name=tool_name, url=url, payload=payload, timeouts=None
+            )
+        return self._iter_cached_sse_events(
+            self._get_instruction_cache_key(url),
+            lambda: self._safe_sse_post_request(
+                tool_name=tool_name, url=url, payload=payload, timeouts=None
+            ),
+        )
+
+    def _iter_cached_sse_events(
+        self, cache_key: Tuple, open_stream
+    ) -> Generator[Dict[str, Any], None, None]:
+        cached_events = self.instruction_cache.get(cache_key)
+        if cached_events is not None:
+            logger.debug(f"Serving cached response for {cache_key[1]}")
+            # Callers may mutate the events they receive
+            yield from copy.deepcopy(cached_events)
+            return
+
+        if not self.enable_streaming:
+            # The single event is drained and cached up front since callers stop
+            # after next()
+            events = list(open_stream())
+            self._store_cached_sse_events(cache_key, events)
+            yield from copy.deepcopy(events)
+            return
+
+        events = []
+        for event in open_stream():
+            # Cached apart from the event handed out, which the caller may mutate
+            events.append(copy.deepcopy(event))
+            yield event
+        self._store_cached_sse_events(cache_key, events)
+
+    def _store_cached_sse_events(
+        self, cache_key: Tuple, events: List[Dict[str, Any]]
+    ) -> None:
+        if events and events[-1] is not None:
+            self.instruction_cache.set(cache_key, events)
+
     def get_context_from_catalog(
         self, query: str, signature: Optional[Dict[str, Any]] = None
     ):
@@ -775,21 +1755,24 @@ class AlationAPI:
         if not query:
             raise ValueError("Query cannot be empty")
 
+        timings = self._start_phase_timings("catalog_search")
         self._with_valid_auth()
-
-        headers = self._get_request_headers()
+        if timings is not None:
+            timings.mark(PHASE_AUTH)
 
         params = {"question": query, "mode": "search"}
         if signature:
-            params["signature"] = json.dumps(signature, separators=(",", ":"))
+            params["signature"] = self.json_codec.dumps(signature)
 
         encoded_params = urllib.parse.urlencode(params, quote_via=urllib.parse.quote)
         url = f"{self.base_url}/integration/v2/context/?{encoded_params}"
 
         try:
-            response = requests.get(
-                url, headers=headers, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            response = self._send_request(
+                "get", url, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
             )
+            if timings is not None:
+                timings.mark(PHASE_REQUEST)
             response.raise_for_status()
 
         except requests.RequestException as e:
@@ -798,7 +1781,7 @@ class AlationAPI:
             )
 
         try:
-            return self._format_successful_response(response)
+            return self._format_successful_response(response, timings)
         except ValueError:
             raise AlationAPIError(
                 message="Invalid JSON in catalog response",
@@ -861,18 +1844,26 @@ class AlationAPI:
         Raises:
             AlationAPIError: On network, API, authentication, or authorization errors
         """
+        timings = self._start_phase_timings("custom_fields")
         self._with_valid_auth()
-
-        headers = self._get_request_headers()
+        if timings is not None:
+            timings.mark(PHASE_AUTH)
 
         url = f"{self.base_url}/integration/v2/custom_field/"
 
         try:
-            response = requests.get(
-                url, headers=headers, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            response = self._send_request(
+                "get", url, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
             )
+            if timings is not None:
+                timings.mark(PHASE_REQUEST)
             response.raise_for_status()
-            return response.json()
+            custom_fields = self._load_response_json(response)
+            if timings is not None:
+                # The list is returned as is, so the timings only go to the callback
+                timings.mark(PHASE_DECODE)
+                self._report_phase_timings(timings)
+            return custom_fields
 
         except requests.RequestException as e:
             self._handle_request_error(
@@ -897,7 +1888,7 @@ class AlationAPI:
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
 
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="alation_context",
             url=url,
             payload=payload,
@@ -915,7 +1906,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/analyze_catalog_question_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="analyze_catalog_question",
             url=url,
             payload={"question": question},
@@ -933,7 +1924,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/bulk_retrieval_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="bulk_retrieval",
             url=url,
             payload={"signature": signature},
@@ -950,11 +1941,11 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/get_custom_fields_definitions_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._cached_sse_post_request(
             tool_name="get_custom_field_definitions",
             url=url,
             payload={},
-            timeouts=None,
+            chat_id=chat_id,
         )
 
     def get_signature_creation_instructions_stream(
@@ -966,11 +1957,11 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/get_signature_creation_instructions_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._cached_sse_post_request(
             tool_name="get_signature_creation_instructions",
             url=url,
             payload={},
-            timeouts=None,
+            chat_id=chat_id,
         )
 
     def get_context_by_id_stream(
@@ -984,7 +1975,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/get_context_by_id_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="get_context_by_id",
             url=url,
             payload={"signature": signature},
@@ -1002,7 +1993,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/agent/default/catalog_context_search_agent/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="catalog_context_search_agent",
             url=url,
             payload={"message": message},
@@ -1021,7 +2012,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/agent/default/query_flow_agent/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="query_flow_agent",
             url=url,
             payload={"message": message, "marketplace_id": marketplace_id},
@@ -1040,7 +2031,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/agent/default/sql_query_agent/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="sql_query_agent",
             url=url,
             payload={"message": message, "data_product_id": data_product_id},
@@ -1062,7 +2053,7 @@ class AlationAPI:
         )
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="get_data_sources_tool",
             url=url,
             payload=payload,
@@ -1081,7 +2072,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/agent/{agent_config_id}/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="custom_agent_stream",
             url=url,
             payload=payload,
@@ -1098,11 +2089,11 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/get_data_dictionary_instructions_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._cached_sse_post_request(
             tool_name="get_data_dictionary_instructions",
             url=url,
             payload={},
-            timeouts=None,
+            chat_id=chat_id,
         )
 
     def generate_data_product_stream(
@@ -1115,11 +2106,11 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/generate_data_product_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._cached_sse_post_request(
             tool_name="generate_data_product",
             url=url,
             payload={},
-            timeouts=None,
+            chat_id=chat_id,
         )
 
     def get_data_product_spec_stream(
@@ -1133,7 +2124,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/get_data_product_spec_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="get_data_product_spec",
             url=url,
             payload={"data_product_id": data_product_id},
@@ -1152,7 +2143,7 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/list_data_products_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="list_data_products",
             url=url,
             payload={"search_term": search_term, "limit": limit},
@@ -1197,7 +2188,7 @@ class AlationAPI:
         )
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="get_data_quality",
             url=url,
             payload=payload,
@@ -1253,13 +2244,109 @@ class AlationAPI:
         url = f"{self.base_url}/ai/api/v1/chats/tool/default/lineage_tool/stream"
         if chat_id is not None:
             url += f"?chat_id={chat_id}"
-        yield from self._safe_sse_post_request(
+        return self._safe_sse_post_request(
             tool_name="alation_lineage",
             url=url,
             payload=payload,
             timeouts=None,
         )
 
+    def iter_lineage(
+        self,
+        root_node: LineageRootNode,
+        direction: LineageDirectionType,
+        limit: Optional[int] = 1000,
+        batch_size: Optional[LineageBatchSizeType] = 1000,
+        max_nodes: Optional[int] = None,
+        show_temporal_objects: Optional[bool] = False,
+        design_time: Optional[LineageDesignTimeType] = None,
+        max_depth: Optional[int] = 10,
+        excluded_schema_ids: Optional[LineageExcludedSchemaIdsType] = None,
+        allowed_otypes: Optional[LineageOTypeFilterType] = None,
+        time_from: Optional[LineageTimestampType] = None,
+        time_to: Optional[LineageTimestampType] = None,
+        chat_id: Optional[str] = None,
+        prefetch: bool = True,
+        collapse_to_otypes: Optional[LineageOTypeFilterType] = None,
+    ) -> Generator[List[LineageResponseGraphNode], None, None]:
+        """
+        Walk the lineage graph of `root_node` in chunked mode, following the
+        pagination of each response, and yield the nodes of every page as a list.
+
+        With `prefetch` the next page is requested on a background thread while the
+        caller works on the current one, so at most two pages are held in memory.
+        The walk stops on the last page, or once `max_nodes` nodes were yielded (the
+        last batch is cut short). `max_depth` bounds the traversal on the server.
+        Closing the generator early stops fetching; a page already in flight is
+        discarded.
+
+        With `collapse_to_otypes` each page is collapsed to those otypes as it
+        arrives (see LineageCollapser), and the batches yielded are the collapsed
+        nodes that are complete so far. `max_nodes` still counts the nodes fetched.
+        """
+
+        def fetch_page(pagination: Optional[LineagePagination]):
+            page = None
+            for event in self.alation_lineage_stream(
+                root_node=root_node,
+                direction=direction,
+                limit=limit,
+                batch_size=batch_size,
+                pagination=pagination,
+                processing_mode=LineageGraphProcessingOptions.CHUNKED,
+                show_temporal_objects=show_temporal_objects,
+                design_time=design_time,
+                max_depth=max_depth,
+                excluded_schema_ids=excluded_schema_ids,
+                allowed_otypes=allowed_otypes,
+                time_from=time_from,
+                time_to=time_to,
+                chat_id=chat_id,
+            ):
+                page = event
+            return parse_lineage_page(page)
+
+        executor = None
+        if prefetch:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="alation-lineage"
+            )
+        collapser = None
+        if collapse_to_otypes is not None:
+            collapser = LineageCollapser(collapse_to_otypes)
+        remaining = max_nodes
+        try:
+            nodes, pagination = fetch_page(None)
+            while True:
+                if remaining is not None:
+                    nodes = nodes[:remaining]
+                    remaining -= len(nodes)
+                # An empty page ends the walk even if the server reports more
+                if not nodes or remaining == 0:
+                    pagination = None
+                next_page = None
+                if pagination is not None and executor is not None:
+                    # Run in a copy of the caller's context so the request joins
+                    # the current trace
+                    next_page = executor.submit(
+                        contextvars.copy_context().run, fetch_page, pagination
+                    )
+                if collapser is not None:
+                    nodes = collapser.add_page(nodes)
+                    if pagination is None:
+                        nodes += collapser.flush()
+                if nodes:
+                    yield nodes
+                if pagination is None:
+                    return
+                if next_page is not None:
+                    nodes, pagination = next_page.result()
+                else:
+                    nodes, pagination = fetch_page(pagination)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def post_tool_event(
         self,
         event: dict,
@@ -1272,39 +2359,72 @@ class AlationAPI:
         Args:
             event (dict): The tool event to post.
             timeout (float): The timeout for the request.
-            max_retries (int): The maximum number of retry attempts.
+            max_retries (int): The maximum number of retry attempts. Backoff follows
+                the client's retry policy.
             extra_headers (Optional[Dict[str, str]]): Additional headers to include in the request.
         """
         self._with_valid_auth()
+        self._post_tool_event(event, timeout, max_retries, extra_headers)
 
-        headers = self._get_request_headers()
-        headers.update(extra_headers or {})
+    def post_tool_events(
+        self,
+        events: List[dict],
+        timeout: float,
+        max_retries: int,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Post a batch of tool events, validating auth once for the whole batch.
 
-        url = f"{self.base_url}/api/v1/ai_agent/tool/event/"
+        The endpoint takes one event per request, so the events are posted in turn
+        over the pooled session. A network error, a 429 or a 5xx ends the batch
+        early since the rest would fail the same way; other failures only skip
+        the event.
 
-        for attempt in range(max_retries + 1):
+        Returns:
+            int: The number of events that were accepted.
+        """
+        self._with_valid_auth()
+        sent = 0
+        for event in events:
             try:
-                response = requests.post(
-                    url, headers=headers, json=event, timeout=timeout
-                )
-                response.raise_for_status()
-                logger.debug(
-                    f"Event sent successfully: {event.get('tool_name', 'unknown')}"
-                )
-                return
-            except requests.RequestException as e:
-                try:
-                    self._handle_request_error(e, "post tool event")
-                except AlationAPIError as api_error:
-                    if attempt == max_retries or not getattr(
-                        api_error, "is_retryable", False
-                    ):
-                        logger.warning(
-                            f"Max retries reached for event tracking: {event.get('tool_name', 'unknown')}"
-                        )
-                        raise
-                    else:
-                        logger.warning(
-                            f"Retrying event tracking: {event.get('tool_name', 'unknown')} (Attempt {attempt + 1}/{max_retries + 1})"
-                        )
-                        time.sleep(0.1 * (2**attempt))  # Exponential backoff
+                self._post_tool_event(event, timeout, max_retries, extra_headers)
+            except AlationAPIError as e:
+                status = e.status_code
+                if (
+                    status is None
+                    or status == HTTPStatus.TOO_MANY_REQUESTS
+                    or status >= 500
+                ):
+                    break
+                continue
+            sent += 1
+        return sent
+
+    def _post_tool_event(
+        self,
+        event: dict,
+        timeout: float,
+        max_retries: int,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        url = f"{self.base_url}/api/v1/ai_agent/tool/event/"
+
+        try:
+            response = self._send_request(
+                "post",
+                url,
+                header_overrides=extra_headers,
+                retry_policy=self.retry_policy.replace(max_attempts=max_retries + 1),
+                json=event,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            logger.debug(
+                f"Event sent successfully: {event.get('tool_name', 'unknown')}"
+            )
+        except requests.RequestException as e:
+            logger.warning(
+                f"Could not send tool event: {event.get('tool_name', 'unknown')}"
+            )
+            self._handle_request_error(e, "post tool event")
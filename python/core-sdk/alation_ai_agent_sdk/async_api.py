@@ -0,0 +1,779 @@
+import asyncio
+import copy
+import logging
+import urllib.parse
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .api import (
+    AUTH_METHOD_SERVICE_ACCOUNT,
+    AUTH_METHOD_SESSION,
+    DEFAULT_CONNECT_TIMEOUT_IN_SECONDS,
+    DEFAULT_READ_TIMEOUT_IN_SECONDS,
+    AlationAPI,
+)
+from .errors import AlationAPIError
+from .lineage import (
+    LineageBatchSizeType,
+    LineageDesignTimeType,
+    LineageDirectionType,
+    LineageExcludedSchemaIdsType,
+    LineageGraphProcessingOptions,
+    LineageOTypeFilterType,
+    LineagePagination,
+    LineageResponseGraphNode,
+    LineageRootNode,
+    LineageTimestampType,
+    parse_lineage_page,
+)
+from .lineage_graph import LineageCollapser
+from .metrics import endpoint_label
+from .retry import RetryPolicy
+from .response_stats import current_response_stats
+from .tracing import (
+    inject_trace_context,
+    set_http_status,
+    start_as_current_span,
+    start_http_span,
+    trace_async_stream,
+)
+from .timings import (
+    PHASE_AUTH,
+    PHASE_DECODE,
+    PHASE_FIRST_BYTE,
+    PHASE_INSTANCE_INFO,
+    PHASE_REQUEST,
+    PHASE_STREAM,
+    PhaseTimings,
+)
+from .sse import SSEDecoder, SSEEvent
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAlationAPI(AlationAPI):
+    """
+    asyncio client for the Alation APIs built on httpx.
+
+    Every `*_stream` method of AlationAPI returns an async generator here instead of
+    a generator, so a single event loop can drive many concurrent catalog streams.
+    Auth state, request headers, error classification and SSE decoding are shared
+    with AlationAPI; only the transport differs.
+
+    Instance info is fetched before the first request. Reading is_cloud or
+    alation_release_name does not fetch it here, since that would block the event
+    loop; await ensure_instance_info() first when they are needed up front.
+    Telemetry events are still posted from background threads using the inherited
+    synchronous post_tool_event.
+
+    Use `async with AsyncAlationAPI(...) as api:` or call `aclose()` to release the
+    pooled connections. Pass `http_client` to share one httpx.AsyncClient between
+    instances instead; it is never closed by them.
+    """
+
+    def __init__(
+        self, *args, http_client: Optional["httpx.AsyncClient"] = None, **kwargs
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncAlationAPI requires httpx. Install it with: pip install 'alation-ai-agent-sdk[async]'"
+            )
+        super().__init__(*args, **kwargs)
+        self._async_instance_info_lock = asyncio.Lock()
+        self._shared_client = http_client
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._async_token_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncAlationAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled async HTTP client along with anything closed by close().
+
+        The instance stays usable: a new client is created on the next request.
+        """
+        self.close()
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.aclose()
+            logger.debug("AsyncAlationAPI HTTP client closed")
+
+    def _create_http_client(self) -> "httpx.AsyncClient":
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_maxsize,
+            keepalive_expiry=self.keepalive_idle_timeout,
+        )
+        return httpx.AsyncClient(limits=limits)
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared async HTTP client, creating it on first use.
+
+        httpx drops connections idle for longer than keepalive_idle_timeout itself.
+        """
+        if self._shared_client is not None:
+            return self._shared_client
+        if self._client is None:
+            self._client = self._create_http_client()
+        return self._client
+
+    def _get_async_timeout(
+        self, timeouts: Optional[Tuple[Union[float, int], Union[float, int]]] = None
+    ) -> "httpx.Timeout":
+        connect_timeout, read_timeout = timeouts or self._get_streaming_timeouts()
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
+
+    async def ensure_instance_info(self) -> None:
+        """
+        Fetch and cache instance info once, unless skip_instance_info was set.
+        Concurrent callers share one fetch, and a failed fetch is retried as by
+        AlationAPI.ensure_instance_info.
+        """
+        if not self._should_fetch_instance_info():
+            return
+        async with self._async_instance_info_lock:
+            if not self._should_fetch_instance_info():
+                return
+            try:
+                if not self._load_persisted_instance_info():
+                    await self._fetch_and_cache_instance_info_async()
+                    self._persist_instance_info()
+            except Exception:
+                self._defer_instance_info_fetch()
+                raise
+            self._instance_info_pending = False
+
+    def _load_instance_info_on_access(self) -> None:
+        # Fetched by ensure_instance_info() instead, see the class docstring
+        pass
+
+    async def _get_instance_info_json_async(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        response = await self._get_http_client().get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, dict):
+            raise ValueError(f"Unexpected response from {url}: {data!r}")
+        return data
+
+    async def _fetch_and_cache_instance_info_async(self) -> None:
+        """
+        Fetches instance info (license and version) concurrently and caches in memory.
+        """
+
+        async def get_license():
+            await self._with_valid_auth_async()
+            return await self._get_instance_info_json_async(
+                f"{self.base_url}/api/v1/license",
+                headers=self._get_request_headers(),
+            )
+
+        license_data, version_data = await asyncio.gather(
+            get_license(),
+            self._get_instance_info_json_async(f"{self.base_url}/full_version"),
+            return_exceptions=True,
+        )
+        if isinstance(license_data, AlationAPIError):
+            # Authentication failed: surface it like the first request would
+            raise license_data
+        if isinstance(license_data, Exception):
+            logger.warning(f"Could not fetch license info: {license_data}")
+            license_data = None
+        if isinstance(version_data, Exception):
+            logger.warning(f"Could not fetch version info: {version_data}")
+            version_data = None
+        self._set_license_info(license_data)
+        self._set_version_info(version_data)
+
+    def _handle_async_request_error(
+        self, exception: "httpx.HTTPError", context: str, timeout=None
+    ):
+        """Counterpart of _handle_request_error for httpx exceptions."""
+        if isinstance(exception, httpx.TimeoutException):
+            if timeout is None:
+                timeout = DEFAULT_READ_TIMEOUT_IN_SECONDS
+            raise AlationAPIError(
+                f"Request to {context} timed out after {timeout} seconds.",
+                reason="Timeout Error",
+                resolution_hint="Ensure the server is reachable and try again later.",
+                help_links=["https://developer.alation.com/"],
+                alation_release_name=self._alation_release_name,
+                dist_version=self.dist_version,
+            )
+        response = (
+            exception.response if isinstance(exception, httpx.HTTPStatusError) else None
+        )
+        self._raise_for_error_response(exception, response, context)
+
+    async def _generate_jwt_token_async(self) -> None:
+        url, payload, headers = self._get_jwt_token_request()
+        logger.debug("Generating JWT token")
+        try:
+            response = await self._send_with_retry_async(
+                lambda: self._get_http_client().post(
+                    url,
+                    data=payload,
+                    headers=headers,
+                    timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS,
+                ),
+                "post",
+                url,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self._handle_async_request_error(
+                e, "JWT token generation", timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            )
+
+        self._store_jwt_token_response(url, response)
+
+    async def _generate_new_token_async(self) -> None:
+        logger.info(
+            "Access token is invalid or expired. Attempting to generate a new one."
+        )
+        if self.auth_method != AUTH_METHOD_SERVICE_ACCOUNT:
+            raise AlationAPIError(
+                "Invalid authentication method configured.",
+                reason="Internal SDK Error",
+                resolution_hint="SDK improperly configured.",
+            )
+        await self._generate_jwt_token_async()
+
+    async def _refresh_access_token_async(self, stale_token: Optional[str]) -> None:
+        """
+        Single-flight token refresh shared by every task on the event loop and by
+        the threads refreshing through _refresh_access_token, such as the
+        background refresh timer.
+        """
+        with start_as_current_span(
+            "alation.auth.refresh", attributes={"alation.auth.method": self.auth_method}
+        ):
+            # Tasks queue on the asyncio lock so only one of them waits on a thread
+            async with self._async_token_lock:
+                await self._acquire_token_lock()
+                try:
+                    if (
+                        self.access_token is not None
+                        and self.access_token != stale_token
+                    ):
+                        logger.debug("Access token was refreshed by another task")
+                        return
+                    await self._generate_new_token_async()
+                finally:
+                    self._token_lock.release()
+
+    async def _acquire_token_lock(self) -> None:
+        """
+        Take the thread lock guarding the token without blocking the event loop.
+        When the waiting task is cancelled, the lock is released as soon as the
+        worker thread gets it.
+        """
+        if self._token_lock.acquire(blocking=False):
+            return
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self._token_lock.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(lambda _: self._token_lock.release())
+            raise
+
+    async def _token_is_valid_on_server_async(self) -> bool:
+        url, payload, headers = self._get_jwt_introspection_request()
+        try:
+            response = await self._get_http_client().post(
+                url,
+                data=payload,
+                headers=headers,
+                timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS,
+            )
+            response.raise_for_status()
+            return response.json().get("active", False)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Error validating token on server: {e}")
+            return False
+
+    async def _with_valid_auth_async(
+        self, disallowed_methods: Optional[List[str]] = None
+    ) -> None:
+        """Async counterpart of _with_valid_auth."""
+        if not self._requires_token_check(disallowed_methods):
+            return
+
+        token = self.access_token
+        if token:
+            if self._trusts_local_token_expiry():
+                if not self._is_access_token_near_expiry():
+                    return
+                logger.debug("Access token is expired or about to expire")
+            elif await self._token_is_valid_on_server_async():
+                logger.debug("Access token is valid on server")
+                return
+
+        await self._refresh_access_token_async(token)
+
+    async def _send_request_async(
+        self,
+        method: str,
+        url: str,
+        streaming: bool = False,
+        header_overrides: Optional[Dict[str, str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> "httpx.Response":
+        """
+        Send a request over the pooled client with the current auth headers.
+
+        Mirrors _send_request: failures are retried according to the retry policy,
+        and a 401 for a service account token re-mints the token and sends the
+        request once more. Streaming responses must be closed by the caller with
+        `aclose()`.
+        """
+        client = self._get_http_client()
+        if "json" in kwargs:
+            kwargs["content"] = self.json_codec.dumpb(kwargs.pop("json"))
+            header_overrides = {
+                **(header_overrides or {}),
+                "Content-Type": "application/json",
+            }
+
+        def send_with_auth():
+            if streaming:
+                headers = self._get_streaming_request_headers()
+            else:
+                headers = self._get_request_headers(header_overrides)
+            inject_trace_context(headers)
+            request = client.build_request(
+                method.upper(), url, headers=headers, **kwargs
+            )
+            return client.send(request, stream=streaming)
+
+        with start_http_span(method, url) as span:
+            for attempt in range(2):
+                sent_token = self.access_token
+                response = await self._send_with_retry_async(
+                    send_with_auth, method, url, retry_policy=retry_policy
+                )
+                if attempt == 0 and self._should_remint_token(response):
+                    logger.info(
+                        "Request was unauthorized. Re-minting the access token."
+                    )
+                    await response.aclose()
+                    await self._refresh_access_token_async(sent_token)
+                    continue
+                break
+            set_http_status(span, response.status_code)
+            return response
+
+    def _is_connect_error(self, error: Exception) -> bool:
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+    async def _send_with_retry_async(
+        self,
+        send: Callable[[], Awaitable["httpx.Response"]],
+        method: str,
+        url: str,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> "httpx.Response":
+        """Async counterpart of _send_with_retry."""
+        retry = (retry_policy or self.retry_policy).start(method)
+        endpoint = endpoint_label(urllib.parse.urlsplit(url).path)
+        while True:
+            started = self._start_http_attempt(endpoint)
+            status: Any = "error"
+            try:
+                response = await send()
+                status = response.status_code
+            except (
+                httpx.ConnectError,
+                httpx.ConnectTimeout,
+                httpx.RemoteProtocolError,
+            ) as e:
+                delay = self._get_connection_error_retry_delay(retry, e)
+                if delay is None:
+                    raise
+                self._log_retry(method, url, f"failed to connect ({e})", delay, retry)
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                self._finish_http_attempt(method, endpoint, started, status)
+            if retry.should_retry_status(response.status_code):
+                # Streaming responses are unread; the body tells quota errors apart
+                await response.aread()
+            delay = self._get_response_retry_delay(response, retry)
+            if delay is None:
+                return response
+            self._log_retry(
+                method, url, f"returned {response.status_code}", delay, retry
+            )
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _iter_sse_events(
+        self, response: "httpx.Response", timings: Optional[PhaseTimings] = None
+    ) -> AsyncGenerator[SSEEvent, None]:
+        if response.is_error:
+            # Read the body so the error classification can see it
+            await response.aread()
+        response.raise_for_status()
+        decoder = SSEDecoder()
+        stats = current_response_stats()
+        awaiting_first_byte = timings is not None
+        async for chunk in response.aiter_bytes():
+            if awaiting_first_byte:
+                timings.mark(PHASE_FIRST_BYTE)
+                awaiting_first_byte = False
+            if stats is not None:
+                stats.bytes_read += len(chunk)
+            for sse_event in decoder.feed(chunk):
+                yield sse_event
+        if timings is not None:
+            timings.mark(PHASE_STREAM)
+        for sse_event in decoder.flush():
+            yield sse_event
+
+    async def _iter_sse_response(
+        self,
+        response: "httpx.Response",
+        log_raw_stream_events: bool = False,
+        timings: Optional[PhaseTimings] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        event_types = self.stream_event_types
+        decode = self._get_sse_event_decoder(timings)
+        async for sse_event in self._iter_sse_events(response, timings):
+            if event_types is not None and sse_event.event not in event_types:
+                continue
+            event_data = decode(sse_event, log_raw_stream_events)
+            if event_data is not None:
+                yield event_data
+        if timings is not None:
+            self._report_phase_timings(timings)
+
+    async def _sse_stream_or_last_event(
+        self,
+        response: "httpx.Response",
+        log_raw_stream_events: bool = False,
+        timings: Optional[PhaseTimings] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        if self.enable_streaming:
+            async for event in self._iter_sse_response(
+                response, log_raw_stream_events=log_raw_stream_events, timings=timings
+            ):
+                yield event
+        else:
+            # Only the raw bytes of the most recent event are kept and decoded once
+            # the stream ends
+            event_types = self.stream_event_types
+            last_event = None
+            async for sse_event in self._iter_sse_events(response, timings):
+                if event_types is not None and sse_event.event not in event_types:
+                    continue
+                if log_raw_stream_events:
+                    self._log_raw_sse_event(sse_event)
+                last_event = sse_event
+            yield self._decode_last_sse_event(last_event, timings)
+
+    def _safe_sse_post_request(
+        self,
+        tool_name: str,
+        url: str,
+        payload: Dict[str, Any],
+        timeouts: Optional[Tuple[Union[float, int], Union[float, int]]] = None,
+        log_raw_stream_events: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return trace_async_stream(
+            f"alation.sse {tool_name}",
+            self._iter_sse_post_request(
+                tool_name, url, payload, timeouts, log_raw_stream_events
+            ),
+            attributes={"alation.tool.name": tool_name},
+        )
+
+    async def _iter_sse_post_request(
+        self,
+        tool_name: str,
+        url: str,
+        payload: Dict[str, Any],
+        timeouts: Optional[Tuple[Union[float, int], Union[float, int]]] = None,
+        log_raw_stream_events: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        timings = self._start_phase_timings(tool_name)
+        await self._with_valid_auth_async(
+            disallowed_methods=["user_account", AUTH_METHOD_SESSION]
+        )
+        if timings is not None:
+            timings.mark(PHASE_AUTH)
+        await self.ensure_instance_info()
+        if timings is not None:
+            timings.mark(PHASE_INSTANCE_INFO)
+
+        if timeouts is None:
+            timeouts = self._get_streaming_timeouts()
+        response = None
+        try:
+            response = await self._send_request_async(
+                "post",
+                url,
+                streaming=True,
+                json=payload,
+                timeout=self._get_async_timeout(timeouts),
+            )
+            if timings is not None:
+                timings.mark(PHASE_REQUEST)
+            self._log_usage_limit_warning(response)
+            async for event in self._sse_stream_or_last_event(
+                response,
+                log_raw_stream_events=log_raw_stream_events,
+                timings=timings,
+            ):
+                yield event
+        except httpx.ReadTimeout as e:
+            logger.error(f"Read timed out while using {tool_name}: {e}")
+            self._handle_async_request_error(
+                e, f"{tool_name} - read timeout", timeout=timeouts[1]
+            )
+        except httpx.ConnectTimeout as e:
+            logger.error(f"Connection timed out while using {tool_name}: {e}")
+            self._handle_async_request_error(
+                e, f"{tool_name} - connection timeout", timeout=timeouts[0]
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Error occurred while using {tool_name}: {e}")
+            self._handle_async_request_error(
+                e, f"{tool_name} - general error", timeout=0
+            )
+        finally:
+            if response is not None:
+                await response.aclose()
+
+    async def _iter_cached_sse_events(
+        self, cache_key: Tuple, open_stream
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        cached_events = self.instruction_cache.get(cache_key)
+        if cached_events is not None:
+            logger.debug(f"Serving cached response for {cache_key[1]}")
+            for event in copy.deepcopy(cached_events):
+                yield event
+            return
+
+        events = []
+        if not self.enable_streaming:
+            # The single event is drained and cached up front since callers stop
+            # after anext()
+            async for event in open_stream():
+                events.append(event)
+            self._store_cached_sse_events(cache_key, events)
+            for event in copy.deepcopy(events):
+                yield event
+            return
+
+        async for event in open_stream():
+            # Cached apart from the event handed out, which the caller may mutate
+            events.append(copy.deepcopy(event))
+            yield event
+        self._store_cached_sse_events(cache_key, events)
+
+    async def get_context_from_catalog(
+        self, query: str, signature: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Retrieve contextual information from the Alation catalog based on a natural language query and signature.
+        """
+        if not query:
+            raise ValueError("Query cannot be empty")
+
+        timings = self._start_phase_timings("catalog_search")
+        await self._with_valid_auth_async()
+        if timings is not None:
+            timings.mark(PHASE_AUTH)
+        await self.ensure_instance_info()
+        if timings is not None:
+            timings.mark(PHASE_INSTANCE_INFO)
+
+        params = {"question": query, "mode": "search"}
+        if signature:
+            params["signature"] = self.json_codec.dumps(signature)
+
+        encoded_params = urllib.parse.urlencode(params, quote_via=urllib.parse.quote)
+        url = f"{self.base_url}/integration/v2/context/?{encoded_params}"
+
+        try:
+            response = await self._send_request_async(
+                "get", url, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            )
+            if timings is not None:
+                timings.mark(PHASE_REQUEST)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self._handle_async_request_error(
+                e, "catalog search", timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            )
+
+        try:
+            return self._format_successful_response(response, timings)
+        except ValueError as e:
+            raise AlationAPIError(
+                message="Invalid JSON in catalog response",
+                status_code=response.status_code,
+                response_body=response.text,
+                reason="Malformed Response",
+                resolution_hint="The server returned a non-JSON response. Contact support if this persists.",
+                help_links=["https://developer.alation.com/"],
+            ) from e
+
+    async def get_data_products(
+        self, product_id: Optional[str] = None, query: Optional[str] = None
+    ) -> dict:
+        """
+        Retrieve Alation Data Products by product id or free-text search using streaming endpoints.
+        """
+        if product_id:
+            stream = self.get_data_product_spec_stream(data_product_id=product_id)
+        elif query:
+            stream = self.list_data_products_stream(search_term=query)
+        else:
+            raise ValueError(
+                "You must provide either a product_id or a query to search for data products."
+            )
+
+        try:
+            async for event in stream:
+                if isinstance(event, dict) and "content" in event:
+                    return event["content"]
+                elif isinstance(event, dict):
+                    return event
+        finally:
+            await stream.aclose()
+        return {"instructions": "No data found", "results": []}
+
+    async def get_custom_fields(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve all custom field definitions from the Alation instance.
+
+        Requires Catalog or Server admin permissions.
+        """
+        timings = self._start_phase_timings("custom_fields")
+        await self._with_valid_auth_async()
+        if timings is not None:
+            timings.mark(PHASE_AUTH)
+        await self.ensure_instance_info()
+        if timings is not None:
+            timings.mark(PHASE_INSTANCE_INFO)
+
+        url = f"{self.base_url}/integration/v2/custom_field/"
+
+        try:
+            response = await self._send_request_async(
+                "get", url, timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            )
+            if timings is not None:
+                timings.mark(PHASE_REQUEST)
+            response.raise_for_status()
+            custom_fields = self._load_response_json(response)
+            if timings is not None:
+                # The list is returned as is, so the timings only go to the callback
+                timings.mark(PHASE_DECODE)
+                self._report_phase_timings(timings)
+            return custom_fields
+        except httpx.HTTPError as e:
+            self._handle_async_request_error(
+                e, "custom fields retrieval", timeout=DEFAULT_CONNECT_TIMEOUT_IN_SECONDS
+            )
+
+    async def iter_lineage(
+        self,
+        root_node: LineageRootNode,
+        direction: LineageDirectionType,
+        limit: Optional[int] = 1000,
+        batch_size: Optional[LineageBatchSizeType] = 1000,
+        max_nodes: Optional[int] = None,
+        show_temporal_objects: Optional[bool] = False,
+        design_time: Optional[LineageDesignTimeType] = None,
+        max_depth: Optional[int] = 10,
+        excluded_schema_ids: Optional[LineageExcludedSchemaIdsType] = None,
+        allowed_otypes: Optional[LineageOTypeFilterType] = None,
+        time_from: Optional[LineageTimestampType] = None,
+        time_to: Optional[LineageTimestampType] = None,
+        chat_id: Optional[str] = None,
+        prefetch: bool = True,
+        collapse_to_otypes: Optional[LineageOTypeFilterType] = None,
+    ) -> AsyncGenerator[List[LineageResponseGraphNode], None]:
+        """
+        Async counterpart of AlationAPI.iter_lineage. The next page is fetched by a
+        task running alongside the caller.
+        """
+
+        async def fetch_page(pagination: Optional[LineagePagination]):
+            page = None
+            async for event in self.alation_lineage_stream(
+                root_node=root_node,
+                direction=direction,
+                limit=limit,
+                batch_size=batch_size,
+                pagination=pagination,
+                processing_mode=LineageGraphProcessingOptions.CHUNKED,
+                show_temporal_objects=show_temporal_objects,
+                design_time=design_time,
+                max_depth=max_depth,
+                excluded_schema_ids=excluded_schema_ids,
+                allowed_otypes=allowed_otypes,
+                time_from=time_from,
+                time_to=time_to,
+                chat_id=chat_id,
+            ):
+                page = event
+            return parse_lineage_page(page)
+
+        collapser = None
+        if collapse_to_otypes is not None:
+            collapser = LineageCollapser(collapse_to_otypes)
+        remaining = max_nodes
+        next_page = None
+        try:
+            nodes, pagination = await fetch_page(None)
+            while True:
+                if remaining is not None:
+                    nodes = nodes[:remaining]
+                    remaining -= len(nodes)
+                # An empty page ends the walk even if the server reports more
+                if not nodes or remaining == 0:
+                    pagination = None
+                if pagination is not None and prefetch:
+                    next_page = asyncio.ensure_future(fetch_page(pagination))
+                if collapser is not None:
+                    nodes = collapser.add_page(nodes)
+                    if pagination is None:
+                        nodes += collapser.flush()
+                if nodes:
+                    yield nodes
+                if pagination is None:
+                    return
+                if next_page is not None:
+                    nodes, pagination = await next_page
+                    next_page = None
+                else:
+                    nodes, pagination = await fetch_page(pagination)
+        finally:
+            if next_page is not None and not next_page.cancel():
+                # Already done: retrieve the outcome so a failure isn't logged
+                next_page.exception()
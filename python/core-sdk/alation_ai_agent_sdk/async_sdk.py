@@ -0,0 +1,174 @@
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Optional,
+    Union,
+)
+
+from alation_ai_agent_sdk.errors import AlationAPIError
+from .async_api import AsyncAlationAPI
+from .sdk import AgentSDKOptions, AlationAIAgentSDK
+
+
+class AsyncAlationAIAgentSDK(AlationAIAgentSDK):
+    """
+    asyncio flavor of AlationAIAgentSDK backed by AsyncAlationAPI.
+
+    Takes the same arguments as AlationAIAgentSDK. Every method is a coroutine and
+    tools are run through their `arun` methods. With enable_streaming, methods
+    return async generators of events instead of generators.
+
+       async with AsyncAlationAIAgentSDK(...) as sdk:
+           result = await sdk.catalog_context_search_agent("...")
+
+    Requires httpx (pip install 'alation-ai-agent-sdk[async]').
+    """
+
+    api_class = AsyncAlationAPI
+
+    def _get_transport_options(self, sdk_options: AgentSDKOptions) -> Dict[str, Any]:
+        return {"http_client": sdk_options.http_client}
+
+    async def __aenter__(self) -> "AsyncAlationAIAgentSDK":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections held by the underlying AsyncAlationAPI."""
+        await self.api.aclose()
+
+    async def get_context(
+        self,
+        question: str,
+        signature: Optional[Dict[str, Any]] = None,
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.get_context."""
+        return await self.context_tool.arun(
+            question=question, signature=signature, chat_id=chat_id
+        )
+
+    async def get_bulk_objects(
+        self, signature: Dict[str, Any], chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.get_bulk_objects."""
+        return await self.bulk_retrieval_tool.arun(signature=signature, chat_id=chat_id)
+
+    async def get_data_products(
+        self, product_id: Optional[str] = None, query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of AlationAIAgentSDK.get_data_products."""
+        return await self.data_product_tool.arun(product_id=product_id, query=query)
+
+    async def check_data_quality(
+        self,
+        table_ids: Optional[list] = None,
+        sql_query: Optional[str] = None,
+        db_uri: Optional[str] = None,
+        ds_id: Optional[int] = None,
+        bypassed_dq_sources: Optional[list] = None,
+        default_schema_name: Optional[str] = None,
+        output_format: Optional[str] = None,
+        dq_score_threshold: Optional[int] = None,
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any], str]:
+        """Async counterpart of AlationAIAgentSDK.check_data_quality."""
+        if not table_ids and not sql_query:
+            raise ValueError(
+                "At least one of 'table_ids' or 'sql_query' must be provided."
+            )
+
+        try:
+            return await self.check_data_quality_tool.arun(
+                table_ids=table_ids,
+                sql_query=sql_query,
+                db_uri=db_uri,
+                ds_id=ds_id,
+                bypassed_dq_sources=bypassed_dq_sources,
+                default_schema_name=default_schema_name,
+                output_format=output_format,
+                dq_score_threshold=dq_score_threshold,
+                chat_id=chat_id,
+            )
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
+    async def generate_data_product(self) -> Dict[str, Any]:
+        """Async counterpart of AlationAIAgentSDK.generate_data_product."""
+        return await self.generate_data_product_tool.arun()
+
+    async def get_custom_fields_definitions(
+        self, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.get_custom_fields_definitions."""
+        return await self.get_custom_fields_definitions_tool.arun(chat_id=chat_id)
+
+    async def get_data_dictionary_instructions(self) -> Dict[str, Any]:
+        """Async counterpart of AlationAIAgentSDK.get_data_dictionary_instructions."""
+        return await self.get_data_dictionary_instructions_tool.arun()
+
+    async def get_signature_creation_instructions(
+        self, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.get_signature_creation_instructions."""
+        return await self.signature_creation_tool.arun(chat_id=chat_id)
+
+    async def get_context_by_id(
+        self, signature: Dict[str, Any], chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.get_context_by_id."""
+        return await self.get_context_by_id_tool.arun(
+            signature=signature, chat_id=chat_id
+        )
+
+    async def analyze_catalog_question(
+        self, question: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.analyze_catalog_question."""
+        return await self.analyze_catalog_question_tool.arun(
+            question=question, chat_id=chat_id
+        )
+
+    async def catalog_context_search_agent(
+        self, message: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.catalog_context_search_agent."""
+        return await self.catalog_context_search_agent_tool.arun(
+            message=message, chat_id=chat_id
+        )
+
+    async def query_flow_agent(
+        self, message: str, marketplace_id: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.query_flow_agent."""
+        return await self.query_flow_agent_tool.arun(
+            message=message, marketplace_id=marketplace_id, chat_id=chat_id
+        )
+
+    async def sql_query_agent(
+        self, message: str, data_product_id: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.sql_query_agent."""
+        return await self.sql_query_agent_tool.arun(
+            message=message, data_product_id=data_product_id, chat_id=chat_id
+        )
+
+    async def get_data_sources(
+        self, limit: int = 100, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.get_data_sources."""
+        return await self.get_data_sources_tool.arun(limit=limit, chat_id=chat_id)
+
+    async def execute_custom_agent(
+        self,
+        agent_config_id: str,
+        payload: Dict[str, Any],
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of AlationAIAgentSDK.execute_custom_agent."""
+        return await self.custom_agent_tool.arun(
+            agent_config_id=agent_config_id, payload=payload, chat_id=chat_id
+        )
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir() -> str:
+    """Per-user cache directory, honoring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "alation-ai-agent-sdk")
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with a time-to-live and an LRU size bound.
+
+    Entries expire `ttl` seconds after they were stored. Once `maxsize` entries are
+    held, storing a new one evicts the least recently used entry.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Drop the entries whose key matches predicate, or every entry if no predicate
+        is given. Returns the number of entries removed.
+        """
+        with self._lock:
+            if predicate is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+
+class FileCache:
+    """
+    JSON file cache with a time-to-live, for small values that should outlive the
+    process.
+
+    Each key is stored in its own file named after the sha256 digest of the key.
+    Files are written atomically and readable only by the current user. Missing,
+    expired or unreadable entries are treated as cache misses, and failures to
+    write are logged rather than raised.
+    """
+
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _get_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored value for key, or default if missing or expired."""
+        try:
+            with open(self._get_path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return default
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return default
+        stored_at = entry.get("stored_at")
+        if not isinstance(stored_at, (int, float)):
+            return default
+        if not 0 <= time.time() - stored_at < self.ttl:
+            return default
+        return entry.get("value", default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON serializable value for key."""
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "stored_at": time.time(), "value": value}, f)
+            os.replace(tmp_path, self._get_path(key))
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write cache entry to {self.directory}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
@@ -1,19 +1,65 @@
+import atexit
 import datetime
+import inspect
 import logging
+import queue
+import random
 import time
 import threading
-from typing import Any, Dict, Optional, Callable, Union
+import weakref
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
 from functools import wraps
 from alation_ai_agent_sdk.utils import SDK_VERSION
 
 from .api import AlationAPI
+from .metrics import (
+    TOOL_CALLS,
+    TOOL_DURATION,
+    TOOL_IN_FLIGHT,
+    TOOL_RESPONSE_SIZE,
+    TOOL_TIME_TO_FIRST_EVENT,
+)
+from .response_stats import (
+    ResponseStats,
+    estimate_output_size,
+    install_response_stats,
+    reset_response_stats,
+)
+from .tracing import end_span, start_span, use_span
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EVENT_QUEUE_MAXSIZE = 1000
+DEFAULT_EVENT_BATCH_SIZE = 50
+# How long the atexit hook waits for queued events to be sent
+DEFAULT_EVENT_QUEUE_SHUTDOWN_TIMEOUT_IN_SECONDS = 5.0
+# What happens when events arrive faster than they can be sent:
+# "drop" queues everything until the queue is full, then drops new events.
+# "sample" keeps only a sample_rate share of new events once the queue is half full.
+EVENT_OVERFLOW_DROP = "drop"
+EVENT_OVERFLOW_SAMPLE = "sample"
+DEFAULT_EVENT_SAMPLE_RATE = 0.1
+
 
 class ToolEvent:
-    """Represents a tool event."""
+    """
+    Represents a tool event.
+
+    Only scalar metrics are kept: the size of `output` is measured when the event
+    is created and the output itself is not retained, so large results aren't held
+    in memory while the event waits to be sent.
+    """
 
     def __init__(
         self,
@@ -26,16 +72,33 @@ class ToolEvent:
         error: Optional[Union[str, dict]] = None,
         custom_metrics: Optional[Dict[str, Any]] = None,
         timestamp: Optional[datetime.datetime] = None,
+        response_bytes: Optional[int] = None,
+        time_to_first_event_ms: Optional[float] = None,
+        event_count: Optional[int] = None,
+        early_terminated: Optional[bool] = None,
     ):
         self.tool_name = tool_name
         self.tool_version = tool_version
         self.input_params = input_params
-        self.output = output
         self.duration_ms = duration_ms
         self.success = success
         self.error = error
         self.custom_metrics = custom_metrics or {}
         self.timestamp = timestamp or datetime.datetime.now(datetime.timezone.utc)
+        # Bytes of response bodies read by the tool, when known
+        self.response_bytes = response_bytes
+        # Only set for streamed results. duration_ms then covers the whole stream.
+        self.time_to_first_event_ms = time_to_first_event_ms
+        self.event_count = event_count
+        self.early_terminated = early_terminated
+        # Streamed events were all delivered, so the stream size is what counts
+        if self.is_stream() and response_bytes is not None:
+            self.output_size = response_bytes
+        else:
+            self.output_size = estimate_output_size(output)
+
+    def is_stream(self) -> bool:
+        return self.event_count is not None
 
     def to_payload(self) -> Dict[str, Any]:
         """
@@ -43,8 +106,9 @@ class ToolEvent:
 
         tool_name       ->  tool_name
         input_params    ->  tool_metadata
-        output          ->  context_char_count
+        output          ->  context_char_count (estimated, response_bytes for streams)
         duration_ms     ->  request_duration_ms
+        stream metrics  ->  tool_metadata
         success         ->  status_code
         error           ->  status_code & error_message
         custom_metrics  ->  tool_metadata
@@ -54,7 +118,7 @@ class ToolEvent:
             "tool_name": self.tool_name,
             "tool_version": self.tool_version,
             "tool_metadata": self.get_tool_metadata(),
-            "context_char_count": len(str(self.output)),
+            "context_char_count": self.output_size,
             "request_duration_ms": int(self.duration_ms),
             "status_code": self.get_status_code(),
             "error_message": self.get_error_message(),
@@ -74,6 +138,15 @@ class ToolEvent:
         kwargs = self.input_params.get("kwargs", {})
         tool_metadata.update(kwargs)
         tool_metadata.update(self.custom_metrics)
+        if self.response_bytes is not None:
+            tool_metadata["response_bytes"] = self.response_bytes
+        if self.is_stream():
+            tool_metadata["event_count"] = self.event_count
+            tool_metadata["early_terminated"] = self.early_terminated
+            if self.time_to_first_event_ms is not None:
+                tool_metadata["time_to_first_event_ms"] = int(
+                    self.time_to_first_event_ms
+                )
         return tool_metadata
 
     def get_status_code(self) -> int:
@@ -119,6 +192,222 @@ def send_event(
         logger.warning(f"Unexpected error sending event: {e}")
 
 
+def send_events(
+    api: AlationAPI,
+    events: List[ToolEvent],
+    timeout: float = 5.0,
+    max_retries: int = 2,
+    headers: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Sends a batch of tool events to the Alation API. Returns how many were accepted.
+    """
+    try:
+        payloads = [event.to_payload() for event in events]
+        return api.post_tool_events(
+            payloads, timeout=timeout, max_retries=max_retries, extra_headers=headers
+        )
+    except Exception as e:
+        # Failure to send events should be non-blocking
+        logger.warning(f"Unexpected error sending events: {e}")
+        return 0
+
+
+class _QueuedEvent(NamedTuple):
+    api: AlationAPI
+    event: ToolEvent
+    timeout: float
+    max_retries: int
+    headers: Optional[Dict[str, str]]
+
+
+# Tells the worker to exit once the events queued before it are sent
+_STOP = object()
+
+
+class EventQueue:
+    """
+    Bounded queue of tool events drained by a single background worker thread.
+
+    Recording an event never blocks: when the queue can't take it the event is
+    dropped (or sampled out, see EVENT_OVERFLOW_SAMPLE) and counted in stats().
+    The worker takes every event waiting in the queue, up to batch_size, validates
+    auth once per client and posts them over the client's pooled session.
+
+    The worker starts with the first event. A process-wide queue is shared by all
+    tools (see get_event_queue) and flushed at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_EVENT_QUEUE_MAXSIZE,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+        overflow: str = EVENT_OVERFLOW_DROP,
+        sample_rate: float = DEFAULT_EVENT_SAMPLE_RATE,
+    ):
+        if overflow not in (EVENT_OVERFLOW_DROP, EVENT_OVERFLOW_SAMPLE):
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}. Use 'drop' or 'sample'."
+            )
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.sample_rate = sample_rate
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._counts = {
+            "enqueued": 0,
+            "sent": 0,
+            "failed": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+        }
+
+    def submit(
+        self,
+        api: AlationAPI,
+        event: ToolEvent,
+        timeout: float = 5.0,
+        max_retries: int = 2,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Queue an event for sending. Returns False if it was dropped."""
+        if self._closed:
+            self._count("dropped")
+            return False
+        if (
+            self.overflow == EVENT_OVERFLOW_SAMPLE
+            and self._queue.qsize() * 2 >= self.maxsize
+            and random.random() >= self.sample_rate
+        ):
+            self._count("sampled_out")
+            return False
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(
+                _QueuedEvent(api, event, timeout, max_retries, headers)
+            )
+        except queue.Full:
+            dropped = self._count("dropped")
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(
+                    f"Telemetry queue is full. {dropped} tool events dropped so far."
+                )
+            return False
+        self._count("enqueued")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Counters of the events handled so far and the number still queued."""
+        with self._lock:
+            stats = dict(self._counts)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event was handled. Returns False on timeout."""
+        if self._worker is None:
+            return True
+        all_tasks_done = self._queue.all_tasks_done
+        with all_tasks_done:
+            return all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def close(
+        self, timeout: Optional[float] = DEFAULT_EVENT_QUEUE_SHUTDOWN_TIMEOUT_IN_SECONDS
+    ) -> None:
+        """Send the queued events and stop the worker. Later events are dropped."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Telemetry queue did not drain before shutdown.")
+            return
+        worker.join(timeout)
+
+    def _count(self, name: str) -> int:
+        with self._lock:
+            self._counts[name] += 1
+            return self._counts[name]
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is None and not self._closed:
+                worker = threading.Thread(
+                    target=self._run, name="alation-telemetry", daemon=True
+                )
+                worker.start()
+                self._worker = worker
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in batch)
+            try:
+                self._send_batch([item for item in batch if item is not _STOP])
+            except Exception as e:
+                logger.warning(f"Unexpected error sending tool events: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _send_batch(self, batch: List[_QueuedEvent]) -> None:
+        # Events of the same client and settings share one auth check
+        groups: Dict[Any, List[_QueuedEvent]] = {}
+        for item in batch:
+            key = (
+                id(item.api),
+                item.timeout,
+                item.max_retries,
+                tuple(sorted((item.headers or {}).items())),
+            )
+            groups.setdefault(key, []).append(item)
+        for items in groups.values():
+            first = items[0]
+            sent = send_events(
+                first.api,
+                [item.event for item in items],
+                timeout=first.timeout,
+                max_retries=first.max_retries,
+                headers=first.headers,
+            )
+            with self._lock:
+                self._counts["sent"] += sent
+                self._counts["failed"] += len(items) - sent
+
+
+_event_queue: Optional[EventQueue] = None
+_event_queue_lock = threading.Lock()
+
+
+def get_event_queue() -> EventQueue:
+    """Return the process-wide event queue, creating it on first use."""
+    global _event_queue
+    if _event_queue is None:
+        with _event_queue_lock:
+            if _event_queue is None:
+                _event_queue = EventQueue()
+                atexit.register(_event_queue.close)
+    return _event_queue
+
+
 def track_tool_execution(
     custom_metrics_fn: Optional[Callable[[Any, Any, float], Dict[str, Any]]] = None,
     timeout: float = 5.0,
@@ -126,7 +415,8 @@ def track_tool_execution(
     headers: Optional[Dict[str, str]] = None,
 ):
     """
-    Decorator to send tool execution events. Used for synchronous tool execution.
+    Decorator to send tool execution events. Works for both synchronous and async
+    (coroutine) tool methods.
 
     Args:
         custom_metrics_fn: Optional function that takes (input_params, output, duration_ms)
@@ -157,6 +447,69 @@ def track_tool_execution(
     """
 
     def decorator(func):
+        telemetry_options = {
+            "custom_metrics_fn": custom_metrics_fn,
+            "timeout": timeout,
+            "max_retries": max_retries,
+            "headers": headers,
+        }
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                api = getattr(self, "api", None)
+                if not api or not isinstance(api, AlationAPI):
+                    return await func(self, *args, **kwargs)
+
+                input_params = _get_input_params(args, kwargs)
+                TOOL_IN_FLIGHT.inc(tool=self.__class__.__name__)
+                start_time = time.time()
+                success = True
+                output = None
+                stats = ResponseStats()
+                streaming = False
+                span = _start_tool_span(self)
+
+                try:
+                    token = install_response_stats(stats)
+                    try:
+                        with use_span(span):
+                            output = await func(self, *args, **kwargs)
+                    finally:
+                        reset_response_stats(token)
+                    if inspect.isasyncgen(output):
+                        # Recorded when the stream finishes or is closed
+                        streaming = True
+                        tracker = _StreamTracker(
+                            self,
+                            stats,
+                            input_params,
+                            start_time,
+                            telemetry_options,
+                            span,
+                        )
+                        output = tracker.watch(_track_async_stream(output, tracker))
+                    return output
+                except Exception as e:
+                    success = False
+                    output = {"error": str(e)}
+                    raise
+                finally:
+                    if not streaming:
+                        _record_tool_execution(
+                            self,
+                            input_params,
+                            output,
+                            start_time,
+                            success,
+                            response_bytes=stats.bytes_read,
+                            span=span,
+                            **telemetry_options,
+                        )
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
             # Get the API instance from the tool
@@ -166,88 +519,299 @@ def track_tool_execution(
                 return func(self, *args, **kwargs)
 
             # Capture input parameters
-            input_params = {}
-            if args:
-                input_params["args"] = args
-            if kwargs:
-                input_params["kwargs"] = kwargs
+            input_params = _get_input_params(args, kwargs)
+            TOOL_IN_FLIGHT.inc(tool=self.__class__.__name__)
 
             start_time = time.time()
             success = True
-            error = None
             output = None
+            # Collects the size of the responses read by the tool
+            stats = ResponseStats()
+            streaming = False
+            # None unless OpenTelemetry is installed
+            span = _start_tool_span(self)
 
             try:
-                output = func(self, *args, **kwargs)
+                token = install_response_stats(stats)
+                try:
+                    with use_span(span):
+                        output = func(self, *args, **kwargs)
+                finally:
+                    reset_response_stats(token)
+                if inspect.isgenerator(output):
+                    # Recorded when the stream finishes or is closed
+                    streaming = True
+                    tracker = _StreamTracker(
+                        self, stats, input_params, start_time, telemetry_options, span
+                    )
+                    output = tracker.watch(_track_stream(output, tracker))
                 return output
             except Exception as e:
                 success = False
                 output = {"error": str(e)}
                 raise
             finally:
-                # Capture the duration
-                duration_ms = (time.time() - start_time) * 1000
+                if not streaming:
+                    _record_tool_execution(
+                        self,
+                        input_params,
+                        output,
+                        start_time,
+                        success,
+                        response_bytes=stats.bytes_read,
+                        span=span,
+                        **telemetry_options,
+                    )
 
-                # Capture error from the response output
-                if output and isinstance(output, dict) and "error" in output:
-                    error = output["error"]
+        return wrapper
 
-                # Capture tool version as dist_version/sdk_version
-                tool_version = f"sdk-{SDK_VERSION}"
-                api = getattr(self, "api", None)
-                if (
-                    api
-                    and isinstance(api, AlationAPI)
-                    and hasattr(api, "dist_version")
-                    and api.dist_version
-                ):
-                    tool_version = f"{api.dist_version}/{tool_version}"
-
-                # Get custom metrics if function provided
-                custom_metrics = {}
-                if custom_metrics_fn:
-                    try:
-                        custom_metrics = custom_metrics_fn(
-                            input_params, output, duration_ms
-                        )
-                    except Exception as e:
-                        logger.warning(f"Error getting custom metrics: {e}")
-
-                # Create an event
-                event = ToolEvent(
-                    tool_name=self.__class__.__name__,
-                    tool_version=tool_version,
-                    input_params=input_params,
-                    output=output,
-                    duration_ms=duration_ms,
-                    success=success,
-                    error=error,
-                    custom_metrics=custom_metrics,
-                )
+    return decorator
 
-                try:
 
-                    def send_in_background():
-                        send_event(
-                            api,
-                            event,
-                            timeout=timeout,
-                            max_retries=max_retries,
-                            headers=headers,
-                        )
+def _start_tool_span(tool: Any) -> Optional[Any]:
+    tool_name = tool.__class__.__name__
+    return start_span(
+        f"alation.tool {tool_name}", attributes={"alation.tool.name": tool_name}
+    )
 
-                    # DESIGN DECISION: Uses threading.Timer to send events in background threads.
-                    # This spawns a new thread per event, which is intentionally simple and acceptable
-                    # for the expected low-to-moderate frequency of tool invocations in AI agent workflows.
-                    # For high-frequency scenarios, users should implement custom event handling.
-                    # Async alternatives were considered but don't provide significant benefits without
-                    # a full async refactor of the SDK.
-                    timer = threading.Timer(0.0, send_in_background)
-                    timer.daemon = True
-                    timer.start()
-                except Exception as e:
-                    logger.debug(f"Could not send telemetry event: {e}")
 
-        return wrapper
+def _track_stream(
+    stream: Generator[Any, None, None], tracker: "_StreamTracker"
+) -> Generator[Any, None, None]:
+    """
+    Pass the events of a streamed tool result through, then record the tool event
+    with the stream timings once the stream is exhausted, fails or is closed.
+    The tool's span stays open until then.
+    """
+    stats = tracker.stats
+    span = tracker.span
+    try:
+        while True:
+            token = install_response_stats(stats)
+            try:
+                with use_span(span):
+                    event = next(stream)
+            except StopIteration:
+                break
+            finally:
+                reset_response_stats(token)
+            tracker.add(event)
+            yield event
+        tracker.completed = True
+    except Exception as e:
+        tracker.fail(e)
+        raise
+    finally:
+        # Releases the HTTP response when the consumer stopped early
+        stream.close()
+        tracker.record()
+
+
+async def _track_async_stream(
+    stream: AsyncGenerator[Any, None], tracker: "_StreamTracker"
+) -> AsyncGenerator[Any, None]:
+    """Async counterpart of _track_stream."""
+    stats = tracker.stats
+    span = tracker.span
+    try:
+        while True:
+            token = install_response_stats(stats)
+            try:
+                with use_span(span):
+                    event = await stream.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                reset_response_stats(token)
+            tracker.add(event)
+            yield event
+        tracker.completed = True
+    except Exception as e:
+        tracker.fail(e)
+        raise
+    finally:
+        await stream.aclose()
+        tracker.record()
 
-    return decorator
+
+class _StreamTracker:
+    """Timings and counts of a streamed tool result, recorded once."""
+
+    def __init__(
+        self,
+        tool: Any,
+        stats: ResponseStats,
+        input_params: Dict[str, Any],
+        start_time: float,
+        telemetry_options: Dict[str, Any],
+        span: Optional[Any] = None,
+    ):
+        self.tool = tool
+        self.stats = stats
+        self.input_params = input_params
+        self.start_time = start_time
+        self.telemetry_options = telemetry_options
+        self.span = span
+        self.first_event_at: Optional[float] = None
+        self.event_count = 0
+        self.last_event: Any = None
+        self.success = True
+        self.completed = False
+        self.recorded = False
+
+    def watch(self, stream: Any) -> Any:
+        """
+        Also record the tool event when `stream` is dropped, or closed, before its
+        first next(). Its generator body never runs then, so the in-flight gauge,
+        the span and the event would otherwise be left hanging.
+        """
+        finalizer = weakref.finalize(stream, self.record)
+        finalizer.atexit = False
+        return stream
+
+    def add(self, event: Any) -> None:
+        if self.first_event_at is None:
+            self.first_event_at = time.time()
+        self.event_count += 1
+        self.last_event = event
+
+    def fail(self, error: Exception) -> None:
+        self.success = False
+        self.completed = True
+        self.last_event = {"error": str(error)}
+
+    def record(self) -> None:
+        if self.recorded:
+            return
+        self.recorded = True
+        time_to_first_event_ms = None
+        if self.first_event_at is not None:
+            time_to_first_event_ms = (self.first_event_at - self.start_time) * 1000
+        _record_tool_execution(
+            self.tool,
+            self.input_params,
+            self.last_event,
+            self.start_time,
+            self.success,
+            response_bytes=self.stats.bytes_read,
+            time_to_first_event_ms=time_to_first_event_ms,
+            event_count=self.event_count,
+            early_terminated=not self.completed,
+            span=self.span,
+            **self.telemetry_options,
+        )
+
+
+def _get_input_params(args: tuple, kwargs: dict) -> Dict[str, Any]:
+    input_params = {}
+    if args:
+        input_params["args"] = args
+    if kwargs:
+        input_params["kwargs"] = kwargs
+    return input_params
+
+
+def _record_tool_execution(
+    tool: Any,
+    input_params: Dict[str, Any],
+    output: Any,
+    start_time: float,
+    success: bool,
+    custom_metrics_fn: Optional[Callable[[Any, Any, float], Dict[str, Any]]] = None,
+    timeout: float = 5.0,
+    max_retries: int = 2,
+    headers: Optional[Dict[str, str]] = None,
+    response_bytes: Optional[int] = None,
+    time_to_first_event_ms: Optional[float] = None,
+    event_count: Optional[int] = None,
+    early_terminated: Optional[bool] = None,
+    span: Optional[Any] = None,
+) -> None:
+    """
+    Build the ToolEvent for a finished tool run and queue it for sending, and end
+    the tool's span.
+
+    For streamed results `output` is the last event and the duration covers the
+    whole stream.
+    """
+    # Capture the duration
+    duration_ms = (time.time() - start_time) * 1000
+
+    # Capture error from the response output
+    error = None
+    if output and isinstance(output, dict) and "error" in output:
+        error = output["error"]
+
+    _observe_tool_metrics(
+        tool.__class__.__name__,
+        duration_ms,
+        success and error is None,
+        response_bytes,
+        time_to_first_event_ms,
+    )
+    end_span(span, error)
+
+    # Capture tool version as dist_version/sdk_version
+    tool_version = f"sdk-{SDK_VERSION}"
+    api = getattr(tool, "api", None)
+    if (
+        api
+        and isinstance(api, AlationAPI)
+        and hasattr(api, "dist_version")
+        and api.dist_version
+    ):
+        tool_version = f"{api.dist_version}/{tool_version}"
+
+    # Get custom metrics if function provided
+    custom_metrics = {}
+    if custom_metrics_fn:
+        try:
+            custom_metrics = custom_metrics_fn(input_params, output, duration_ms)
+        except Exception as e:
+            logger.warning(f"Error getting custom metrics: {e}")
+
+    # Create an event
+    event = ToolEvent(
+        tool_name=tool.__class__.__name__,
+        tool_version=tool_version,
+        input_params=input_params,
+        output=output,
+        duration_ms=duration_ms,
+        success=success,
+        error=error,
+        custom_metrics=custom_metrics,
+        response_bytes=response_bytes or None,
+        time_to_first_event_ms=time_to_first_event_ms,
+        event_count=event_count,
+        early_terminated=early_terminated,
+    )
+
+    try:
+        # Sent by the shared background worker so telemetry never blocks the tool,
+        # including async tools running on an event loop.
+        get_event_queue().submit(
+            api,
+            event,
+            timeout=timeout,
+            max_retries=max_retries,
+            headers=headers,
+        )
+    except Exception as e:
+        logger.debug(f"Could not send telemetry event: {e}")
+
+
+def _observe_tool_metrics(
+    tool_name: str,
+    duration_ms: float,
+    success: bool,
+    response_bytes: Optional[int],
+    time_to_first_event_ms: Optional[float],
+) -> None:
+    """Record a finished tool call in the in-process metrics."""
+    TOOL_IN_FLIGHT.dec(tool=tool_name)
+    TOOL_DURATION.observe(duration_ms / 1000, tool=tool_name)
+    TOOL_CALLS.inc(tool=tool_name, status="success" if success else "error")
+    if response_bytes:
+        TOOL_RESPONSE_SIZE.observe(response_bytes, tool=tool_name)
+    if time_to_first_event_ms is not None:
+        TOOL_TIME_TO_FIRST_EVENT.observe(time_to_first_event_ms / 1000, tool=tool_name)
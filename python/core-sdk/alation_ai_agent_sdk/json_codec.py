@@ -0,0 +1,123 @@
+"""
+JSON codecs used on the hot paths of the SDK: decoding SSE events and responses,
+and encoding request bodies.
+
+orjson and msgspec are several times faster than the standard library on the large
+payloads returned by bulk retrieval and lineage. Both are optional; the standard
+library is used when neither is installed.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+JSON_CODEC_AUTO = "auto"
+JSON_CODEC_STDLIB = "json"
+JSON_CODEC_ORJSON = "orjson"
+JSON_CODEC_MSGSPEC = "msgspec"
+
+JSONInput = Union[bytes, bytearray, str]
+
+
+class JSONCodec:
+    """
+    Codec backed by the standard library json module.
+
+    Other codecs follow the same contract: loads() raises json.JSONDecodeError (a
+    ValueError) on malformed input and dumps()/dumpb() raise TypeError for values
+    that can't be serialized. Output is compact.
+    """
+
+    name = JSON_CODEC_STDLIB
+
+    def loads(self, data: JSONInput) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    name = JSON_CODEC_ORJSON
+
+    def loads(self, data: JSONInput) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumpb(obj).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        # Non-string keys are converted like the standard library does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecCodec(JSONCodec):
+    name = JSON_CODEC_MSGSPEC
+
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumpb(obj).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        return msgspec.json.encode(obj)
+
+
+def get_json_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolve a JSON codec.
+
+    Args:
+        codec: A JSONCodec instance, or one of "auto" (the default: orjson, then
+            msgspec, then the standard library, whichever is installed first),
+            "orjson", "msgspec" or "json".
+
+    Raises:
+        ImportError: If the requested library is not installed.
+        ValueError: If the codec name is unknown.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = codec or JSON_CODEC_AUTO
+    if name == JSON_CODEC_AUTO:
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JSONCodec()
+    if name == JSON_CODEC_ORJSON:
+        if orjson is None:
+            raise ImportError(
+                "The orjson codec requires orjson. Install it with: pip install 'alation-ai-agent-sdk[fast-json]'"
+            )
+        return OrjsonCodec()
+    if name == JSON_CODEC_MSGSPEC:
+        if msgspec is None:
+            raise ImportError(
+                "The msgspec codec requires msgspec. Install it with: pip install msgspec"
+            )
+        return MsgspecCodec()
+    if name == JSON_CODEC_STDLIB:
+        return JSONCodec()
+    raise ValueError(
+        f"Unknown JSON codec {name!r}. Use 'auto', 'orjson', 'msgspec' or 'json'."
+    )
@@ -1,6 +1,8 @@
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import TypedDict
 
+from alation_ai_agent_sdk.errors import AlationAPIError
+
 
 class LineageDesignTimeOptions:
     ONLY_DESIGN_TIME = 1
@@ -131,3 +133,43 @@ def make_lineage_kwargs(
         "time_to": time_to,
         "key_type": key_type,
     }
+
+
+def parse_lineage_page(
+    page: Optional[Dict[str, Any]],
+) -> Tuple[List[LineageResponseGraphNode], Optional[LineagePagination]]:
+    """
+    Split a lineage tool response into its nodes and the pagination to request the
+    next page with, which is None on the last page.
+    """
+    if not isinstance(page, dict) or not isinstance(page.get("graph"), list):
+        raise AlationAPIError(
+            "Unexpected lineage response",
+            reason="Lineage Response Error",
+            resolution_hint="The lineage response did not contain a graph.",
+            response_body=page,
+        )
+    pagination = page.get("pagination")
+    if not pagination or not pagination.get("has_more"):
+        pagination = None
+    return page["graph"], pagination
+
+
+def validate_lineage_collapse(
+    processing_mode: Optional[LineageGraphProcessingType],
+    pagination: Optional[LineagePagination],
+) -> None:
+    """
+    Reject collapsing a single page of a chunked lineage graph. An omitted node
+    whose neighbors are on another page would become a dead end, silently dropping
+    the edges through it. iter_lineage collapses across pages instead.
+    """
+    if processing_mode == LineageGraphProcessingOptions.CHUNKED or pagination:
+        raise AlationAPIError(
+            "collapse_to_otypes requires the complete processing mode",
+            reason="Invalid Lineage Parameters",
+            resolution_hint=(
+                "Call again without processing_mode and pagination to collapse the "
+                "whole graph, or without collapse_to_otypes to page through it."
+            ),
+        )
@@ -1,6 +1,8 @@
 from typing import List, Dict, Set, Union
 from typing_extensions import TypedDict
 
+from .lineage_graph import LineageGraph
+
 OType = str
 
 
@@ -142,6 +144,9 @@ def filter_graph(nodes: List[Dict], allowed_types: Set[str]) -> List[Dict]:
     Filters the graph to only include nodes of allowed types and their descendants.
     Maintains hierarchical relationships between nodes even when omitting some.
 
+    Runs on a LineageGraph, without recursion, and leaves `nodes` unchanged.
+    A neighbor reachable along several paths is listed once.
+
     Args:
         nodes (List[Dict]): The list of nodes to filter.
         allowed_types (Set[str]): A set of allowed node types.
@@ -149,23 +154,7 @@ def filter_graph(nodes: List[Dict], allowed_types: Set[str]) -> List[Dict]:
     Returns:
         List[Dict]: The filtered list of nodes.
     """
-    ordered_keys, key_to_node, visited = get_initial_graph_state(nodes)
-
-    # Populate the visited nodes and patch up neighbors to account for any that were omitted
-    for node in nodes:
-        resolve_neighbors(
-            get_node_object_key(node), key_to_node, visited, allowed_types
-        )
-    kept_keys = {
-        node_key
-        for node_key in visited
-        if key_to_node[node_key]["otype"] in allowed_types
-    }
-    # Free the memory before we build the filtered graph
-    visited = {}
-
-    new_nodes = build_filtered_graph(ordered_keys, kept_keys, key_to_node)
-    return new_nodes
+    return LineageGraph(nodes).collapse_to_otypes(allowed_types)
 
 
 def build_filtered_graph(
@@ -0,0 +1,375 @@
+"""
+Compact lineage graph for large lineage responses.
+
+Nodes are interned to consecutive integers the first time they are seen and their
+edges are stored in flat arrays, CSR style: the neighbors of node `n` are
+`targets[row_start[n]:row_end[n]]`. Rows are appended as pages arrive, so adding a
+page only builds the rows of its nodes. Traversals use an explicit stack, so deep
+graphs don't hit the recursion limit, and the node dicts of the response are
+referenced rather than copied.
+"""
+
+from array import array
+from collections import deque
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple
+
+# What collapsing does with a node, by otype
+_KEEP = 0
+_OMIT = 1
+# Nodes without an otype are dropped along with everything only reachable through them
+_DROP = 2
+
+
+class LineageGraph:
+    """
+    Lineage graph built from the `graph` lists of lineage responses.
+
+    The data of a node is its top level entry in the response, or the first
+    neighbor entry seen for it when it has none. Its edges are the neighbors listed
+    in that entry. Call add_nodes() once per page.
+    """
+
+    __slots__ = (
+        "_index",
+        "_data",
+        "_otypes",
+        "_otype_names",
+        "_otype_index",
+        "_roots",
+        "_listed",
+        "_row_start",
+        "_row_end",
+        "_targets",
+        "_changed",
+    )
+
+    def __init__(self, nodes: Optional[Iterable[Dict[str, Any]]] = None):
+        # Integer node ids by otype number, then by the id of the object in Alation
+        self._index: List[Dict[Any, int]] = []
+        self._data: List[Dict[str, Any]] = []
+        self._otypes = array("i")
+        self._otype_names: List[Optional[str]] = []
+        self._otype_index: Dict[Optional[str], int] = {}
+        self._roots = array("i")
+        # 1 for nodes that have a top level entry
+        self._listed = bytearray()
+        self._row_start = array("q")
+        self._row_end = array("q")
+        self._targets = array("i")
+        # Nodes whose row is missing or out of date
+        self._changed: Dict[int, None] = {}
+        if nodes is not None:
+            self.add_nodes(nodes)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def add_nodes(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        """Add the top level nodes of a response, in order."""
+        nodes = list(nodes)
+        # Top level entries take precedence over neighbor entries of the same node
+        for node in nodes:
+            node_id = self._intern(node)
+            if self._data[node_id] is not node:
+                self._data[node_id] = node
+                self._changed[node_id] = None
+            self._listed[node_id] = 1
+            self._roots.append(node_id)
+        for node in nodes:
+            stack = list(reversed(node.get("neighbors") or ()))
+            while stack:
+                neighbor = stack.pop()
+                node_count = len(self._data)
+                self._intern(neighbor)
+                if len(self._data) > node_count:
+                    stack.extend(reversed(neighbor.get("neighbors") or ()))
+
+    def node_id(self, otype: str, id: Any) -> Optional[int]:
+        """The integer id of a node, or None when it isn't in the graph."""
+        otype_number = self._otype_index.get(otype)
+        if otype_number is None:
+            return None
+        return self._index[otype_number].get(id)
+
+    def data(self, node_id: int) -> Dict[str, Any]:
+        return self._data[node_id]
+
+    def otype(self, node_id: int) -> Optional[str]:
+        return self._otype_names[self._otypes[node_id]]
+
+    def is_listed(self, node_id: int) -> bool:
+        """Whether the node has a top level entry, rather than only neighbor entries."""
+        return bool(self._listed[node_id])
+
+    @property
+    def roots(self) -> array:
+        """Ids of the top level nodes, in response order."""
+        return self._roots
+
+    def neighbors(self, node_id: int) -> array:
+        row_start, row_end, targets = self._get_adjacency()
+        return targets[row_start[node_id] : row_end[node_id]]
+
+    def walk(
+        self, start: int, max_depth: Optional[int] = None
+    ) -> Generator[Tuple[int, int], None, None]:
+        """
+        Breadth first walk from `start`, yielding (node id, depth) once per node
+        reached, `start` included at depth 0.
+        """
+        row_start, row_end, targets = self._get_adjacency()
+        seen = bytearray(len(self._data))
+        seen[start] = 1
+        queue = deque([(start, 0)])
+        while queue:
+            node_id, depth = queue.popleft()
+            yield node_id, depth
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for target in targets[row_start[node_id] : row_end[node_id]]:
+                if not seen[target]:
+                    seen[target] = 1
+                    queue.append((target, depth + 1))
+
+    def collapse_to_otypes(self, allowed_otypes: Iterable[str]) -> List[Dict]:
+        """
+        Keep the top level nodes of the allowed otypes. The neighbors of a kept
+        node are its allowed neighbors, with every other neighbor replaced by its
+        own allowed neighbors, recursively. Neighbors are listed once, in the
+        order they are first reached, without their `neighbors` key.
+        """
+        collapser = LineageCollapser(allowed_otypes, graph=self)
+        return collapser.flush()
+
+    def _intern(self, node: Dict[str, Any]) -> int:
+        otype = node["otype"]
+        otype_number = self._otype_index.get(otype)
+        if otype_number is None:
+            otype_number = self._otype_index[otype] = len(self._otype_names)
+            self._otype_names.append(otype)
+            self._index.append({})
+        ids = self._index[otype_number]
+        node_id = ids.get(node["id"])
+        if node_id is None:
+            node_id = ids[node["id"]] = len(self._data)
+            self._data.append(node)
+            self._otypes.append(otype_number)
+            self._listed.append(0)
+            self._changed[node_id] = None
+        return node_id
+
+    def _get_adjacency(self) -> Tuple[array, array, array]:
+        if self._changed:
+            index = self._index
+            otype_index = self._otype_index
+            row_start, row_end, targets = self._row_start, self._row_end, self._targets
+            missing = len(self._data) - len(row_start)
+            row_start.extend([0] * missing)
+            row_end.extend([0] * missing)
+            # Rows are appended; the replaced row of a node that got a top level
+            # entry stays behind unused, and is usually empty.
+            for node_id in self._changed:
+                row_start[node_id] = len(targets)
+                for neighbor in self._data[node_id].get("neighbors") or ():
+                    ids = index[otype_index[neighbor["otype"]]]
+                    targets.append(ids[neighbor["id"]])
+                row_end[node_id] = len(targets)
+            self._changed = {}
+        return self._row_start, self._row_end, self._targets
+
+
+class LineageCollapser:
+    """
+    Collapses a lineage graph to the allowed otypes page by page, as
+    LineageGraph.collapse_to_otypes does for a whole graph.
+
+    add_page() returns the kept nodes whose neighbors are final: every omitted node
+    they reach has a top level entry in the pages seen so far. The other kept
+    nodes wait for later pages. flush() returns them, treating omitted nodes that
+    never got a top level entry as dead ends.
+    """
+
+    def __init__(
+        self, allowed_otypes: Iterable[str], graph: Optional[LineageGraph] = None
+    ):
+        self.allowed_otypes: Set[str] = set(allowed_otypes)
+        self.graph = graph if graph is not None else LineageGraph()
+        self._otype_kinds: List[int] = []
+        self._kinds = bytearray()
+        # Kept nodes reachable from each omitted node, once final
+        self._expansions: Dict[int, array] = {}
+        # Omitted nodes whose reachable omitted nodes all have top level entries
+        self._final: Set[int] = set()
+        # Neighbor entries handed out so far, shared between kept nodes
+        self._neighbor_entries: Dict[int, Dict[str, Any]] = {}
+        self._pending: List[int] = list(self.graph.roots)
+
+    def add_page(self, nodes: Iterable[Dict[str, Any]]) -> List[Dict]:
+        graph = self.graph
+        root_count = len(graph.roots)
+        graph.add_nodes(nodes)
+        self._pending.extend(graph.roots[root_count:])
+        kinds = self._get_kinds()
+        ready = []
+        pending = []
+        for root in self._pending:
+            if kinds[root] != _KEEP:
+                continue
+            if self._is_final(root, kinds):
+                ready.append(root)
+            else:
+                pending.append(root)
+        self._pending = pending
+        return self._collapse(ready, kinds)
+
+    def flush(self) -> List[Dict]:
+        kinds = self._get_kinds()
+        roots = [root for root in self._pending if kinds[root] == _KEEP]
+        self._pending = []
+        return self._collapse(roots, kinds)
+
+    def _get_kinds(self) -> bytearray:
+        graph = self.graph
+        for otype in graph._otype_names[len(self._otype_kinds) :]:
+            if otype is None:
+                self._otype_kinds.append(_DROP)
+            elif otype in self.allowed_otypes:
+                self._otype_kinds.append(_KEEP)
+            else:
+                self._otype_kinds.append(_OMIT)
+        otype_kinds = self._otype_kinds
+        self._kinds.extend(
+            otype_kinds[otype] for otype in graph._otypes[len(self._kinds) :]
+        )
+        return self._kinds
+
+    def _is_final(self, root: int, kinds: bytearray) -> bool:
+        row_start, row_end, targets = self.graph._get_adjacency()
+        listed = self.graph._listed
+        final = self._final
+        seen = set()
+        stack = [root]
+        while stack:
+            node_id = stack.pop()
+            for target in targets[row_start[node_id] : row_end[node_id]]:
+                if kinds[target] != _OMIT or target in final or target in seen:
+                    continue
+                if not listed[target]:
+                    return False
+                seen.add(target)
+                stack.append(target)
+        final.update(seen)
+        return True
+
+    def _collapse(self, roots: Iterable[int], kinds: bytearray) -> List[Dict]:
+        row_start, row_end, targets = self.graph._get_adjacency()
+        data = self.graph._data
+        entries = self._neighbor_entries
+
+        collapsed = []
+        for root in roots:
+            reached: Dict[int, None] = {}
+            for target in targets[row_start[root] : row_end[root]]:
+                kind = kinds[target]
+                if kind == _KEEP:
+                    reached[target] = None
+                elif kind == _OMIT:
+                    reached.update(dict.fromkeys(self._expand(target, kinds)))
+            neighbors = []
+            for node_id in reached:
+                entry = entries.get(node_id)
+                if entry is None:
+                    entry = entries[node_id] = {
+                        key: value
+                        for key, value in data[node_id].items()
+                        if key != "neighbors"
+                    }
+                neighbors.append(entry)
+            root_data = data[root]
+            node = {"id": root_data["id"], "otype": root_data["otype"]}
+            if "fully_qualified_name" in root_data:
+                node["fully_qualified_name"] = root_data["fully_qualified_name"]
+            node["neighbors"] = neighbors
+            collapsed.append(node)
+        return collapsed
+
+    def _expand(self, start: int, kinds: bytearray) -> array:
+        """
+        The kept nodes reachable from the omitted node `start` through omitted
+        nodes only, in the order they are first reached, memoized in _expansions.
+
+        Omitted nodes on a cycle reach the same kept nodes, so they are memoized
+        together once the whole cycle (strongly connected component, found as in
+        Tarjan's algorithm) has been walked, in the order of the node it was
+        entered from.
+        """
+        expansions = self._expansions
+        expansion = expansions.get(start)
+        if expansion is not None:
+            return expansion
+        row_start, row_end, targets = self.graph._get_adjacency()
+        stack = [start]
+        # Next edge to follow and kept nodes collected so far, for nodes on the stack
+        positions = {start: row_start[start]}
+        collected = {start: array("i")}
+        # Visit order and lowest visit order reachable through unfinished nodes
+        order = {start: 0}
+        low = {start: 0}
+        # Walked nodes whose component isn't complete yet
+        component = [start]
+        while stack:
+            node_id = stack[-1]
+            position = positions[node_id]
+            end = row_end[node_id]
+            descend = None
+            while position < end:
+                target = targets[position]
+                position += 1
+                kind = kinds[target]
+                if kind == _KEEP:
+                    collected[node_id].append(target)
+                elif kind == _OMIT:
+                    done = expansions.get(target)
+                    if done is not None:
+                        collected[node_id].extend(done)
+                    elif target in order:
+                        # On the same cycle; its kept nodes reach the cycle's root
+                        low[node_id] = min(low[node_id], order[target])
+                    else:
+                        descend = target
+                        break
+            if descend is not None:
+                positions[node_id] = position
+                positions[descend] = row_start[descend]
+                collected[descend] = array("i")
+                order[descend] = low[descend] = len(order)
+                component.append(descend)
+                stack.append(descend)
+                continue
+            stack.pop()
+            del positions[node_id]
+            reached = collected.pop(node_id)
+            if low[node_id] == order[node_id]:
+                reached = array("i", dict.fromkeys(reached))
+                while True:
+                    member = component.pop()
+                    expansions[member] = reached
+                    if member == node_id:
+                        break
+            if stack:
+                parent = stack[-1]
+                low[parent] = min(low[parent], low[node_id])
+                collected[parent].extend(reached)
+        return expansions[start]
+
+
+def collapse_lineage_response(response: Any, allowed_otypes: Iterable[str]) -> Any:
+    """
+    A lineage tool response with its graph collapsed to the allowed otypes. Events
+    without a graph, like errors, are returned as they are.
+    """
+    graph = response.get("graph") if isinstance(response, dict) else None
+    if not isinstance(graph, list):
+        return response
+    collapsed = LineageGraph(graph).collapse_to_otypes(allowed_otypes)
+    return {**response, "graph": collapsed}
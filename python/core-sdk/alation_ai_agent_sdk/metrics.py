@@ -0,0 +1,405 @@
+"""
+In-process metrics for the SDK: tool and HTTP latency histograms, time to first
+event, in-flight gauges, retry and token refresh counts and response sizes.
+
+Metrics are recorded by track_tool_execution and AlationAPI into a process-wide
+registry. Read them with get_metrics(), or export them in the OpenMetrics text
+format with render_openmetrics() / serve_openmetrics() for Prometheus to scrape.
+Nothing leaves the process unless it is exported.
+"""
+
+import bisect
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import http.server
+
+METRIC_COUNTER = "counter"
+METRIC_GAUGE = "gauge"
+METRIC_HISTOGRAM = "histogram"
+
+# Seconds. Catalog agent calls range from tens of milliseconds to minutes.
+DEFAULT_LATENCY_BUCKETS = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+# Bytes
+DEFAULT_SIZE_BUCKETS = (
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+    67108864,
+)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self, bucket_count: int):
+        # Per bucket, not cumulative. The last bucket is +Inf.
+        self.counts = [0] * (bucket_count + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class MetricFamily:
+    """A metric and its values for every combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        metric_type: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+        unit: str = "",
+    ):
+        self.name = name
+        self.type = metric_type
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets) if buckets is not None else ()
+        self.unit = unit
+        self._values: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Increment a counter or gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        """Decrement a gauge."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set a gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record a value in a histogram."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._values.get(key)
+            if histogram is None:
+                histogram = self._values[key] = _Histogram(len(self.buckets))
+            histogram.counts[index] += 1
+            histogram.count += 1
+            histogram.sum += value
+
+    def get(self, **labels: Any) -> Any:
+        """The current value for `labels`: a number, or a histogram snapshot."""
+        key = self._key(labels)
+        with self._lock:
+            value = self._values.get(key)
+            if self.type == METRIC_HISTOGRAM:
+                return self._histogram_snapshot(value) if value else None
+            return value or 0
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """Snapshot of every labelled value of the metric."""
+        with self._lock:
+            items = list(self._values.items())
+            samples = []
+            for key, value in items:
+                sample: Dict[str, Any] = {
+                    "labels": dict(zip(self.label_names, key, strict=True))
+                }
+                if self.type == METRIC_HISTOGRAM:
+                    sample.update(self._histogram_snapshot(value))
+                else:
+                    sample["value"] = value
+                samples.append(sample)
+        return samples
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _histogram_snapshot(self, histogram: _Histogram) -> Dict[str, Any]:
+        cumulative = []
+        total = 0
+        for bucket_count in histogram.counts:
+            total += bucket_count
+            cumulative.append(total)
+        bounds = list(self.buckets) + [float("inf")]
+        return {
+            "count": histogram.count,
+            "sum": histogram.sum,
+            "buckets": dict(zip(bounds, cumulative, strict=True)),
+            "p50": self._quantile(0.5, cumulative),
+            "p95": self._quantile(0.95, cumulative),
+            "p99": self._quantile(0.99, cumulative),
+        }
+
+    def _quantile(self, q: float, cumulative: List[int]) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket, as Prometheus does."""
+        total = cumulative[-1]
+        if not total:
+            return None
+        rank = q * total
+        index = bisect.bisect_left(cumulative, rank)
+        if index >= len(self.buckets):
+            # Past the largest bound; the best answer is that bound
+            return float(self.buckets[-1]) if self.buckets else None
+        lower = self.buckets[index - 1] if index > 0 else 0.0
+        upper = self.buckets[index]
+        below = cumulative[index - 1] if index > 0 else 0
+        in_bucket = cumulative[index] - below
+        if not in_bucket:
+            return float(upper)
+        return lower + (upper - lower) * (rank - below) / in_bucket
+
+
+class MetricsRegistry:
+    """A set of metric families, keyed by name."""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def register(self, family: MetricFamily) -> MetricFamily:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                return existing
+            self._families[family.name] = family
+            return family
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> MetricFamily:
+        return self.register(
+            MetricFamily(name, METRIC_COUNTER, documentation, label_names)
+        )
+
+    def gauge(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> MetricFamily:
+        return self.register(
+            MetricFamily(name, METRIC_GAUGE, documentation, label_names)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        unit: str = "",
+    ) -> MetricFamily:
+        return self.register(
+            MetricFamily(
+                name, METRIC_HISTOGRAM, documentation, label_names, buckets, unit
+            )
+        )
+
+    def families(self) -> List[MetricFamily]:
+        with self._lock:
+            return list(self._families.values())
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of every metric, keyed by metric name."""
+        return {
+            family.name: {
+                "type": family.type,
+                "help": family.documentation,
+                "samples": family.samples(),
+            }
+            for family in self.families()
+        }
+
+    def clear(self) -> None:
+        """Reset every metric to empty, keeping the families."""
+        for family in self.families():
+            family.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_DURATION = REGISTRY.histogram(
+    "alation_tool_duration_seconds",
+    "Duration of tool calls, including the whole stream for streamed results.",
+    ["tool"],
+    unit="seconds",
+)
+TOOL_TIME_TO_FIRST_EVENT = REGISTRY.histogram(
+    "alation_tool_time_to_first_event_seconds",
+    "Time from the start of a streamed tool call to its first event.",
+    ["tool"],
+    unit="seconds",
+)
+TOOL_CALLS = REGISTRY.counter(
+    "alation_tool_calls", "Finished tool calls by outcome.", ["tool", "status"]
+)
+TOOL_IN_FLIGHT = REGISTRY.gauge(
+    "alation_tool_in_flight", "Tool calls (or streams) in progress.", ["tool"]
+)
+TOOL_RESPONSE_SIZE = REGISTRY.histogram(
+    "alation_tool_response_bytes",
+    "Bytes of response bodies read by a tool call.",
+    ["tool"],
+    buckets=DEFAULT_SIZE_BUCKETS,
+    unit="bytes",
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "alation_http_request_duration_seconds",
+    "Time until the response headers arrive, per request attempt.",
+    ["method", "endpoint"],
+    unit="seconds",
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "alation_http_requests",
+    "HTTP request attempts by response status ('error' if no response).",
+    ["method", "endpoint", "status"],
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "alation_http_in_flight",
+    "HTTP requests waiting for response headers.",
+    ["endpoint"],
+)
+HTTP_RETRIES = REGISTRY.counter(
+    "alation_http_retries", "Retried HTTP requests.", ["method", "endpoint"]
+)
+TOKEN_REFRESHES = REGISTRY.counter(
+    "alation_token_refreshes", "Access tokens minted.", ["auth_method"]
+)
+
+# Object ids and UUIDs in paths would give every request its own label value
+_PATH_ID_PATTERN = re.compile(
+    r"/(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)"
+)
+
+
+def endpoint_label(path: str) -> str:
+    """Label for a request path, with ids replaced by `:id`."""
+    return _PATH_ID_PATTERN.sub("/:id", path)
+
+
+def get_metrics(registry: Optional[MetricsRegistry] = None) -> Dict[str, Any]:
+    """
+    Snapshot of the SDK metrics.
+
+    Returns a dict keyed by metric name. Each entry has the metric `type`, its
+    `help` text and `samples`: one per label combination with the `labels` and
+    either a `value` or, for histograms, `count`, `sum`, cumulative `buckets`
+    and p50/p95/p99 estimates.
+    """
+    return (registry or REGISTRY).collect()
+
+
+def render_openmetrics(registry: Optional[MetricsRegistry] = None) -> str:
+    """Render the metrics in the OpenMetrics text exposition format."""
+    lines = []
+    for family in (registry or REGISTRY).families():
+        name = family.name
+        lines.append(f"# TYPE {name} {family.type}")
+        if family.unit:
+            lines.append(f"# UNIT {name} {family.unit}")
+        lines.append(f"# HELP {name} {_escape(family.documentation)}")
+        for sample in family.samples():
+            labels = sample["labels"]
+            if family.type == METRIC_HISTOGRAM:
+                for bound, count in sample["buckets"].items():
+                    bucket_labels = {**labels, "le": _format_bound(bound)}
+                    lines.append(
+                        f"{name}_bucket{_format_labels(bucket_labels)} {count}"
+                    )
+                lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}"
+                )
+            elif family.type == METRIC_COUNTER:
+                lines.append(
+                    f"{name}_total{_format_labels(labels)} {_format_value(sample['value'])}"
+                )
+            else:
+                lines.append(
+                    f"{name}{_format_labels(labels)} {_format_value(sample['value'])}"
+                )
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def serve_openmetrics(
+    port: int, addr: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None
+) -> "http.server.ThreadingHTTPServer":
+    """
+    Serve the metrics at http://addr:port/metrics from a background thread.
+
+    Call shutdown() on the returned server to stop it.
+    """
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_openmetrics(registry).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((addr, port), MetricsHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="alation-metrics", daemon=True
+    )
+    thread.start()
+    return server
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else _format_value(float(bound))
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return repr(value)
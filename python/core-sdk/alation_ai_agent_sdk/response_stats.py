@@ -0,0 +1,101 @@
+"""
+Size accounting for tool results.
+
+The telemetry decorator installs a ResponseStats for the duration of a tool call
+(and of every step of a streamed result), and the response readers add to it as
+bytes arrive. Nothing is counted when no collector is installed.
+estimate_output_size measures returned values without rendering them.
+"""
+
+import itertools
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+
+class ResponseStats:
+    """Bytes of response bodies read while the collector was installed."""
+
+    __slots__ = ("bytes_read",)
+
+    def __init__(self):
+        self.bytes_read = 0
+
+
+_current_response_stats: ContextVar[Optional[ResponseStats]] = ContextVar(
+    "alation_response_stats", default=None
+)
+
+
+def current_response_stats() -> Optional[ResponseStats]:
+    """The collector installed for the running tool call, if any."""
+    return _current_response_stats.get()
+
+
+def install_response_stats(stats: Optional[ResponseStats]) -> Token:
+    """Install `stats` as the current collector. Undo with reset_response_stats."""
+    return _current_response_stats.set(stats)
+
+
+def reset_response_stats(token: Token) -> None:
+    _current_response_stats.reset(token)
+
+
+# Containers longer than this are measured on a sample and extrapolated
+DEFAULT_SIZE_ESTIMATE_SAMPLE_SIZE = 256
+
+
+def estimate_output_size(
+    value: Any, sample_size: int = DEFAULT_SIZE_ESTIMATE_SAMPLE_SIZE
+) -> int:
+    """
+    Estimate len(str(value)) without rendering the value.
+
+    Strings, numbers and the nesting of dicts and lists are measured directly. For
+    dicts and lists with more than `sample_size` items only the first ones are
+    measured and the rest extrapolated, so the cost stays bounded for large bulk
+    retrieval or lineage results.
+    """
+    if isinstance(value, str):
+        return len(value)
+    return _estimate_size(value, sample_size)
+
+
+def _estimate_size(value: Any, sample_size: int) -> int:
+    if isinstance(value, str):
+        return len(value) + 2  # Nested strings are quoted
+    if value is None or isinstance(value, (bool, int, float)):
+        return len(repr(value))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value) + 3  # b''
+    if isinstance(value, dict):
+        return _estimate_items_size(
+            value.items(), len(value), sample_size, _estimate_dict_item_size
+        )
+    if isinstance(value, (list, tuple)):
+        return _estimate_items_size(value, len(value), sample_size, _estimate_size)
+    return len(str(value))
+
+
+def _estimate_dict_item_size(item: Tuple[Any, Any], sample_size: int) -> int:
+    key, value = item
+    # "key: value"
+    return _estimate_size(key, sample_size) + 2 + _estimate_size(value, sample_size)
+
+
+def _estimate_items_size(
+    items: Iterable[Any],
+    count: int,
+    sample_size: int,
+    estimate_item: Callable[[Any, int], int],
+) -> int:
+    if count == 0:
+        return 2
+    measured = 0
+    sampled = 0
+    for item in itertools.islice(items, sample_size):
+        measured += estimate_item(item, sample_size)
+        sampled += 1
+    if sampled < count:
+        measured = measured * count // sampled
+    # Brackets plus ", " between items
+    return measured + 2 + 2 * (count - 1)
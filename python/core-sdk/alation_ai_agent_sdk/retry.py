@@ -0,0 +1,165 @@
+"""
+Retry policy shared by the REST and SSE requests of the sync and async clients.
+"""
+
+import email.utils
+import random
+import time
+from typing import Any, Collection, Optional
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_BASE_IN_SECONDS = 0.5
+DEFAULT_RETRY_BACKOFF_MAX_IN_SECONDS = 30.0
+# Rate limiting and the transient errors of proxies and load balancers
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Statuses telling that the server did not process the request, so a request that
+# isn't safe to send twice can still be retried after them
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429, 503})
+NON_IDEMPOTENT_METHODS = frozenset({"POST", "PATCH"})
+
+
+class RetryPolicy:
+    """
+    How failed requests are retried.
+
+    A request is retried when the connection fails or the response status is in
+    `retry_statuses`, until `max_attempts` requests have been sent. The delay before
+    retry n (starting at 0) is drawn uniformly from [0, min(backoff_max,
+    backoff_base * 2**n)] ("full jitter"), or is exactly that bound when `jitter` is
+    off. A Retry-After header raises the delay to the time the server asked for.
+
+    Retries stop early when the next delay would pass `deadline` seconds after the
+    first attempt, or when Retry-After asks for more than `backoff_max`, so callers
+    get the error right away instead of blocking.
+
+    SSE streams are only retried when they fail before the first byte of the body;
+    once events have been delivered the stream is not replayed.
+
+    POST and PATCH requests may already have been processed when the connection
+    drops or a gateway answers 502/504, and sending them again would run the same
+    agent turn twice. Unless `retry_non_idempotent` is set, they are only retried
+    when the connection could not be opened or the status is 429 or 503.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS,
+        backoff_base: float = DEFAULT_RETRY_BACKOFF_BASE_IN_SECONDS,
+        backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX_IN_SECONDS,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        retry_on_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+        retry_non_idempotent: bool = False,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def replace(self, **changes: Any) -> "RetryPolicy":
+        """Return a copy of the policy with some settings changed."""
+        settings = {
+            "max_attempts": self.max_attempts,
+            "backoff_base": self.backoff_base,
+            "backoff_max": self.backoff_max,
+            "jitter": self.jitter,
+            "deadline": self.deadline,
+            "retry_statuses": self.retry_statuses,
+            "retry_on_connection_errors": self.retry_on_connection_errors,
+            "respect_retry_after": self.respect_retry_after,
+            "retry_non_idempotent": self.retry_non_idempotent,
+        }
+        settings.update(changes)
+        return RetryPolicy(**settings)
+
+    def get_backoff(self, retry_number: int) -> float:
+        """Delay before retry `retry_number`, counting from 0."""
+        bound = min(self.backoff_max, self.backoff_base * (2**retry_number))
+        return random.uniform(0, bound) if self.jitter else bound
+
+    def start(self, method: str = "GET") -> "RetryState":
+        """Start tracking the attempts of one `method` request."""
+        return RetryState(self, method)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, "
+            f"backoff_base={self.backoff_base}, backoff_max={self.backoff_max}, "
+            f"jitter={self.jitter}, deadline={self.deadline}, "
+            f"retry_statuses={sorted(self.retry_statuses)}, "
+            f"retry_non_idempotent={self.retry_non_idempotent})"
+        )
+
+
+# Sends each request once
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class RetryState:
+    """Attempts made so far for a single request under a RetryPolicy."""
+
+    def __init__(self, policy: RetryPolicy, method: str = "GET"):
+        self.policy = policy
+        # Whether the request may be sent again after the server may have seen it
+        self.replay_safe = (
+            method.upper() not in NON_IDEMPOTENT_METHODS or policy.retry_non_idempotent
+        )
+        self.attempts = 1
+        self.started_at = time.monotonic()
+
+    def should_retry_status(self, status_code: Any) -> bool:
+        """Whether a response with `status_code` may be retried."""
+        if status_code not in self.policy.retry_statuses:
+            return False
+        return self.replay_safe or status_code in NON_IDEMPOTENT_RETRY_STATUSES
+
+    def next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None if the request should not
+        be retried. Counts the attempt when a delay is returned.
+        """
+        policy = self.policy
+        if self.attempts >= policy.max_attempts:
+            return None
+        delay = policy.get_backoff(self.attempts - 1)
+        if retry_after is not None and policy.respect_retry_after:
+            if retry_after > policy.backoff_max:
+                return None
+            delay = max(delay, retry_after)
+        if (
+            policy.deadline is not None
+            and time.monotonic() - self.started_at + delay > policy.deadline
+        ):
+            return None
+        self.attempts += 1
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Returns the number of seconds to wait, or None when the header is missing or
+    malformed. Dates in the past give 0.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None or retry_at.tzinfo is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
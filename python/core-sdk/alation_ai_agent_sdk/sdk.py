@@ -1,34 +1,38 @@
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Collection,
     Dict,
     Generator,
+    List,
     Optional,
     Union,
 )
 
+import requests
+
 from alation_ai_agent_sdk.errors import AlationAPIError
 from .api import (
     AlationAPI,
     AuthParams,
 )
-from .tools import (
-    AlationContextTool,
-    AlationBulkRetrievalTool,
-    AlationGetDataProductTool,
-    AlationLineageTool,
-    CheckDataQualityTool,
-    GenerateDataProductTool,
-    GetContextByIdTool,
-    GetCustomFieldsDefinitionsTool,
-    GetDataDictionaryInstructionsTool,
-    SignatureCreationTool,
-    AnalyzeCatalogQuestionTool,
-    CatalogContextSearchAgentTool,
-    QueryFlowAgentTool,
-    SqlQueryAgentTool,
-    GetDataSourcesTool,
-    CustomAgentTool,
+from .cache import FileCache, TTLCache
+from .json_codec import JSONCodec
+from .lineage import (
+    LineageBatchSizeType,
+    LineageDesignTimeType,
+    LineageDirectionType,
+    LineageExcludedSchemaIdsType,
+    LineageOTypeFilterType,
+    LineageResponseGraphNode,
+    LineageRootNode,
+    LineageTimestampType,
 )
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
+from .timings import PhaseTimingsCallback
 
 
 class AlationTools:
@@ -59,22 +63,140 @@ class AgentSDKOptions:
         enable_streaming: Optional[bool] = False,
         decode_nested_json: Optional[bool] = True,
         # TBD: option for only preserving content from part instead of whole response
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keepalive_idle_timeout: Optional[float] = None,
+        validate_token_on_server: Optional[bool] = False,
+        token_expiry_margin: Optional[float] = None,
+        background_token_refresh: Optional[bool] = False,
+        instruction_cache_ttl: Optional[float] = None,
+        instruction_cache_maxsize: Optional[int] = None,
+        instruction_cache: Optional[TTLCache] = None,
+        persist_instance_info: Optional[bool] = False,
+        instance_info_cache_dir: Optional[str] = None,
+        instance_info_cache_ttl: Optional[float] = None,
+        stream_event_types: Optional[Collection[str]] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        record_phase_timings: Optional[bool] = False,
+        phase_timings_callback: Optional[PhaseTimingsCallback] = None,
+        http_session: Optional[requests.Session] = None,
+        instance_info_cache: Optional[Union[TTLCache, FileCache]] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
     ):
         self.skip_instance_info = skip_instance_info
         self.enable_streaming = enable_streaming
         self.decode_nested_json = decode_nested_json
+        # HTTP connection pool settings (None uses the AlationAPI defaults)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_idle_timeout = keepalive_idle_timeout
+        # Service account tokens are trusted until token_expiry_margin seconds before
+        # they expire. validate_token_on_server introspects the token on every call.
+        self.validate_token_on_server = validate_token_on_server
+        self.token_expiry_margin = token_expiry_margin
+        # Renew service account tokens on a background timer shortly before expiry
+        self.background_token_refresh = background_token_refresh
+        # Responses of the instruction tools (generate_data_product, signature creation,
+        # data dictionary instructions, custom field definitions) are cached for
+        # instruction_cache_ttl seconds when it is set, or in a TTLCache passed to
+        # share one cache between SDK instances. Off by default; calls with a
+        # chat_id are never cached.
+        self.instruction_cache_ttl = instruction_cache_ttl
+        self.instruction_cache_maxsize = instruction_cache_maxsize
+        self.instruction_cache = instruction_cache
+        # License and version info is fetched on first use. persist_instance_info
+        # keeps it on disk (under instance_info_cache_dir, ~/.cache by default) for
+        # instance_info_cache_ttl seconds so new processes can skip the fetch.
+        self.persist_instance_info = persist_instance_info
+        self.instance_info_cache_dir = instance_info_cache_dir
+        self.instance_info_cache_ttl = instance_info_cache_ttl
+        # Only decode and return SSE events whose `event:` type is listed. In
+        # non-streaming mode the last event of a listed type is returned.
+        self.stream_event_types = stream_event_types
+        # JSON codec for request bodies, responses and SSE events: "auto" (default)
+        # uses orjson or msgspec when installed, "json" forces the standard library.
+        self.json_codec = json_codec
+        # Retries for 429/502/503/504 responses and connection failures, with
+        # jittered exponential backoff and Retry-After. Defaults to RetryPolicy();
+        # pass RetryPolicy(max_attempts=1) to disable retries.
+        self.retry_policy = retry_policy
+        # Time spent on auth, the request, the first SSE byte, streaming and JSON
+        # decoding, in milliseconds. record_phase_timings adds it to the _meta of
+        # results; phase_timings_callback(name, timings) receives it for every call.
+        self.record_phase_timings = record_phase_timings
+        self.phase_timings_callback = phase_timings_callback
+        # A requests session (see api.create_http_session) shared between sync SDK
+        # instances so they use one connection pool. The SDK never closes it.
+        self.http_session = http_session
+        # A TTLCache shared between SDK instances so instance info is fetched once
+        # per base_url rather than once per instance. Takes precedence over
+        # persist_instance_info.
+        self.instance_info_cache = instance_info_cache
+        # The httpx.AsyncClient counterpart of http_session, shared between
+        # AsyncAlationAIAgentSDK instances. Ignored by the sync SDK.
+        self.http_client = http_client
         # TBD: decide on stripping extra metadata from streamed response for non-streaming cases?
         # TBD: another parameter for whether to allow tools that output html
 
 
+class _LazyTool:
+    """
+    Tool attribute of AlationAIAgentSDK. The tool is built on first access and then
+    kept on the instance, so only the tools that are used get constructed and
+    tools.py is only imported once one is needed.
+    """
+
+    def __init__(self, class_name: str):
+        self.class_name = class_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, sdk, owner=None):
+        if sdk is None:
+            return self
+        from . import tools
+
+        tool = getattr(tools, self.class_name)(sdk.api)
+        sdk.__dict__[self.name] = tool
+        return tool
+
+
 class AlationAIAgentSDK:
     """
     SDK for interacting with Alation AI Agent capabilities.
 
     Can be initialized using Service Account authentication.
        sdk = AlationAIAgentSDK(base_url="https://company.alationcloud.com", auth_method="service_account", auth_params=("your_client_id", "your_client_secret"))
+
+    The SDK holds pooled HTTP connections. Call close() when done or use it as a context manager:
+       with AlationAIAgentSDK(...) as sdk:
+           sdk.catalog_context_search_agent("...")
     """
 
+    api_class = AlationAPI
+
+    # Built on first use, see _LazyTool
+    context_tool = _LazyTool("AlationContextTool")
+    bulk_retrieval_tool = _LazyTool("AlationBulkRetrievalTool")
+    data_product_tool = _LazyTool("AlationGetDataProductTool")
+    generate_data_product_tool = _LazyTool("GenerateDataProductTool")
+    get_context_by_id_tool = _LazyTool("GetContextByIdTool")
+    lineage_tool = _LazyTool("AlationLineageTool")
+    check_data_quality_tool = _LazyTool("CheckDataQualityTool")
+    get_custom_fields_definitions_tool = _LazyTool("GetCustomFieldsDefinitionsTool")
+    get_data_dictionary_instructions_tool = _LazyTool(
+        "GetDataDictionaryInstructionsTool"
+    )
+    signature_creation_tool = _LazyTool("SignatureCreationTool")
+    analyze_catalog_question_tool = _LazyTool("AnalyzeCatalogQuestionTool")
+    catalog_context_search_agent_tool = _LazyTool("CatalogContextSearchAgentTool")
+    query_flow_agent_tool = _LazyTool("QueryFlowAgentTool")
+    sql_query_agent_tool = _LazyTool("SqlQueryAgentTool")
+    get_data_sources_tool = _LazyTool("GetDataSourcesTool")
+    custom_agent_tool = _LazyTool("CustomAgentTool")
+
     def __init__(
         self,
         base_url: str,
@@ -100,7 +222,7 @@ class AlationAIAgentSDK:
         self.options = sdk_options
 
         # Delegate validation of auth_params to AlationAPI
-        self.api = AlationAPI(
+        self.api = self.api_class(
             base_url=base_url,
             auth_method=auth_method,
             auth_params=auth_params,
@@ -108,30 +230,48 @@ class AlationAIAgentSDK:
             skip_instance_info=sdk_options.skip_instance_info,
             enable_streaming=sdk_options.enable_streaming,
             decode_nested_json=sdk_options.decode_nested_json,
+            pool_connections=sdk_options.pool_connections,
+            pool_maxsize=sdk_options.pool_maxsize,
+            keepalive_idle_timeout=sdk_options.keepalive_idle_timeout,
+            validate_token_on_server=sdk_options.validate_token_on_server,
+            token_expiry_margin=sdk_options.token_expiry_margin,
+            background_token_refresh=sdk_options.background_token_refresh,
+            instruction_cache_ttl=sdk_options.instruction_cache_ttl,
+            instruction_cache_maxsize=sdk_options.instruction_cache_maxsize,
+            instruction_cache=sdk_options.instruction_cache,
+            persist_instance_info=sdk_options.persist_instance_info,
+            instance_info_cache_dir=sdk_options.instance_info_cache_dir,
+            instance_info_cache_ttl=sdk_options.instance_info_cache_ttl,
+            stream_event_types=sdk_options.stream_event_types,
+            json_codec=sdk_options.json_codec,
+            retry_policy=sdk_options.retry_policy,
+            record_phase_timings=sdk_options.record_phase_timings,
+            phase_timings_callback=sdk_options.phase_timings_callback,
+            http_session=sdk_options.http_session,
+            instance_info_cache=sdk_options.instance_info_cache,
+            **self._get_transport_options(sdk_options),
         )
-        self.context_tool = AlationContextTool(self.api)
-        self.bulk_retrieval_tool = AlationBulkRetrievalTool(self.api)
-        self.data_product_tool = AlationGetDataProductTool(self.api)
-        self.generate_data_product_tool = GenerateDataProductTool(self.api)
-        self.get_context_by_id_tool = GetContextByIdTool(self.api)
-        self.lineage_tool = AlationLineageTool(self.api)
-        self.check_data_quality_tool = CheckDataQualityTool(self.api)
-        self.get_custom_fields_definitions_tool = GetCustomFieldsDefinitionsTool(
-            self.api
-        )
-        self.get_data_dictionary_instructions_tool = GetDataDictionaryInstructionsTool(
-            self.api
-        )
-        self.signature_creation_tool = SignatureCreationTool(self.api)
-        self.analyze_catalog_question_tool = AnalyzeCatalogQuestionTool(self.api)
-        self.catalog_context_search_agent_tool = CatalogContextSearchAgentTool(self.api)
-        self.query_flow_agent_tool = QueryFlowAgentTool(self.api)
-        self.sql_query_agent_tool = SqlQueryAgentTool(self.api)
-        self.get_data_sources_tool = GetDataSourcesTool(self.api)
-        self.custom_agent_tool = CustomAgentTool(self.api)
 
     BETA_TOOLS = {AlationTools.LINEAGE}
 
+    def _get_transport_options(self, sdk_options: AgentSDKOptions) -> Dict[str, Any]:
+        """Options only understood by the transport of api_class."""
+        return {}
+
+    def __enter__(self) -> "AlationAIAgentSDK":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by the underlying AlationAPI."""
+        self.api.close()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached instruction tool responses so the next calls refetch them."""
+        self.api.invalidate_instruction_cache()
+
     def get_context(
         self,
         question: str,
@@ -430,6 +570,54 @@ class AlationAIAgentSDK:
             agent_config_id=agent_config_id, payload=payload, chat_id=chat_id
         )
 
+    def iter_lineage(
+        self,
+        root_node: LineageRootNode,
+        direction: LineageDirectionType,
+        batch_size: Optional[LineageBatchSizeType] = 1000,
+        max_nodes: Optional[int] = None,
+        max_depth: Optional[int] = 10,
+        show_temporal_objects: Optional[bool] = False,
+        design_time: Optional[LineageDesignTimeType] = None,
+        excluded_schema_ids: Optional[LineageExcludedSchemaIdsType] = None,
+        allowed_otypes: Optional[LineageOTypeFilterType] = None,
+        time_from: Optional[LineageTimestampType] = None,
+        time_to: Optional[LineageTimestampType] = None,
+        chat_id: Optional[str] = None,
+        collapse_to_otypes: Optional[LineageOTypeFilterType] = None,
+    ) -> Generator[List[LineageResponseGraphNode], None, None]:
+        """
+        Walk the whole lineage graph of an object page by page.
+
+        Yields the nodes of each page as they arrive while the next page is being
+        fetched, so large graphs are never held in memory at once. Stops after the
+        last page or once `max_nodes` nodes were yielded. With the async SDK this
+        returns an async generator.
+
+        Pass `collapse_to_otypes`, e.g. ["table"], to get a compact graph of those
+        otypes only. Pages are collapsed as they arrive; a node is yielded once
+        every object linking it to its neighbors has been fetched.
+
+        Example:
+            for nodes in sdk.iter_lineage({"id": 123, "otype": "table"}, "downstream"):
+                ...
+        """
+        return self.api.iter_lineage(
+            root_node=root_node,
+            direction=direction,
+            batch_size=batch_size,
+            max_nodes=max_nodes,
+            max_depth=max_depth,
+            show_temporal_objects=show_temporal_objects,
+            design_time=design_time,
+            excluded_schema_ids=excluded_schema_ids,
+            allowed_otypes=allowed_otypes,
+            time_from=time_from,
+            time_to=time_to,
+            chat_id=chat_id,
+            collapse_to_otypes=collapse_to_otypes,
+        )
+
     def get_tools(self):
         from .utils import is_tool_enabled
 
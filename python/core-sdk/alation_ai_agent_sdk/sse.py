@@ -0,0 +1,193 @@
+"""
+Incremental decoder for text/event-stream responses.
+
+Follows the event stream interpretation rules of the HTML specification:
+https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation
+"""
+
+from typing import List, NamedTuple, Optional
+
+
+class SSEEvent(NamedTuple):
+    """One dispatched server-sent event. `data` holds the raw UTF-8 payload."""
+
+    data: bytes
+    event: str = "message"
+    id: str = ""
+    retry: Optional[int] = None
+
+
+class SSEDecoder:
+    """
+    Decodes server-sent events from raw byte chunks as they arrive.
+
+    Lines may end in CRLF, LF or CR and may be split across chunks. Multiple
+    `data:` lines are joined with newlines, `event:`, `id:` and `retry:` fields
+    are recorded and comment lines (heartbeats) are skipped. Only the bytes of
+    `data:` values are copied; other lines are inspected in place.
+
+       decoder = SSEDecoder()
+       for chunk in response.iter_content(chunk_size=None):
+           for event in decoder.feed(chunk):
+               ...
+       for event in decoder.flush():
+           ...
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._data = bytearray()
+        self._has_data = False
+        self._event_type = ""
+        self._skip_lf = False
+        self.last_event_id = ""
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Consume a chunk of the response body and return the completed events."""
+        events: List[SSEEvent] = []
+        if not chunk:
+            return events
+        buffer = self._buffer
+        start = 0
+        if not buffer and self._skip_lf and chunk[:1] == b"\n":
+            start = 1
+        self._skip_lf = False
+        buffer += chunk
+        length = len(buffer)
+        view = memoryview(buffer)
+        lf_only = buffer.find(b"\r", start) == -1
+        while start < length:
+            if lf_only and not self._has_data and not self._event_type:
+                start = self._feed_single_line_events(buffer, view, start, events)
+                if start >= length:
+                    break
+            end = buffer.find(b"\n", start)
+            # A bare CR also ends a line, so look for one before the next LF
+            cr = buffer.find(b"\r", start, length if end == -1 else end)
+            if cr != -1:
+                next_start = cr + 1
+                if cr + 1 == end:
+                    next_start = end + 1
+                elif cr + 1 == length:
+                    # The matching LF of a CRLF may arrive in the next chunk
+                    self._skip_lf = True
+                end = cr
+            elif end == -1:
+                break
+            else:
+                next_start = end + 1
+            self._process_line(buffer, view, start, end, events)
+            start = next_start
+        view.release()
+        del buffer[:start]
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """
+        Finish decoding at the end of the stream.
+
+        Unlike browsers, a trailing event that isn't followed by a blank line is
+        still dispatched rather than discarded.
+        """
+        events: List[SSEEvent] = []
+        if self._buffer:
+            with memoryview(self._buffer) as view:
+                self._process_line(self._buffer, view, 0, len(view), events)
+            self._buffer.clear()
+        self._dispatch(events)
+        self._skip_lf = False
+        return events
+
+    def _feed_single_line_events(
+        self, buffer: bytearray, view: memoryview, start: int, events: List[SSEEvent]
+    ) -> int:
+        """
+        Fast path for the common shape of an event: a single `data:` line followed
+        by a blank line. Slices whole events out at once and returns the position of
+        the first line that needs the general line-by-line path.
+        """
+        find = buffer.find
+        startswith = buffer.startswith
+        append = events.append
+        length = len(buffer)
+        last_event_id = self.last_event_id
+        retry = self.retry
+        while True:
+            if startswith(b"data: ", start):
+                value_start = start + 6
+            elif startswith(b"data:", start):
+                value_start = start + 5
+            else:
+                return start
+            end = find(b"\n", start)
+            if end == -1 or end + 1 >= length or buffer[end + 1] != 0x0A:
+                return start
+            if value_start < end:
+                append(
+                    SSEEvent(
+                        bytes(view[value_start:end]), "message", last_event_id, retry
+                    )
+                )
+            start = end + 2
+
+    def _process_line(
+        self,
+        buffer: bytearray,
+        view: memoryview,
+        start: int,
+        end: int,
+        events: List[SSEEvent],
+    ) -> None:
+        if start == end:
+            self._dispatch(events)
+            return
+        if buffer.startswith(b"data:", start, end):
+            value_start = start + 5
+        elif buffer[start] == 0x3A:  # ":" starts a comment
+            return
+        else:
+            colon = buffer.find(b":", start, end)
+            if colon == -1:
+                field = bytes(buffer[start:end])
+                value_start = end
+            else:
+                field = bytes(buffer[start:colon])
+                value_start = colon + 1
+            if field != b"data":
+                if value_start < end and buffer[value_start] == 0x20:
+                    value_start += 1
+                self._process_field(field, bytes(buffer[value_start:end]))
+                return
+        if value_start < end and buffer[value_start] == 0x20:
+            value_start += 1
+        if self._has_data:
+            self._data += b"\n"
+        self._data += view[value_start:end]
+        self._has_data = True
+
+    def _process_field(self, field: bytes, value: bytes) -> None:
+        if field == b"event":
+            self._event_type = value.decode("utf-8", "replace")
+        elif field == b"id":
+            if b"\x00" not in value:
+                self.last_event_id = value.decode("utf-8", "replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self.retry = int(value)
+        # Other fields are ignored
+
+    def _dispatch(self, events: List[SSEEvent]) -> None:
+        # Events whose data is empty are not dispatched
+        if self._data:
+            events.append(
+                SSEEvent(
+                    data=bytes(self._data),
+                    event=self._event_type or "message",
+                    id=self.last_event_id,
+                    retry=self.retry,
+                )
+            )
+            self._data.clear()
+        self._has_data = False
+        self._event_type = ""
@@ -0,0 +1,75 @@
+"""
+Per-phase latency breakdown of a single request.
+
+Recording is enabled with `record_phase_timings` or by passing a
+`phase_timings_callback`. When it is off no PhaseTimings is created and the
+request paths only check for None.
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+# Validating the access token, or refreshing it
+PHASE_AUTH = "auth"
+# Fetching the instance info before the first request of the async client
+PHASE_INSTANCE_INFO = "instance_info"
+# Connecting, sending the request and waiting for the response headers, retries
+# included. Requests that aren't streamed also read the whole body here.
+PHASE_REQUEST = "request"
+# From the response headers to the first byte of the SSE body: server think time
+PHASE_FIRST_BYTE = "first_byte"
+# From the first byte to the end of the SSE body. In streaming mode this includes
+# the time the caller spends between events.
+PHASE_STREAM = "stream"
+# Decoding the JSON of the body or events, _decode_nested_json included
+PHASE_DECODE = "decode"
+
+PhaseTimingsCallback = Callable[[str, Dict[str, float]], None]
+
+
+class PhaseTimings:
+    """
+    Milliseconds spent in each phase of one request.
+
+    mark(phase) closes the current phase: the time since the previous mark is
+    added to `phase`. Work timed with timed() in the middle of a phase, like
+    decoding events while streaming, is kept out of the phase that contains it.
+    """
+
+    __slots__ = ("name", "started_at", "phases", "_last_mark", "_timed")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self._last_mark = self.started_at
+        self._timed = 0.0
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._add(phase, now - self._last_mark - self._timed)
+        self._last_mark = now
+        self._timed = 0.0
+
+    def timed(self, phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap `func` so the time spent in it is added to `phase`."""
+
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                self._add(phase, elapsed)
+                self._timed += elapsed
+
+        return wrapper
+
+    def _add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds * 1000
+
+    def as_dict(self) -> Dict[str, float]:
+        """The phases in milliseconds, plus the `total` since the request started."""
+        timings = {phase: round(ms, 3) for phase, ms in self.phases.items()}
+        timings["total"] = round((time.perf_counter() - self.started_at) * 1000, 3)
+        return timings
@@ -1,8 +1,11 @@
+import inspect
 import re
 import logging
 
+from functools import wraps
 from typing import (
     Any,
+    AsyncGenerator,
     Dict,
     Generator,
     List,
@@ -23,7 +26,9 @@ from alation_ai_agent_sdk.lineage import (
     LineagePagination,
     LineageRootNode,
     LineageOTypeFilterType,
+    validate_lineage_collapse,
 )
+from alation_ai_agent_sdk.lineage_graph import collapse_lineage_response
 from alation_ai_agent_sdk.event import track_tool_execution
 
 logger = logging.getLogger(__name__)
@@ -32,29 +37,28 @@ logger = logging.getLogger(__name__)
 def min_alation_version(min_version: str):
     """
     Decorator to enforce minimum Alation version for a tool's run method (inclusive).
+    Async run methods first give the API a chance to fetch the instance info.
     """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                ensure_instance_info = getattr(self.api, "ensure_instance_info", None)
+                if ensure_instance_info is not None:
+                    await ensure_instance_info()
+                version_error = _check_min_alation_version(self, min_version)
+                if version_error is not None:
+                    return version_error
+                return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
         def wrapper(self, *args, **kwargs):
-            current_version = getattr(self.api, "alation_release_name", None)
-            if current_version is None:
-                logger.warning(
-                    f"[VersionCheck] Unable to extract Alation version for {self.__class__.__name__}. Required >= {min_version}. Proceeding with caution."
-                )
-                # Continue execution, do not block
-                return func(self, *args, **kwargs)
-            if not is_version_supported(current_version, min_version):
-                logger.warning(
-                    f"[VersionCheck] {self.__class__.__name__} blocked: required >= {min_version}, current = {current_version}"
-                )
-                return {
-                    "error": {
-                        "message": f"{self.__class__.__name__} requires Alation version >= {min_version}. Current: {current_version}",
-                        "reason": "Unsupported Alation Version",
-                        "resolution_hint": f"Upgrade your Alation instance to at least {min_version} to use this tool.",
-                        "alation_version": current_version,
-                    }
-                }
+            version_error = _check_min_alation_version(self, min_version)
+            if version_error is not None:
+                return version_error
             return func(self, *args, **kwargs)
 
         return wrapper
@@ -62,6 +66,65 @@ def min_alation_version(min_version: str):
     return decorator
 
 
+def _check_min_alation_version(tool: Any, min_version: str) -> Optional[Dict[str, Any]]:
+    """Return an error payload if the instance is older than min_version."""
+    current_version = getattr(tool.api, "alation_release_name", None)
+    if current_version is None:
+        logger.warning(
+            f"[VersionCheck] Unable to extract Alation version for {tool.__class__.__name__}. Required >= {min_version}. Proceeding with caution."
+        )
+        # Continue execution, do not block
+        return None
+    if not is_version_supported(current_version, min_version):
+        logger.warning(
+            f"[VersionCheck] {tool.__class__.__name__} blocked: required >= {min_version}, current = {current_version}"
+        )
+        return {
+            "error": {
+                "message": f"{tool.__class__.__name__} requires Alation version >= {min_version}. Current: {current_version}",
+                "reason": "Unsupported Alation Version",
+                "resolution_hint": f"Upgrade your Alation instance to at least {min_version} to use this tool.",
+                "alation_version": current_version,
+            }
+        }
+    return None
+
+
+async def first_event(
+    stream: AsyncGenerator[Dict[str, Any], None], default: Any = None
+) -> Any:
+    """
+    Await the single event of a non-streaming async response and release its
+    connection right away instead of waiting for the generator to be collected.
+    """
+    try:
+        return await anext(stream, default)
+    finally:
+        await stream.aclose()
+
+
+def _collapse_lineage_stream(
+    stream: Generator[Dict[str, Any], None, None], allowed_otypes: List[str]
+) -> Generator[Dict[str, Any], None, None]:
+    """Collapse the graph of each lineage event as it arrives."""
+    try:
+        for event in stream:
+            yield collapse_lineage_response(event, allowed_otypes)
+    finally:
+        stream.close()
+
+
+async def _collapse_lineage_async_stream(
+    stream: AsyncGenerator[Dict[str, Any], None], allowed_otypes: List[str]
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Async counterpart of _collapse_lineage_stream."""
+    try:
+        async for event in stream:
+            yield collapse_lineage_response(event, allowed_otypes)
+    finally:
+        await stream.aclose()
+
+
 def is_version_supported(current: str, minimum: str) -> bool:
     """
     Compare Alation version strings (e.g., '2025.1.5' >= '2025.1.2'). Returns True if current >= minimum.
@@ -160,6 +223,31 @@ class AlationContextTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @min_alation_version("2025.1.2")
+    @track_tool_execution()
+    async def arun(
+        self,
+        *,
+        question: str,
+        signature: Optional[Dict[str, Any]] = None,
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        logger.warning(
+            "The AlationContextTool is deprecated and will be removed in a future release. Migrate your code and prompts to use CatalogContextSearchAgentTool instead."
+        )
+        try:
+            ref = self.api.alation_context_stream(
+                question=question,
+                signature=signature,
+                chat_id=chat_id,
+            )
+            if self.api.enable_streaming:
+                return ref
+            return await first_event(ref, {"error": "No response from API"})
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class AlationGetDataProductTool:
     def __init__(self, api: AlationAPI):
@@ -208,6 +296,16 @@ class AlationGetDataProductTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, *, product_id: Optional[str] = None, query: Optional[str] = None
+    ):
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            return await self.api.get_data_products(product_id=product_id, query=query)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class AlationBulkRetrievalTool:
     def __init__(self, api: AlationAPI):
@@ -283,6 +381,36 @@ PARAMETERS:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self,
+        *,
+        signature: Optional[Dict[str, Any]] = None,
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        if not signature:
+            return {
+                "error": {
+                    "message": "Signature parameter is required for bulk retrieval",
+                    "reason": "Missing Required Parameter",
+                    "resolution_hint": "Provide a signature specifying object types, fields, and optional filters. See tool description for examples.",
+                    "example_signature": {
+                        "table": {
+                            "fields_required": ["name", "title", "description", "url"],
+                            "search_filters": {"flags": ["Endorsement"]},
+                            "limit": 10,
+                        }
+                    },
+                }
+            }
+
+        try:
+            ref = self.api.bulk_retrieval_stream(signature=signature, chat_id=chat_id)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class GetContextByIdTool:
     def __init__(self, api: AlationAPI):
@@ -353,6 +481,30 @@ PARAMETERS:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self,
+        *,
+        signature: Dict[str, Any],
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        if not signature:
+            return {
+                "error": {
+                    "message": "Signature parameter is required",
+                    "reason": "Missing Required Parameter",
+                    "resolution_hint": "Provide a signature with search_phrases. Call get_signature_creation_instructions for format details.",
+                }
+            }
+        try:
+            ref = self.api.get_context_by_id_stream(
+                signature=signature, chat_id=chat_id
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class AlationLineageTool:
     def __init__(self, api: AlationAPI):
@@ -380,6 +532,7 @@ class AlationLineageTool:
         - allowed_otypes: Filter to specific object types like ["table", "attribute"]
         - limit: Maximum nodes to return (default: 1000, max: 1000). Never change this unless the user question explicitly mentions a limit.
         - max_depth: How many levels deep to traverse (default: 10)
+        - collapse_to_otypes: Compact the returned graph to these object types, like ["table"]. Other objects are removed and their neighbors linked through, giving a table-to-table graph with far fewer nodes. Only with the complete processing_mode, without pagination.
 
         PROCESSING CONTROL:
         - processing_mode: "complete" (default, recommended) or "chunked" for portions of graphs
@@ -429,8 +582,11 @@ class AlationLineageTool:
         time_from: Optional[LineageTimestampType] = None,
         time_to: Optional[LineageTimestampType] = None,
         chat_id: Optional[str] = None,
+        collapse_to_otypes: Optional[LineageOTypeFilterType] = None,
     ) -> Union[Generator[Dict[str, Any], None, None], Dict[str, Any]]:
         try:
+            if collapse_to_otypes is not None:
+                validate_lineage_collapse(processing_mode, pagination)
             ref = self.api.alation_lineage_stream(
                 root_node=root_node,
                 direction=direction,
@@ -447,10 +603,58 @@ class AlationLineageTool:
                 time_to=time_to,
                 chat_id=chat_id,
             )
+            if collapse_to_otypes is not None:
+                ref = _collapse_lineage_stream(ref, collapse_to_otypes)
             return ref if self.api.enable_streaming else next(ref)
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self,
+        *,
+        root_node: LineageRootNode,
+        direction: LineageDirectionType,
+        limit: Optional[int] = 1000,
+        batch_size: Optional[LineageBatchSizeType] = 1000,
+        pagination: Optional[LineagePagination] = None,
+        processing_mode: Optional[LineageGraphProcessingType] = None,
+        show_temporal_objects: Optional[bool] = False,
+        design_time: Optional[LineageDesignTimeType] = None,
+        max_depth: Optional[int] = 10,
+        excluded_schema_ids: Optional[LineageExcludedSchemaIdsType] = None,
+        allowed_otypes: Optional[LineageOTypeFilterType] = None,
+        time_from: Optional[LineageTimestampType] = None,
+        time_to: Optional[LineageTimestampType] = None,
+        chat_id: Optional[str] = None,
+        collapse_to_otypes: Optional[LineageOTypeFilterType] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            if collapse_to_otypes is not None:
+                validate_lineage_collapse(processing_mode, pagination)
+            ref = self.api.alation_lineage_stream(
+                root_node=root_node,
+                direction=direction,
+                limit=limit,
+                batch_size=batch_size,
+                pagination=pagination,
+                processing_mode=processing_mode,
+                show_temporal_objects=show_temporal_objects,
+                design_time=design_time,
+                max_depth=max_depth,
+                excluded_schema_ids=excluded_schema_ids,
+                allowed_otypes=allowed_otypes,
+                time_from=time_from,
+                time_to=time_to,
+                chat_id=chat_id,
+            )
+            if collapse_to_otypes is not None:
+                ref = _collapse_lineage_async_stream(ref, collapse_to_otypes)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class GenerateDataProductTool:
     def __init__(self, api: AlationAPI):
@@ -513,6 +717,17 @@ class GenerateDataProductTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.generate_data_product_stream(chat_id=chat_id)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class CheckDataQualityTool:
     def __init__(self, api: AlationAPI):
@@ -630,6 +845,37 @@ class CheckDataQualityTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self,
+        *,
+        table_ids: Optional[list] = None,
+        sql_query: Optional[str] = None,
+        db_uri: Optional[str] = None,
+        ds_id: Optional[int] = None,
+        bypassed_dq_sources: Optional[list] = None,
+        default_schema_name: Optional[str] = None,
+        output_format: Optional[str] = None,
+        dq_score_threshold: Optional[int] = None,
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.get_data_quality_tool_stream(
+                table_ids=table_ids,
+                sql_query=sql_query,
+                db_uri=db_uri,
+                ds_id=ds_id,
+                bypassed_dq_sources=bypassed_dq_sources,
+                default_schema_name=default_schema_name,
+                output_format=output_format,
+                dq_score_threshold=dq_score_threshold,
+                chat_id=chat_id,
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class GetCustomFieldsDefinitionsTool:
     def __init__(self, api: AlationAPI):
@@ -692,6 +938,17 @@ class GetCustomFieldsDefinitionsTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.get_custom_field_definitions_stream(chat_id=chat_id)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class GetDataDictionaryInstructionsTool:
     """
@@ -763,6 +1020,17 @@ class GetDataDictionaryInstructionsTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.get_data_dictionary_instructions_stream(chat_id=chat_id)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class SignatureCreationTool:
     def __init__(self, api: AlationAPI):
@@ -808,6 +1076,17 @@ and best practices for validation and filter rules.
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.get_signature_creation_instructions_stream(chat_id=chat_id)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class AnalyzeCatalogQuestionTool:
     def __init__(self, api: AlationAPI):
@@ -856,6 +1135,20 @@ for using `get_context_by_id` or `bulk_retrieval` tools.
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, *, question: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.analyze_catalog_question_stream(
+                question=question,
+                chat_id=chat_id,
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class CatalogContextSearchAgentTool:
     def __init__(self, api: AlationAPI):
@@ -907,6 +1200,20 @@ class CatalogContextSearchAgentTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, *, message: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.catalog_context_search_agent_stream(
+                message=message,
+                chat_id=chat_id,
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class QueryFlowAgentTool:
     def __init__(self, api: AlationAPI):
@@ -949,6 +1256,21 @@ class QueryFlowAgentTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, *, message: str, marketplace_id: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.query_flow_agent_stream(
+                message=message,
+                marketplace_id=marketplace_id,
+                chat_id=chat_id,
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class SqlQueryAgentTool:
     def __init__(self, api: AlationAPI):
@@ -991,6 +1313,21 @@ class SqlQueryAgentTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, *, message: str, data_product_id: str, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.sql_query_agent_stream(
+                message=message,
+                data_product_id=data_product_id,
+                chat_id=chat_id,
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class GetDataSourcesTool:
     def __init__(self, api: AlationAPI):
@@ -1041,6 +1378,17 @@ class GetDataSourcesTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self, *, limit: int = 100, chat_id: Optional[str] = None
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.get_data_sources_tool_stream(limit=limit, chat_id=chat_id)
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 class CustomAgentTool:
     def __init__(self, api: AlationAPI):
@@ -1097,6 +1445,23 @@ class CustomAgentTool:
         except AlationAPIError as e:
             return {"error": e.to_dict()}
 
+    @track_tool_execution()
+    async def arun(
+        self,
+        *,
+        agent_config_id: str,
+        payload: Dict[str, Any],
+        chat_id: Optional[str] = None,
+    ) -> Union[AsyncGenerator[Dict[str, Any], None], Dict[str, Any]]:
+        """Async counterpart of run(). Requires an AsyncAlationAPI."""
+        try:
+            ref = self.api.custom_agent_stream(
+                agent_config_id=agent_config_id, payload=payload, chat_id=chat_id
+            )
+            return ref if self.api.enable_streaming else await first_event(ref)
+        except AlationAPIError as e:
+            return {"error": e.to_dict()}
+
 
 def csv_str_to_tool_list(tool_env_var: Optional[str] = None) -> List[str]:
     if tool_env_var is None:
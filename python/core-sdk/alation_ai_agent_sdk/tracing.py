@@ -0,0 +1,298 @@
+"""
+Optional OpenTelemetry tracing.
+
+When opentelemetry-api is installed, tool runs, HTTP requests, token refreshes and
+SSE streams are recorded as spans, and outgoing requests carry the W3C
+`traceparent` header of the current span. Spans are only recorded once the
+application configures an OpenTelemetry SDK (sets a tracer provider).
+
+Until then, or without opentelemetry-api, every helper here returns right away:
+the decorators call the function directly, the stream wrappers return the stream,
+and start_span returns None. opentelemetry-api itself is only imported once the
+application has imported it, since no SDK can be configured before that.
+"""
+
+import contextlib
+import functools
+import inspect
+import sys
+import urllib.parse
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Mapping,
+    Optional,
+)
+
+from .metrics import endpoint_label
+from .utils import SDK_VERSION
+
+TRACER_NAME = "alation_ai_agent_sdk"
+
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_CLIENT = "client"
+SPAN_KIND_SERVER = "server"
+
+Attributes = Optional[Mapping[str, Any]]
+
+_NO_SPAN = contextlib.nullcontext()
+
+# Set by _load_opentelemetry
+trace = None
+_tracer = None
+
+
+def _load_opentelemetry() -> bool:
+    """Import opentelemetry-api if the application has already imported it."""
+    global otel_context, propagate, trace, SpanKind, Status, StatusCode
+    global _tracer, _SPAN_KINDS, _NO_OP_PROVIDERS
+
+    if "opentelemetry.trace" not in sys.modules:
+        return False
+    from opentelemetry import context as otel_context
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+
+    _SPAN_KINDS = {
+        SPAN_KIND_INTERNAL: SpanKind.INTERNAL,
+        SPAN_KIND_CLIENT: SpanKind.CLIENT,
+        SPAN_KIND_SERVER: SpanKind.SERVER,
+    }
+    # Providers in place until an SDK is configured; their spans record nothing
+    _NO_OP_PROVIDERS = (trace.ProxyTracerProvider, trace.NoOpTracerProvider)
+    _tracer = trace.get_tracer(TRACER_NAME, SDK_VERSION)
+    return True
+
+
+def _get_tracer() -> Optional[Any]:
+    """The tracer, or None while spans wouldn't be recorded."""
+    if _tracer is None and not _load_opentelemetry():
+        return None
+    if isinstance(trace.get_tracer_provider(), _NO_OP_PROVIDERS):
+        return None
+    return _tracer
+
+
+def tracing_enabled() -> bool:
+    """Whether opentelemetry-api is installed and an SDK has been configured."""
+    return _get_tracer() is not None
+
+
+def start_span(
+    name: str, kind: str = SPAN_KIND_INTERNAL, attributes: Attributes = None
+) -> Optional[Any]:
+    """
+    Start a span that is a child of the current one without making it current.
+    Finish it with end_span. Returns None without OpenTelemetry.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        return None
+    return tracer.start_span(name, kind=_SPAN_KINDS[kind], attributes=attributes)
+
+
+def use_span(span: Optional[Any]) -> ContextManager[Any]:
+    """
+    Make `span` current for the duration of the block, without ending it.
+    Exceptions raised in the block are recorded on the span.
+    """
+    if span is None:
+        return _NO_SPAN
+    return trace.use_span(span, end_on_exit=False)
+
+
+def end_span(span: Optional[Any], error: Any = None) -> None:
+    """End `span`, marking it as failed when `error` is given."""
+    if span is None:
+        return
+    if error is not None:
+        span.set_status(Status(StatusCode.ERROR, _describe_error(error)))
+    span.end()
+
+
+def start_as_current_span(
+    name: str, kind: str = SPAN_KIND_INTERNAL, attributes: Attributes = None
+) -> ContextManager[Any]:
+    """
+    Start a span, current for the duration of the block, that records exceptions
+    raised in the block. The block gets the span, or None without OpenTelemetry.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_as_current_span(
+        name, kind=_SPAN_KINDS[kind], attributes=attributes
+    )
+
+
+def start_http_span(method: str, url: str) -> ContextManager[Any]:
+    """
+    Client span around an API call, current for the duration of the block so the
+    request carries its trace context. The query string is left out of the span
+    since it may hold the user's question.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        return _NO_SPAN
+    method = method.upper()
+    parts = urllib.parse.urlsplit(url)
+    url_template = endpoint_label(parts.path)
+    return tracer.start_as_current_span(
+        f"{method} {url_template}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "http.request.method": method,
+            "server.address": parts.hostname or "",
+            "url.template": url_template,
+        },
+    )
+
+
+def set_http_status(span: Optional[Any], status_code: int) -> None:
+    """Record the response status of an HTTP client span."""
+    if span is None or not span.is_recording() or not isinstance(status_code, int):
+        return
+    span.set_attribute("http.response.status_code", status_code)
+    if status_code >= 400:
+        span.set_status(Status(StatusCode.ERROR, f"HTTP {status_code}"))
+
+
+def inject_trace_context(headers: Dict[str, str]) -> None:
+    """Add the W3C trace context of the current span to outgoing request headers."""
+    if _get_tracer() is not None:
+        propagate.inject(headers)
+
+
+def traced(
+    name: str,
+    kind: str = SPAN_KIND_INTERNAL,
+    attributes: Attributes = None,
+    get_carrier: Optional[Callable[[], Mapping[str, str]]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator running each call of a function or coroutine function in a span.
+
+    `get_carrier`, when given, returns the headers of the incoming request. A trace
+    context found in them becomes the parent of the span, so the span joins the
+    caller's trace.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _get_tracer() is None:
+                    return await func(*args, **kwargs)
+                token = _attach_remote_context(get_carrier)
+                try:
+                    with start_as_current_span(name, kind, attributes):
+                        return await func(*args, **kwargs)
+                finally:
+                    if token is not None:
+                        otel_context.detach(token)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _get_tracer() is None:
+                return func(*args, **kwargs)
+            token = _attach_remote_context(get_carrier)
+            try:
+                with start_as_current_span(name, kind, attributes):
+                    return func(*args, **kwargs)
+            finally:
+                if token is not None:
+                    otel_context.detach(token)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_stream(
+    name: str, stream: Generator[Any, None, None], attributes: Attributes = None
+) -> Generator[Any, None, None]:
+    """
+    Record the consumption of `stream` as one span, started by the first next()
+    and ended when the stream is exhausted, fails or is closed. The span is only
+    current while the stream produces its next item, never while the consumer
+    holds one.
+    """
+    if _get_tracer() is None:
+        return stream
+    return _trace_stream(name, attributes, stream)
+
+
+def trace_async_stream(
+    name: str, stream: AsyncGenerator[Any, None], attributes: Attributes = None
+) -> AsyncGenerator[Any, None]:
+    """Async counterpart of trace_stream."""
+    if _get_tracer() is None:
+        return stream
+    return _trace_async_stream(name, attributes, stream)
+
+
+def _trace_stream(
+    name: str, attributes: Attributes, stream: Generator[Any, None, None]
+) -> Generator[Any, None, None]:
+    span = start_span(name, attributes=attributes)
+    event_count = 0
+    try:
+        while True:
+            with use_span(span):
+                try:
+                    event = next(stream)
+                except StopIteration:
+                    break
+            event_count += 1
+            yield event
+    finally:
+        stream.close()
+        span.set_attribute("alation.stream.event_count", event_count)
+        span.end()
+
+
+async def _trace_async_stream(
+    name: str, attributes: Attributes, stream: AsyncGenerator[Any, None]
+) -> AsyncGenerator[Any, None]:
+    span = start_span(name, attributes=attributes)
+    event_count = 0
+    try:
+        while True:
+            with use_span(span):
+                try:
+                    event = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+            event_count += 1
+            yield event
+    finally:
+        await stream.aclose()
+        span.set_attribute("alation.stream.event_count", event_count)
+        span.end()
+
+
+def _attach_remote_context(
+    get_carrier: Optional[Callable[[], Mapping[str, str]]],
+) -> Optional[object]:
+    if get_carrier is None:
+        return None
+    carrier = get_carrier()
+    if not carrier:
+        return None
+    remote_context = propagate.extract(carrier)
+    if not trace.get_current_span(remote_context).get_span_context().is_valid:
+        return None
+    return otel_context.attach(remote_context)
+
+
+def _describe_error(error: Any) -> str:
+    if isinstance(error, dict):
+        return str(error.get("message") or error.get("reason") or error)
+    return str(error)
@@ -0,0 +1,147 @@
+"""
+Compare the JSON codecs on payloads shaped like bulk retrieval and lineage responses.
+
+Each payload is measured the way the SDK handles it: decoding the SSE event bytes
+(plus the nested JSON pass for the bulk retrieval agent message) and encoding a
+request body.
+
+    python benchmarks/bench_json_codec.py [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+
+from alation_ai_agent_sdk.json_codec import (
+    JSON_CODEC_MSGSPEC,
+    JSON_CODEC_ORJSON,
+    JSON_CODEC_STDLIB,
+    get_json_codec,
+)
+
+
+def make_bulk_retrieval_event(table_count: int = 200, column_count: int = 25) -> bytes:
+    """An agent message whose text part carries the bulk retrieval result as JSON."""
+    tables = [
+        {
+            "id": table_id,
+            "name": f"fact_orders_{table_id}",
+            "title": f"Orders fact table {table_id}",
+            "description": "<p>Daily order facts, one row per order line. "
+            "Refreshed nightly from the OLTP replica.</p>" * 3,
+            "url": f"https://alation.example.com/table/{table_id}/",
+            "ds_id": 7,
+            "schema_name": "sales",
+            "custom_fields": [
+                {"field_id": 3, "field_name": "Steward", "value": ["jane.doe"]},
+                {"field_id": 8, "field_name": "Certified", "value": True},
+            ],
+            "columns": [
+                {
+                    "id": table_id * 1000 + column_id,
+                    "name": f"column_{column_id}",
+                    "data_type": "varchar(255)",
+                    "description": "Identifier of the customer who placed the order.",
+                    "sample_values": ["a1", "b2", "c3"],
+                }
+                for column_id in range(column_count)
+            ],
+        }
+        for table_id in range(table_count)
+    ]
+    event = {
+        "model_message": {
+            "parts": [
+                {
+                    "part_kind": "text",
+                    "content": json.dumps({"relevant_tables": tables}),
+                }
+            ]
+        },
+        "chat_id": "b1b8a8de-0d5c-4c8a-9c3e-1f2a3b4c5d6e",
+    }
+    return json.dumps(event).encode("utf-8")
+
+
+def make_lineage_event(node_count: int = 5000, fan_out: int = 3) -> bytes:
+    """A page of a lineage graph with upstream neighbors for every node."""
+    otypes = ["table", "attribute", "dataflow", "bi_report", "file"]
+    graph = [
+        {
+            "id": node_id,
+            "otype": otypes[node_id % len(otypes)],
+            "fully_qualified_name": f"7.warehouse.schema_{node_id % 40}.object_{node_id}",
+            "is_temp": False,
+            "is_external": node_id % 17 == 0,
+            "neighbors": [
+                {"id": (node_id + step) % node_count, "otype": otypes[step]}
+                for step in range(1, fan_out + 1)
+            ],
+        }
+        for node_id in range(node_count)
+    ]
+    event = {
+        "graph": graph,
+        "direction": "upstream",
+        "pagination": {"cursor": 2, "page_size": node_count, "has_more": True},
+    }
+    return json.dumps(event).encode("utf-8")
+
+
+def bench(codec_name: str, payload: bytes, nested: bool, repeat: int):
+    codec = get_json_codec(codec_name)
+
+    def decode():
+        data = codec.loads(payload)
+        if nested:
+            for part in data["model_message"]["parts"]:
+                part["content"] = codec.loads(part["content"])
+        return data
+
+    decoded = decode()
+    decode_seconds = min(timeit.repeat(decode, number=1, repeat=repeat))
+    encode_seconds = min(
+        timeit.repeat(lambda: codec.dumpb(decoded), number=1, repeat=repeat)
+    )
+    return decode_seconds, encode_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = [
+        ("bulk_retrieval", make_bulk_retrieval_event(), True),
+        ("lineage", make_lineage_event(), False),
+    ]
+    codecs = []
+    for name in (JSON_CODEC_STDLIB, JSON_CODEC_ORJSON, JSON_CODEC_MSGSPEC):
+        try:
+            get_json_codec(name)
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+            continue
+        codecs.append(name)
+
+    print(
+        f"{'payload':<16}{'codec':<10}{'decode ms':>12}{'encode ms':>12}{'speedup':>10}"
+    )
+    for payload_name, payload, nested in payloads:
+        baseline = None
+        for codec_name in codecs:
+            decode_seconds, encode_seconds = bench(
+                codec_name, payload, nested, args.repeat
+            )
+            total = decode_seconds + encode_seconds
+            baseline = baseline or total
+            print(
+                f"{payload_name:<16}{codec_name:<10}"
+                f"{decode_seconds * 1000:>12.2f}{encode_seconds * 1000:>12.2f}"
+                f"{baseline / total:>9.1f}x"
+            )
+        print(f"{'':<16}({len(payload) / 1024:.0f} KiB per event)")
+
+
+if __name__ == "__main__":
+    main()
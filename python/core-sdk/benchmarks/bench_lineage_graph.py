@@ -0,0 +1,128 @@
+"""
+Compare the LineageGraph otype collapsing with the recursive filter it replaced, on
+lineage graphs from 10k to 1M nodes.
+
+The incremental collapser ("paged") is fed the same nodes in pages of 1000, as
+iter_lineage does. Graphs are layered like warehouse lineage, tables feeding ETL
+jobs feeding tables, with two neighbors per node. Time and peak traced memory are
+measured in separate runs. The recursive filter is skipped above --recursive-limit
+nodes since it needs gigabytes there.
+
+    python benchmarks/bench_lineage_graph.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import copy
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from alation_ai_agent_sdk.lineage_filtering import (
+    build_filtered_graph,
+    get_initial_graph_state,
+    get_node_object_key,
+    resolve_neighbors,
+)
+from alation_ai_agent_sdk.lineage_graph import LineageCollapser, LineageGraph
+
+
+def make_lineage_graph(node_count: int, layer_size: int = 500, seed: int = 7):
+    """
+    Top level nodes of a layered graph: layers of tables alternate with layers of
+    ETL jobs and dataflows, and each node points to two nodes of the next layer.
+    """
+    rng = random.Random(seed)
+
+    def otype(node_id):
+        if (node_id // layer_size) % 2 == 0:
+            return "table"
+        return "etl" if node_id % 3 else "dataflow"
+
+    def entry(node_id):
+        return {
+            "id": node_id,
+            "otype": otype(node_id),
+            "fully_qualified_name": f"7.warehouse.schema_{node_id % 40}.object_{node_id}",
+        }
+
+    nodes = []
+    for node_id in range(node_count):
+        node = entry(node_id)
+        node["is_temp"] = node_id % 7 == 0
+        next_layer = (node_id // layer_size + 1) * layer_size
+        node["neighbors"] = [
+            entry(target)
+            for target in {
+                rng.randrange(next_layer, next_layer + layer_size) for _ in range(2)
+            }
+            if target < node_count
+        ]
+        nodes.append(node)
+    return nodes
+
+
+def collapse(nodes):
+    return LineageGraph(nodes).collapse_to_otypes({"table"})
+
+
+def collapse_pages(nodes, page_size=1000):
+    collapser = LineageCollapser({"table"})
+    collapsed = []
+    for start in range(0, len(nodes), page_size):
+        collapsed += collapser.add_page(nodes[start : start + page_size])
+    return collapsed + collapser.flush()
+
+
+def recursive_collapse(nodes):
+    ordered_keys, key_to_node, visited = get_initial_graph_state(nodes)
+    for node in nodes:
+        resolve_neighbors(get_node_object_key(node), key_to_node, visited, {"table"})
+    kept_keys = {key for key in visited if key_to_node[key]["otype"] in {"table"}}
+    return build_filtered_graph(ordered_keys, kept_keys, key_to_node)
+
+
+def measure(func, nodes):
+    # The recursive filter changes the nodes it's given
+    nodes_copy = copy.deepcopy(nodes) if func is recursive_collapse else nodes
+    gc.collect()
+    started = time.perf_counter()
+    func(nodes_copy)
+    seconds = time.perf_counter() - started
+
+    nodes_copy = copy.deepcopy(nodes) if func is recursive_collapse else nodes
+    gc.collect()
+    tracemalloc.start()
+    func(nodes_copy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--recursive-limit", type=int, default=100_000)
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    print(f"{'nodes':>10}{'edges':>10}  {'filter':<12}{'seconds':>10}{'peak MiB':>10}")
+    for size in args.sizes:
+        nodes = make_lineage_graph(size)
+        edge_count = sum(len(node["neighbors"]) for node in nodes)
+        filters = [("LineageGraph", collapse), ("paged", collapse_pages)]
+        if size <= args.recursive_limit:
+            filters.append(("recursive", recursive_collapse))
+        for name, func in filters:
+            seconds, peak = measure(func, nodes)
+            print(
+                f"{size:>10}{edge_count:>10}  {name:<12}"
+                f"{seconds:>10.2f}{peak / 1024 / 1024:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
+import base64
+import json
+import threading
+import time
+
 import pytest
 import requests
+import urllib3
 from unittest.mock import MagicMock, patch
 
 from alation_ai_agent_sdk.api import (
@@ -9,13 +15,21 @@ from alation_ai_agent_sdk.api import (
     AUTH_METHOD_SESSION,
     DEFAULT_CONNECT_TIMEOUT_IN_SECONDS,
     DEFAULT_READ_TIMEOUT_IN_SECONDS,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    create_http_session,
+    get_jwt_expiry,
 )
+from alation_ai_agent_sdk.cache import TTLCache
 from alation_ai_agent_sdk.types import (
     ServiceAccountAuthParams,
     BearerTokenAuthParams,
     SessionAuthParams,
 )
 from alation_ai_agent_sdk.errors import AlationAPIError
+from alation_ai_agent_sdk.json_codec import JSONCodec
+from alation_ai_agent_sdk.retry import RetryPolicy
+from alation_ai_agent_sdk.sse import SSEEvent
 from alation_ai_agent_sdk.utils import SDK_VERSION
 
 
@@ -70,7 +84,7 @@ def session_api_instance():
 # --- Tests for _fetch_and_cache_instance_info ---
 
 
-@patch("alation_ai_agent_sdk.api.requests.get")
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
 def test_fetch_and_cache_instance_info_success(mock_get, api_instance):
     """Test successful fetching and caching of instance info."""
     # Mock successful license response
@@ -117,7 +131,7 @@ def test_fetch_and_cache_instance_info_success(mock_get, api_instance):
         }
 
 
-@patch("alation_ai_agent_sdk.api.requests.get")
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
 def test_fetch_and_cache_instance_info_license_failure(mock_get, api_instance):
     """Test handling of license fetch failure."""
     # Mock license failure
@@ -149,7 +163,7 @@ def test_fetch_and_cache_instance_info_license_failure(mock_get, api_instance):
         assert api_instance.alation_release_name == "2025.1.2"
 
 
-@patch("alation_ai_agent_sdk.api.requests.get")
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
 def test_fetch_and_cache_instance_info_version_failure(mock_get, api_instance):
     """Test handling of version fetch failure."""
     # Mock successful license response
@@ -181,6 +195,899 @@ def test_fetch_and_cache_instance_info_version_failure(mock_get, api_instance):
         assert api_instance.alation_version_info is None
 
 
+# --- Tests for lazy instance info ---
+
+
+def make_instance_info_get(calls, license_json=None, version_json=None):
+    """Session.get side effect serving the license and version endpoints."""
+
+    def get(url, **kwargs):
+        calls.append(url)
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        if "license" in url:
+            response.json.return_value = license_json or {"is_cloud": True}
+        else:
+            response.json.return_value = version_json or {
+                "ALATION_RELEASE_NAME": "2025.1.2"
+            }
+        return response
+
+    return get
+
+
+def make_lazy_api(**kwargs):
+    return AlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_BEARER_TOKEN,
+        auth_params=BearerTokenAuthParams(MOCK_ACCESS_TOKEN),
+        **kwargs,
+    )
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_instance_info_fetched_once_on_first_access(mock_get):
+    """Test that the constructor does no I/O and info is fetched on first use."""
+    calls = []
+    mock_get.side_effect = make_instance_info_get(calls)
+
+    api = make_lazy_api()
+    assert calls == []
+
+    assert api.alation_release_name == "2025.1.2"
+    assert api.is_cloud is True
+    assert api.alation_version_info == {"ALATION_RELEASE_NAME": "2025.1.2"}
+    assert sorted(calls) == [
+        f"{MOCK_BASE_URL}/api/v1/license",
+        f"{MOCK_BASE_URL}/full_version",
+    ]
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_skip_instance_info_never_fetches(mock_get):
+    api = make_lazy_api(skip_instance_info=True)
+
+    assert api.alation_release_name is None
+    assert api.is_cloud is None
+    mock_get.assert_not_called()
+
+
+def test_failed_instance_info_fetch_is_not_retried_on_every_access():
+    """Test that properties don't raise, or refetch until the retry interval passes."""
+    api = make_lazy_api()
+
+    with patch.object(
+        api, "_fetch_and_cache_instance_info", side_effect=AlationAPIError("401")
+    ) as mock_fetch:
+        assert api.alation_release_name is None
+        assert api.is_cloud is None
+        mock_fetch.assert_called_once()
+
+        api._instance_info_retry_at = time.monotonic()
+        with pytest.raises(AlationAPIError):
+            api.ensure_instance_info()
+        assert mock_fetch.call_count == 2
+        assert api._instance_info_retry_at > time.monotonic()
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_instance_info_requests_run_concurrently(mock_get):
+    """Test that the license and version requests are in flight at the same time."""
+    calls = []
+    serve = make_instance_info_get(calls)
+    both_started = threading.Barrier(2, timeout=5)
+
+    def get(url, **kwargs):
+        both_started.wait()
+        return serve(url, **kwargs)
+
+    mock_get.side_effect = get
+
+    api = make_lazy_api()
+    api.ensure_instance_info()
+
+    assert api.is_cloud is True
+    assert api.alation_release_name == "2025.1.2"
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_concurrent_access_shares_one_fetch(mock_get):
+    calls = []
+    mock_get.side_effect = make_instance_info_get(calls)
+    api = make_lazy_api()
+
+    threads = [
+        threading.Thread(target=lambda: api.alation_release_name) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_persisted_instance_info_skips_fetch(mock_get, tmp_path):
+    """Test that a second process reads the instance info from disk."""
+    calls = []
+    mock_get.side_effect = make_instance_info_get(calls)
+
+    first = make_lazy_api(
+        persist_instance_info=True, instance_info_cache_dir=str(tmp_path)
+    )
+    assert first.alation_release_name == "2025.1.2"
+    assert len(calls) == 2
+
+    second = make_lazy_api(
+        persist_instance_info=True, instance_info_cache_dir=str(tmp_path)
+    )
+    assert second.alation_release_name == "2025.1.2"
+    assert second.is_cloud is True
+    assert len(calls) == 2
+
+    other_instance = AlationAPI(
+        base_url="https://other-instance.com",
+        auth_method=AUTH_METHOD_BEARER_TOKEN,
+        auth_params=BearerTokenAuthParams(MOCK_ACCESS_TOKEN),
+        persist_instance_info=True,
+        instance_info_cache_dir=str(tmp_path),
+    )
+    other_instance.ensure_instance_info()
+    assert len(calls) == 4
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_expired_persisted_instance_info_is_refetched(mock_get, tmp_path):
+    calls = []
+    mock_get.side_effect = make_instance_info_get(calls)
+    options = {
+        "persist_instance_info": True,
+        "instance_info_cache_dir": str(tmp_path),
+        "instance_info_cache_ttl": 60,
+    }
+
+    with patch("alation_ai_agent_sdk.cache.time.time", return_value=1000.0):
+        make_lazy_api(**options).ensure_instance_info()
+    with patch("alation_ai_agent_sdk.cache.time.time", return_value=1061.0):
+        make_lazy_api(**options).ensure_instance_info()
+
+    assert len(calls) == 4
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_shared_instance_info_cache(mock_get):
+    """Test that instances sharing a cache fetch the instance info once."""
+    calls = []
+    mock_get.side_effect = make_instance_info_get(calls)
+    cache = TTLCache(maxsize=4, ttl=60)
+
+    make_lazy_api(instance_info_cache=cache).ensure_instance_info()
+    api = make_lazy_api(instance_info_cache=cache)
+
+    assert api.alation_release_name == "2025.1.2"
+    assert api.is_cloud is True
+    assert len(calls) == 2
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_partial_instance_info_is_not_persisted(mock_get, tmp_path):
+    def get(url, **kwargs):
+        response = MagicMock()
+        if "license" in url:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError("403")
+        else:
+            response.raise_for_status.return_value = None
+            response.json.return_value = {"ALATION_RELEASE_NAME": "2025.1.2"}
+        return response
+
+    mock_get.side_effect = get
+
+    api = make_lazy_api(
+        persist_instance_info=True, instance_info_cache_dir=str(tmp_path)
+    )
+    assert api.alation_release_name == "2025.1.2"
+    assert api.is_cloud is None
+    assert list(tmp_path.iterdir()) == []
+
+
+# --- Tests for the pooled HTTP session ---
+
+
+def test_http_session_is_reused_across_requests(api_instance):
+    """Test that all endpoints share a single pooled session."""
+    first = api_instance._get_http_session()
+    second = api_instance._get_http_session()
+
+    assert first is second
+    adapter = first.get_adapter(MOCK_BASE_URL)
+    assert adapter is api_instance._http_adapter
+    assert adapter._pool_connections == DEFAULT_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
+
+
+def test_http_session_pool_options():
+    """Test that pool sizing options are applied to the mounted adapter."""
+    api = AlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_BEARER_TOKEN,
+        auth_params=BearerTokenAuthParams(MOCK_ACCESS_TOKEN),
+        skip_instance_info=True,
+        pool_connections=2,
+        pool_maxsize=32,
+        keepalive_idle_timeout=5,
+    )
+
+    adapter = api._get_http_session().get_adapter(MOCK_BASE_URL)
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert api.keepalive_idle_timeout == 5
+
+
+def test_http_session_drops_idle_connections(api_instance):
+    """Test that only connections idle past the keep-alive timeout are closed."""
+    api_instance.keepalive_idle_timeout = 30
+    api_instance._get_http_session()
+    pool = api_instance._http_adapter.poolmanager.connection_from_url(MOCK_BASE_URL)
+    idle, in_use = pool._get_conn(), pool._get_conn()
+    pool._put_conn(idle)
+
+    # The connections never connected, which urllib3 would take for dropped ones
+    with (
+        patch("urllib3.connectionpool.is_connection_dropped", return_value=False),
+        patch.object(idle, "close") as close_idle,
+        patch.object(in_use, "close") as close_in_use,
+    ):
+        assert pool._get_conn() is idle
+        close_idle.assert_not_called()
+
+        pool._put_conn(idle)
+        idle._idle_since -= 31
+        assert pool._get_conn() is idle
+        close_idle.assert_called_once()
+        close_in_use.assert_not_called()
+
+
+def test_close_releases_session(api_instance):
+    """Test that close() closes the session and a new one is created on next use."""
+    session = api_instance._get_http_session()
+
+    with patch.object(session, "close") as mock_close:
+        api_instance.close()
+        mock_close.assert_called_once()
+
+    assert api_instance._session is None
+    assert api_instance._get_http_session() is not session
+
+
+def test_shared_http_session_is_used_and_left_open():
+    session = create_http_session(pool_maxsize=32)
+    api = AlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_BEARER_TOKEN,
+        auth_params=BearerTokenAuthParams(MOCK_ACCESS_TOKEN),
+        skip_instance_info=True,
+        http_session=session,
+    )
+
+    assert api._get_http_session() is session
+    assert session.get_adapter(MOCK_BASE_URL)._pool_maxsize == 32
+    with patch.object(session, "close") as mock_close:
+        api.close()
+        mock_close.assert_not_called()
+    assert api._get_http_session() is session
+
+
+def test_context_manager_closes_session():
+    """Test that AlationAPI can be used as a context manager."""
+    with AlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_BEARER_TOKEN,
+        auth_params=BearerTokenAuthParams(MOCK_ACCESS_TOKEN),
+        skip_instance_info=True,
+    ) as api:
+        api._get_http_session()
+        assert api._session is not None
+
+    assert api._session is None
+
+
+# --- Tests for local token expiry tracking ---
+
+
+def make_jwt(claims):
+    """Build an unsigned JWT carrying the given claims."""
+
+    def encode(segment):
+        return base64.urlsafe_b64encode(json.dumps(segment).encode()).rstrip(b"=")
+
+    return b".".join([encode({"alg": "none"}), encode(claims), b""]).decode()
+
+
+def test_get_jwt_expiry():
+    """Test reading the exp claim from a JWT."""
+    assert get_jwt_expiry(make_jwt({"exp": 1700000000})) == 1700000000.0
+    assert get_jwt_expiry(make_jwt({"sub": "no-exp"})) is None
+    assert get_jwt_expiry("opaque-token") is None
+    assert get_jwt_expiry(None) is None
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_generate_jwt_token_records_expires_in(mock_post, api_instance):
+    """Test that the token expiry is recorded from expires_in."""
+    mock_post.return_value.json.return_value = {
+        "access_token": "new-token",
+        "expires_in": 3600,
+    }
+
+    with patch("alation_ai_agent_sdk.api.time.time", return_value=1000.0):
+        api_instance._generate_jwt_token()
+
+    assert api_instance.access_token == "new-token"
+    assert api_instance.access_token_expires_at == 4600.0
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_generate_jwt_token_records_exp_claim(mock_post, api_instance):
+    """Test that the token expiry falls back to the JWT exp claim."""
+    token = make_jwt({"exp": 1700000000})
+    mock_post.return_value.json.return_value = {"access_token": token}
+
+    api_instance._generate_jwt_token()
+
+    assert api_instance.access_token_expires_at == 1700000000.0
+
+
+def test_with_valid_auth_trusts_local_expiry(api_instance):
+    """Test that no server round-trip happens while the token is fresh."""
+    api_instance.access_token_expires_at = time.time() + 3600
+
+    with (
+        patch.object(api_instance, "_token_is_valid_on_server") as mock_valid,
+        patch.object(api_instance, "_generate_new_token") as mock_generate,
+    ):
+        api_instance._with_valid_auth()
+
+    mock_valid.assert_not_called()
+    mock_generate.assert_not_called()
+
+
+def test_with_valid_auth_regenerates_near_expiry(api_instance):
+    """Test that a token within the safety margin is re-minted."""
+    api_instance.token_expiry_margin = 60
+    api_instance.access_token_expires_at = time.time() + 30
+
+    with (
+        patch.object(api_instance, "_token_is_valid_on_server") as mock_valid,
+        patch.object(api_instance, "_generate_new_token") as mock_generate,
+    ):
+        api_instance._with_valid_auth()
+
+    mock_valid.assert_not_called()
+    mock_generate.assert_called_once()
+
+
+def test_with_valid_auth_validates_on_server_when_enabled(api_instance):
+    """Test that validate_token_on_server introspects even a fresh token."""
+    api_instance.validate_token_on_server = True
+    api_instance.access_token_expires_at = time.time() + 3600
+
+    with (
+        patch.object(
+            api_instance, "_token_is_valid_on_server", return_value=True
+        ) as mock_valid,
+        patch.object(api_instance, "_generate_new_token") as mock_generate,
+    ):
+        api_instance._with_valid_auth()
+
+    mock_valid.assert_called_once()
+    mock_generate.assert_not_called()
+
+
+def test_with_valid_auth_validates_on_server_when_expiry_unknown(api_instance):
+    """Test that tokens without a known expiry fall back to introspection."""
+    assert api_instance.access_token_expires_at is None
+
+    with (
+        patch.object(
+            api_instance, "_token_is_valid_on_server", return_value=False
+        ) as mock_valid,
+        patch.object(api_instance, "_generate_new_token") as mock_generate,
+    ):
+        api_instance._with_valid_auth()
+
+    mock_valid.assert_called_once()
+    mock_generate.assert_called_once()
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_send_request_remints_token_on_unauthorized(mock_get, api_instance):
+    """Test that a 401 re-mints the token and retries the request once."""
+    unauthorized = MagicMock(status_code=401)
+    ok = MagicMock(status_code=200)
+    mock_get.side_effect = [unauthorized, ok]
+
+    def remint():
+        api_instance.access_token = "fresh-token"
+
+    with patch.object(
+        api_instance, "_generate_new_token", side_effect=remint
+    ) as mock_generate:
+        response = api_instance._send_request("get", f"{MOCK_BASE_URL}/x")
+
+    assert response is ok
+    mock_generate.assert_called_once()
+    unauthorized.close.assert_called_once()
+    assert mock_get.call_args_list[1][1]["headers"]["Token"] == "fresh-token"
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_send_request_does_not_remint_bearer_token(mock_get, bearer_token_api_instance):
+    """Test that caller-supplied bearer tokens are never re-minted."""
+    mock_get.return_value = MagicMock(status_code=401)
+
+    with patch.object(
+        bearer_token_api_instance, "_generate_new_token"
+    ) as mock_generate:
+        response = bearer_token_api_instance._send_request("get", f"{MOCK_BASE_URL}/x")
+
+    assert response.status_code == 401
+    mock_generate.assert_not_called()
+    assert mock_get.call_count == 1
+
+
+# --- Tests for single-flight and background token refresh ---
+
+
+def test_concurrent_expired_token_refreshes_once(api_instance):
+    """Test that threads seeing the same expired token share a single mint."""
+    api_instance.access_token_expires_at = time.time() - 10
+    mint_started = threading.Event()
+    release_mint = threading.Event()
+    mint_count = 0
+
+    def slow_mint():
+        nonlocal mint_count
+        mint_count += 1
+        mint_started.set()
+        release_mint.wait(timeout=5)
+        api_instance.access_token_expires_at = time.time() + 3600
+        api_instance.access_token = "fresh-token"
+
+    with patch.object(api_instance, "_generate_new_token", side_effect=slow_mint):
+        threads = [
+            threading.Thread(target=api_instance._with_valid_auth) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        assert mint_started.wait(timeout=5)
+        release_mint.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert mint_count == 1
+    assert api_instance.access_token == "fresh-token"
+
+
+def test_refresh_access_token_skips_when_already_replaced(api_instance):
+    """Test that a refresh for a token that was already replaced is a no-op."""
+    api_instance.access_token = "fresh-token"
+
+    with patch.object(api_instance, "_generate_new_token") as mock_generate:
+        api_instance._refresh_access_token("stale-token")
+
+    mock_generate.assert_not_called()
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_background_token_refresh_scheduled_after_mint(mock_post, api_instance):
+    """Test that a timer is scheduled ahead of expiry and cancelled on close."""
+    api_instance.background_token_refresh = True
+    mock_post.return_value.json.return_value = {
+        "access_token": "new-token",
+        "expires_in": 3600,
+    }
+
+    with patch("alation_ai_agent_sdk.api.threading.Timer") as mock_timer:
+        api_instance._generate_jwt_token()
+
+        delay = mock_timer.call_args[0][0]
+        assert 0 < delay < 3600 - api_instance.token_expiry_margin
+        assert mock_timer.call_args[1]["args"] == ("new-token",)
+        mock_timer.return_value.start.assert_called_once()
+
+        api_instance.close()
+
+    mock_timer.return_value.cancel.assert_called_once()
+    assert api_instance._token_refresh_timer is None
+
+
+@pytest.mark.parametrize("expires_in", [30, 90, 120])
+def test_short_lived_token_refreshed_before_expiry_margin(api_instance, expires_in):
+    """Test that the refresh of a short-lived token isn't left to requests."""
+    api_instance.access_token_expires_at = time.time() + expires_in
+
+    with patch("alation_ai_agent_sdk.api.threading.Timer") as mock_timer:
+        api_instance._schedule_background_token_refresh()
+
+    delay = mock_timer.call_args[0][0]
+    assert delay <= max(expires_in - api_instance.token_expiry_margin, 1.0)
+    assert delay <= expires_in
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_background_token_refresh_disabled_by_default(mock_post, api_instance):
+    """Test that no timer is scheduled unless background refresh is enabled."""
+    mock_post.return_value.json.return_value = {
+        "access_token": "new-token",
+        "expires_in": 3600,
+    }
+
+    with patch("alation_ai_agent_sdk.api.threading.Timer") as mock_timer:
+        api_instance._generate_jwt_token()
+
+    mock_timer.assert_not_called()
+
+
+def test_background_token_refresh_failure_is_logged(api_instance):
+    """Test that a failed background refresh does not raise."""
+    with patch.object(
+        api_instance,
+        "_generate_new_token",
+        side_effect=AlationAPIError("boom"),
+    ):
+        api_instance._background_token_refresh(api_instance.access_token)
+
+
+# --- Tests for the instruction cache ---
+
+
+@pytest.fixture
+def caching_api_instance(api_instance):
+    """The service account AlationAPI with the instruction cache enabled."""
+    api_instance.instruction_cache = TTLCache(maxsize=64, ttl=900)
+    return api_instance
+
+
+def make_sse_response(*events):
+    response = MagicMock(status_code=200, headers={})
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [
+        f"data: {json.dumps(event)}\n\n".encode() for event in events
+    ]
+    return response
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_instruction_endpoint_served_from_cache(mock_post, caching_api_instance):
+    """Test that repeated instruction calls skip the SSE round-trip."""
+    api_instance = caching_api_instance
+    api_instance.access_token_expires_at = time.time() + 3600
+    mock_post.side_effect = lambda *a, **kw: make_sse_response({"content": "guide"})
+
+    first = next(api_instance.generate_data_product_stream())
+    first["content"] = "mutated by caller"
+    second = next(api_instance.generate_data_product_stream())
+
+    assert second == {"content": "guide"}
+    assert mock_post.call_count == 1
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_instruction_calls_in_a_chat_are_not_cached(mock_post, caching_api_instance):
+    """Test that calls with a chat_id always reach the server."""
+    api_instance = caching_api_instance
+    api_instance.access_token_expires_at = time.time() + 3600
+    mock_post.side_effect = lambda *a, **kw: make_sse_response({"content": "guide"})
+
+    next(api_instance.generate_data_product_stream())
+    next(api_instance.generate_data_product_stream(chat_id="chat-1"))
+    next(api_instance.generate_data_product_stream(chat_id="chat-1"))
+
+    assert mock_post.call_count == 3
+    assert mock_post.call_args.args[0].endswith("?chat_id=chat-1")
+    assert len(api_instance.instruction_cache) == 1
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_streamed_events_mutated_by_caller_are_not_cached(
+    mock_post, caching_api_instance
+):
+    """Test that the streaming path caches copies of the events it yields."""
+    api_instance = caching_api_instance
+    api_instance.enable_streaming = True
+    api_instance.access_token_expires_at = time.time() + 3600
+    mock_post.side_effect = lambda *a, **kw: make_sse_response({"step": 1})
+
+    for event in api_instance.get_data_dictionary_instructions_stream():
+        event["step"] = "mutated by caller"
+
+    assert list(api_instance.get_data_dictionary_instructions_stream()) == [{"step": 1}]
+    assert mock_post.call_count == 1
+
+
+def test_instruction_cache_is_off_by_default(api_instance):
+    """Test that the instruction cache is opt-in."""
+    assert api_instance.instruction_cache is None
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_instruction_cache_is_keyed_by_auth_identity(
+    mock_post, caching_api_instance, bearer_token_api_instance
+):
+    """Test that a shared cache never serves one identity's response to another."""
+    api_instance = caching_api_instance
+    bearer_token_api_instance.instruction_cache = api_instance.instruction_cache
+    api_instance.access_token_expires_at = time.time() + 3600
+    mock_post.side_effect = lambda *a, **kw: make_sse_response({"content": "guide"})
+
+    next(api_instance.get_custom_field_definitions_stream())
+    next(bearer_token_api_instance.get_custom_field_definitions_stream())
+
+    assert mock_post.call_count == 2
+    assert len(api_instance.instruction_cache) == 2
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_invalidate_instruction_cache(mock_post, caching_api_instance):
+    """Test that invalidation forces the next call to refetch."""
+    api_instance = caching_api_instance
+    api_instance.access_token_expires_at = time.time() + 3600
+    mock_post.side_effect = lambda *a, **kw: make_sse_response({"content": "guide"})
+
+    next(api_instance.get_signature_creation_instructions_stream())
+    assert api_instance.invalidate_instruction_cache() == 1
+    next(api_instance.get_signature_creation_instructions_stream())
+
+    assert mock_post.call_count == 2
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_partially_consumed_stream_is_not_cached(mock_post, caching_api_instance):
+    """Test that streaming responses are cached only once fully consumed."""
+    api_instance = caching_api_instance
+    api_instance.enable_streaming = True
+    api_instance.access_token_expires_at = time.time() + 3600
+    mock_post.side_effect = lambda *a, **kw: make_sse_response({"step": 1}, {"step": 2})
+
+    stream = api_instance.get_data_dictionary_instructions_stream()
+    next(stream)
+    stream.close()
+    assert len(api_instance.instruction_cache) == 0
+
+    events = list(api_instance.get_data_dictionary_instructions_stream())
+    cached_events = list(api_instance.get_data_dictionary_instructions_stream())
+
+    assert events == cached_events == [{"step": 1}, {"step": 2}]
+    assert mock_post.call_count == 2
+
+
+def test_instruction_cache_disabled_with_zero_ttl():
+    """Test that a TTL of 0 disables the instruction cache."""
+    api = AlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_BEARER_TOKEN,
+        auth_params=BearerTokenAuthParams(MOCK_ACCESS_TOKEN),
+        skip_instance_info=True,
+        instruction_cache_ttl=0,
+    )
+
+    assert api.instruction_cache is None
+    assert api.invalidate_instruction_cache() == 0
+
+
+# --- Tests for the JSON codec ---
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_request_body_encoded_with_json_codec(mock_post, api_instance):
+    """Test that json= bodies are encoded by the configured codec."""
+    api_instance.json_codec = JSONCodec()
+    mock_post.return_value = MagicMock(status_code=200)
+
+    api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={"a": [1, 2]})
+
+    kwargs = mock_post.call_args.kwargs
+    assert "json" not in kwargs
+    assert kwargs["data"] == b'{"a":[1,2]}'
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_sse_events_decoded_with_json_codec(api_instance):
+    codec = MagicMock(wraps=JSONCodec())
+    api_instance.json_codec = codec
+
+    result = api_instance._decode_sse_event(SSEEvent(b'{"a": 1}'))
+
+    assert result == {"a": 1}
+    codec.loads.assert_called_once_with(b'{"a": 1}')
+
+
+# --- Tests for the retry policy ---
+
+
+def make_http_response(status_code, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body if body is not None else {}).encode()
+    response.headers.update(headers or {})
+    response.raw = MagicMock(chunked=False)
+    return response
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_send_request_retries_unavailable(mock_post, mock_sleep, api_instance):
+    """Test that a 503 is retried and the next response returned."""
+    mock_post.side_effect = [make_http_response(503), make_http_response(200)]
+
+    response = api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    assert response.status_code == 200
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_send_request_honors_retry_after(mock_post, mock_sleep, api_instance):
+    """Test that Retry-After sets the delay before retrying a 429."""
+    api_instance.retry_policy = RetryPolicy(jitter=False)
+    mock_post.side_effect = [
+        make_http_response(429, {"detail": "slow down"}, {"Retry-After": "2"}),
+        make_http_response(200),
+    ]
+
+    api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_send_request_does_not_retry_quota_error(mock_post, mock_sleep, api_instance):
+    """Test that an exhausted quota is returned without retrying."""
+    mock_post.return_value = make_http_response(
+        429, {"error": "Entitlement limit exceeded"}
+    )
+
+    response = api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    assert response.status_code == 429
+    mock_post.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_send_request_gives_up_on_connection_errors(mock_get, mock_sleep, api_instance):
+    """Test that connection errors are retried up to max_attempts, then raised."""
+    mock_get.side_effect = requests.exceptions.ConnectionError("refused")
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        api_instance._send_request("get", f"{MOCK_BASE_URL}/x")
+
+    assert mock_get.call_count == api_instance.retry_policy.max_attempts
+    assert mock_sleep.call_count == api_instance.retry_policy.max_attempts - 1
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_post_not_retried_after_bad_gateway(mock_post, mock_sleep, api_instance):
+    """Test that a POST the server may have processed is not sent again."""
+    mock_post.return_value = make_http_response(502)
+
+    response = api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    assert response.status_code == 502
+    mock_post.assert_called_once()
+
+    api_instance.retry_policy = RetryPolicy(retry_non_idempotent=True)
+    mock_post.side_effect = [make_http_response(502), make_http_response(200)]
+
+    response = api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    assert response.status_code == 200
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_post_retried_only_when_connection_not_opened(
+    mock_post, mock_sleep, api_instance
+):
+    """Test that a POST is retried after a failed connect but not a dropped one."""
+    refused = urllib3.exceptions.MaxRetryError(
+        None, "/x", urllib3.exceptions.NewConnectionError(None, "refused")
+    )
+    mock_post.side_effect = [
+        requests.exceptions.ConnectionError(refused),
+        make_http_response(200),
+    ]
+
+    response = api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    assert response.status_code == 200
+    assert mock_post.call_count == 2
+
+    mock_post.reset_mock()
+    mock_post.side_effect = requests.exceptions.ConnectionError(
+        urllib3.exceptions.ProtocolError("Connection aborted.")
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        api_instance._send_request("post", f"{MOCK_BASE_URL}/x", json={})
+
+    mock_post.assert_called_once()
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_sse_request_retried_before_first_byte(mock_post, mock_sleep, api_instance):
+    """Test that an SSE stream rejected with a 503 is sent again."""
+    stream_response = make_http_response(200)
+    stream_response.iter_content = MagicMock(return_value=iter([b'data: {"a": 1}\n\n']))
+    mock_post.side_effect = [make_http_response(503), stream_response]
+
+    with patch.object(api_instance, "_with_valid_auth"):
+        result = list(
+            api_instance._safe_sse_post_request(
+                tool_name="test_tool",
+                url=f"{MOCK_BASE_URL}/stream",
+                payload={"query": "test"},
+            )
+        )
+
+    assert result == [{"a": 1}]
+    assert mock_post.call_count == 2
+
+
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_post_tool_event_uses_max_retries(mock_post, mock_sleep, api_instance):
+    """Test that tool events are attempted max_retries + 1 times."""
+    mock_post.return_value = make_http_response(503)
+
+    with (
+        patch.object(api_instance, "_with_valid_auth"),
+        pytest.raises(AlationAPIError) as exc_info,
+    ):
+        api_instance.post_tool_event({"tool_name": "t"}, timeout=5, max_retries=2)
+
+    assert exc_info.value.status_code == 503
+    assert mock_post.call_count == 3
+
+
+@pytest.mark.parametrize("status_code", [503, 429])
+@patch("alation_ai_agent_sdk.api.time.sleep")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_post_tool_events_stops_on_server_error(
+    mock_post, mock_sleep, api_instance, status_code
+):
+    """Test that a batch ends at the first event the server could not take."""
+    mock_post.return_value = make_http_response(status_code)
+    events = [{"tool_name": f"t{i}"} for i in range(5)]
+
+    with patch.object(api_instance, "_with_valid_auth"):
+        sent = api_instance.post_tool_events(events, timeout=5, max_retries=0)
+
+    assert sent == 0
+    assert mock_post.call_count == 1
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_post_tool_events_skips_rejected_event(mock_post, api_instance):
+    """Test that an event the server rejects does not end the batch."""
+    mock_post.side_effect = [make_http_response(400), make_http_response(200)]
+    events = [{"tool_name": "bad"}, {"tool_name": "good"}]
+
+    with patch.object(api_instance, "_with_valid_auth"):
+        sent = api_instance.post_tool_events(events, timeout=5, max_retries=0)
+
+    assert sent == 1
+    assert mock_post.call_count == 2
+
+
 # --- Tests for _get_response_meta ---
 
 
@@ -475,12 +1382,10 @@ def test_iter_sse_response_success(api_instance):
     """Test successful iteration over SSE response."""
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
-    mock_response.iter_lines.return_value = [
-        b'data: {"event": "start", "data": "test1"}',
-        b"",
-        b'data: {"event": "end", "data": "test2"}',
-        b"event: heartbeat",
-        b'data: {"event": "final", "data": "test3"}',
+    mock_response.iter_content.return_value = [
+        b'data: {"event": "start", "data": "test1"}\n\n',
+        b'data: {"event": "end", "data": "test2"}\n\n: heartbeat\n\n',
+        b'event: final\ndata: {"event": "final", "data": "test3"}\n\n',
     ]
 
     result = list(api_instance._iter_sse_response(mock_response))
@@ -497,10 +1402,10 @@ def test_iter_sse_response_invalid_json(api_instance):
     """Test handling of invalid JSON in SSE response."""
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
-    mock_response.iter_lines.return_value = [
-        b'data: {"valid": "json"}',
-        b"data: invalid json string",
-        b'data: {"another": "valid"}',
+    mock_response.iter_content.return_value = [
+        b'data: {"valid": "json"}\n\n',
+        b"data: invalid json string\n\n",
+        b'data: {"another": "valid"}\n\n',
     ]
 
     result = list(api_instance._iter_sse_response(mock_response))
@@ -513,11 +1418,11 @@ def test_iter_sse_response_empty_lines(api_instance):
     """Test handling of empty lines in SSE response."""
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
-    mock_response.iter_lines.return_value = [
-        b"",
-        b'data: {"test": "data"}',
-        b"",
-        b"",
+    mock_response.iter_content.return_value = [
+        b"\n",
+        b'data: {"test": "data"}\n',
+        b"\n",
+        b"\n",
         b'data: {"more": "data"}',
     ]
 
@@ -538,6 +1443,21 @@ def test_iter_sse_response_http_error(api_instance):
         list(api_instance._iter_sse_response(mock_response))
 
 
+def test_iter_sse_response_multi_line_data(api_instance):
+    """Test that multi-line data fields split across chunks form one event."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.iter_content.return_value = [
+        b'id: 1\r\ndata: {"parts":\r\ndata:',
+        b' ["a", "b"]}\r',
+        b"\n\r\n",
+    ]
+
+    result = list(api_instance._iter_sse_response(mock_response))
+
+    assert result == [{"parts": ["a", "b"]}]
+
+
 # --- Tests for _sse_stream_or_last_event ---
 
 
@@ -567,33 +1487,61 @@ def test_sse_stream_or_last_event_non_streaming_mode(api_instance):
     mock_response = MagicMock()
 
     test_events = [
-        {"event": "start", "data": "test1"},
-        {"event": "middle", "data": "test2"},
-        {"event": "end", "data": "test3"},
+        SSEEvent(b'{"event": "start", "data": "test1"}'),
+        SSEEvent(b'{"event": "middle", "data": "test2"}'),
+        SSEEvent(b'{"event": "end", "data": "test3"}'),
     ]
 
-    with patch.object(
-        api_instance, "_iter_sse_response", return_value=iter(test_events)
+    with (
+        patch.object(api_instance, "_iter_sse_events", return_value=iter(test_events)),
+        patch.object(
+            api_instance, "_decode_sse_event", wraps=api_instance._decode_sse_event
+        ) as spy_decode,
     ):
         result = list(api_instance._sse_stream_or_last_event(mock_response))
 
     assert result == [{"event": "end", "data": "test3"}]
+    # Intermediate events are never decoded
+    spy_decode.assert_called_once_with(test_events[-1])
 
 
 def test_sse_stream_or_last_event_empty_response(api_instance):
     """Test SSE streaming with empty response."""
     mock_response = MagicMock()
 
-    with patch.object(api_instance, "_iter_sse_response", return_value=iter([])):
+    with patch.object(api_instance, "_iter_sse_events", return_value=iter([])):
         result = list(api_instance._sse_stream_or_last_event(mock_response))
 
     assert result == [None]
 
 
+def test_sse_stream_event_types_filter(api_instance):
+    """Test that stream_event_types skips events of other types in both modes."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.iter_content.return_value = [
+        b'event: delta\ndata: {"delta": 1}\n\n',
+        b'event: result\ndata: {"result": 1}\n\n',
+        b'event: delta\ndata: {"delta": 2}\n\n',
+        b"event: delta\ndata: not json\n\n",
+    ]
+    api_instance.stream_event_types = frozenset({"result"})
+
+    api_instance.enable_streaming = True
+    assert list(api_instance._sse_stream_or_last_event(mock_response)) == [
+        {"result": 1}
+    ]
+
+    api_instance.enable_streaming = False
+    assert list(api_instance._sse_stream_or_last_event(mock_response)) == [
+        {"result": 1}
+    ]
+
+
 # --- Tests for _safe_sse_post_request ---
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_safe_sse_post_request_success(mock_post, api_instance):
     """Test successful SSE POST request."""
     # Mock response
@@ -631,7 +1579,7 @@ def test_safe_sse_post_request_success(mock_post, api_instance):
     mock_post.assert_called_once()
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_safe_sse_post_request_with_response_meta(mock_post, api_instance):
     """Test SSE POST request with response meta information."""
     # Mock response
@@ -668,7 +1616,7 @@ def test_safe_sse_post_request_with_response_meta(mock_post, api_instance):
     assert result == test_events
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_safe_sse_post_request_read_timeout(mock_post, api_instance):
     """Test handling of read timeout in SSE POST request."""
     mock_post.side_effect = requests.exceptions.ReadTimeout("Read timeout")
@@ -697,7 +1645,7 @@ def test_safe_sse_post_request_read_timeout(mock_post, api_instance):
         mock_handle_error.assert_called_once()
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_safe_sse_post_request_connect_timeout(mock_post, api_instance):
     """Test handling of connection timeout in SSE POST request."""
     mock_post.side_effect = requests.exceptions.ConnectTimeout("Connection timeout")
@@ -726,7 +1674,7 @@ def test_safe_sse_post_request_connect_timeout(mock_post, api_instance):
         mock_handle_error.assert_called_once()
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_safe_sse_post_request_general_request_exception(mock_post, api_instance):
     """Test handling of general request exception in SSE POST request."""
     mock_post.side_effect = requests.exceptions.RequestException("General error")
@@ -775,6 +1723,103 @@ def test_safe_sse_post_request_disallowed_auth_method(api_instance):
         )
 
 
+# --- Tests for phase timings ---
+
+SSE_PHASES = {"auth", "request", "first_byte", "stream", "decode", "total"}
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_safe_sse_post_request_records_phase_timings(mock_post, api_instance):
+    """Test that the last event of a non-streaming call carries the timings."""
+    api_instance.record_phase_timings = True
+    api_instance.phase_timings_callback = MagicMock()
+    mock_post.return_value = make_sse_response({"step": 1}, {"step": 2})
+
+    with patch.object(api_instance, "_with_valid_auth"):
+        result = list(
+            api_instance._safe_sse_post_request(
+                tool_name="test_tool", url="https://test.com/api", payload={}
+            )
+        )
+
+    timings = result[0]["_meta"]["timings"]
+    assert result == [{"step": 2, "_meta": {"timings": timings}}]
+    assert set(timings) == SSE_PHASES
+    assert all(value >= 0 for value in timings.values())
+    api_instance.phase_timings_callback.assert_called_once_with("test_tool", timings)
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_streamed_phase_timings_go_to_callback(mock_post, api_instance):
+    """Test that streamed events are left alone and the callback runs at the end."""
+    api_instance.enable_streaming = True
+    callback = MagicMock()
+    api_instance.phase_timings_callback = callback
+    mock_post.return_value = make_sse_response({"step": 1}, {"step": 2})
+
+    with patch.object(api_instance, "_with_valid_auth"):
+        stream = api_instance._safe_sse_post_request(
+            tool_name="test_tool", url="https://test.com/api", payload={}
+        )
+        assert next(stream) == {"step": 1}
+        callback.assert_not_called()
+        assert list(stream) == [{"step": 2}]
+
+    name, timings = callback.call_args.args
+    assert name == "test_tool"
+    assert set(timings) == SSE_PHASES
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_phase_timings_are_off_by_default(mock_post, api_instance):
+    """Test that no timings are recorded unless enabled."""
+    mock_post.return_value = make_sse_response({"step": 1})
+
+    with (
+        patch.object(api_instance, "_with_valid_auth"),
+        patch("alation_ai_agent_sdk.api.PhaseTimings") as mock_timings,
+    ):
+        result = list(
+            api_instance._safe_sse_post_request(
+                tool_name="test_tool", url="https://test.com/api", payload={}
+            )
+        )
+
+    assert result == [{"step": 1}]
+    mock_timings.assert_not_called()
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_get_context_from_catalog_records_phase_timings(mock_get, api_instance):
+    """Test that REST results get the timings next to the entitlement headers."""
+    api_instance.record_phase_timings = True
+    mock_get.return_value = make_http_response(
+        200, {"results": []}, {"X-Entitlement-Warning": "Approaching limit"}
+    )
+
+    with patch.object(api_instance, "_with_valid_auth"):
+        result = api_instance.get_context_from_catalog("tables")
+
+    meta = result["_meta"]
+    assert meta["headers"]["X-Entitlement-Warning"] == "Approaching limit"
+    assert set(meta["timings"]) == {"auth", "request", "decode", "total"}
+
+
+def test_phase_timings_callback_errors_are_logged(api_instance):
+    """Test that a failing callback doesn't fail the call."""
+    api_instance.phase_timings_callback = MagicMock(side_effect=RuntimeError("boom"))
+    mock_response = MagicMock(status_code=200)
+    mock_response.json.return_value = {"data": "test"}
+    timings = api_instance._start_phase_timings("test_tool")
+
+    with patch.object(api_instance, "_get_response_meta", return_value=None):
+        result = api_instance._format_successful_response(mock_response, timings)
+
+    # Only the callback was asked for, so the result is unchanged
+    assert result == {"data": "test"}
+    api_instance.phase_timings_callback.assert_called_once()
+
+
 # --- Tests for _is_likely_json_value ---
 
 
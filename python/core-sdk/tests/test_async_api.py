@@ -0,0 +1,461 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from alation_ai_agent_sdk import AsyncAlationAIAgentSDK, AsyncAlationAPI
+from alation_ai_agent_sdk.api import AUTH_METHOD_SERVICE_ACCOUNT
+from alation_ai_agent_sdk.errors import AlationAPIError
+from alation_ai_agent_sdk.sdk import AgentSDKOptions
+from alation_ai_agent_sdk.tools import AlationLineageTool
+from alation_ai_agent_sdk.types import ServiceAccountAuthParams
+
+
+MOCK_BASE_URL = "https://mock-alation-instance.com"
+MOCK_CLIENT_ID = "test-client-id"
+MOCK_CLIENT_SECRET = "test-client-secret"
+
+
+def sse_body(*events):
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in events).encode()
+
+
+class MockAlation:
+    """Routes httpx requests to canned Alation responses and records them."""
+
+    def __init__(self, stream_events=None, stream_status=200):
+        self.stream_events = stream_events or [
+            {"content": "first"},
+            {"content": "last"},
+        ]
+        self.stream_status = stream_status
+        self.token_requests = 0
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/oauth/v2/token/":
+            self.token_requests += 1
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": f"token-{self.token_requests}",
+                    "expires_in": 3600,
+                },
+            )
+        if path == "/api/v1/license":
+            return httpx.Response(200, json={"is_cloud": True})
+        if path == "/full_version":
+            return httpx.Response(200, json={"ALATION_RELEASE_NAME": "2025.3.1"})
+        if path.endswith("/stream"):
+            if self.stream_status != 200:
+                return httpx.Response(self.stream_status, json={"detail": "nope"})
+            return httpx.Response(
+                200,
+                content=sse_body(*self.stream_events),
+                headers={"content-type": "text/event-stream"},
+            )
+        if path == "/integration/v2/custom_field/":
+            return httpx.Response(200, json=[{"id": 1, "name_singular": "Steward"}])
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def mock_alation():
+    server = MockAlation()
+
+    def create_client(api):
+        return httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+
+    # Telemetry is posted from background threads by the sync client
+    with (
+        patch.object(AsyncAlationAPI, "_create_http_client", create_client),
+        patch("alation_ai_agent_sdk.event.send_events"),
+    ):
+        yield server
+
+
+def make_api(**kwargs):
+    kwargs.setdefault("skip_instance_info", True)
+    return AsyncAlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams(MOCK_CLIENT_ID, MOCK_CLIENT_SECRET),
+        **kwargs,
+    )
+
+
+def make_sdk(**options):
+    return AsyncAlationAIAgentSDK(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams(MOCK_CLIENT_ID, MOCK_CLIENT_SECRET),
+        sdk_options=AgentSDKOptions(skip_instance_info=True, **options),
+    )
+
+
+def test_constructor_does_no_io(mock_alation):
+    """Test that instance info is deferred until the first request."""
+    make_api(skip_instance_info=False)
+    assert mock_alation.requests == []
+
+
+def test_stream_yields_every_event(mock_alation):
+    """Test that streaming mode yields each SSE event as an async generator."""
+
+    async def run():
+        async with make_api(enable_streaming=True) as api:
+            stream = api.bulk_retrieval_stream(signature={"table": {}})
+            return [event async for event in stream]
+
+    events = asyncio.run(run())
+
+    assert events == [{"content": "first"}, {"content": "last"}]
+    stream_request = mock_alation.requests[-1]
+    assert stream_request.headers["Authorization"] == "Bearer token-1"
+    assert json.loads(stream_request.content) == {"signature": {"table": {}}}
+
+
+def test_non_streaming_yields_last_event(mock_alation):
+    """Test that non-streaming mode yields only the final event."""
+
+    async def run():
+        async with make_api() as api:
+            return [event async for event in api.generate_data_product_stream()]
+
+    assert asyncio.run(run()) == [{"content": "last"}]
+
+
+def test_instance_info_fetched_on_first_request(mock_alation):
+    """Test that license and version info are fetched lazily."""
+
+    async def run():
+        async with make_api(skip_instance_info=False) as api:
+            await api.get_custom_fields()
+            return api
+
+    api = asyncio.run(run())
+
+    assert api.is_cloud is True
+    assert api.alation_release_name == "2025.3.1"
+
+
+def test_concurrent_requests_mint_token_once(mock_alation):
+    """Test that concurrent tasks share a single token mint."""
+
+    async def run():
+        async with make_api() as api:
+            await asyncio.gather(*(api.get_custom_fields() for _ in range(10)))
+
+    asyncio.run(run())
+
+    assert mock_alation.token_requests == 1
+
+
+def test_refresh_waits_for_thread_refreshing_token(mock_alation):
+    """Test that a refresh on the event loop waits for one running in a thread."""
+    api = make_api()
+    api.access_token = "stale-token"
+    api.access_token_expires_at = time.time() - 10
+
+    async def run():
+        api._token_lock.acquire()
+        refresh = asyncio.ensure_future(api._with_valid_auth_async())
+        await asyncio.sleep(0.05)
+        assert not refresh.done()
+        # The thread holding the lock minted a token in the meantime
+        api.access_token_expires_at = time.time() + 3600
+        api.access_token = "fresh-token"
+        api._token_lock.release()
+        await refresh
+        await api.aclose()
+
+    asyncio.run(run())
+
+    assert api.access_token == "fresh-token"
+    assert mock_alation.token_requests == 0
+    assert not api._token_lock.locked()
+
+
+def test_failed_instance_info_fetch_is_retried_after_interval(mock_alation):
+    """Test that a failed fetch raises once, then isn't repeated by every call."""
+    api = make_api(skip_instance_info=False)
+
+    async def run():
+        with patch.object(
+            api,
+            "_fetch_and_cache_instance_info_async",
+            side_effect=AlationAPIError("401"),
+        ) as mock_fetch:
+            with pytest.raises(AlationAPIError):
+                await api.ensure_instance_info()
+            await api.ensure_instance_info()
+            assert mock_fetch.call_count == 1
+        await api.aclose()
+
+    asyncio.run(run())
+
+
+def test_unauthorized_stream_remints_token(mock_alation):
+    """Test that a 401 re-mints the token and retries the request once."""
+    original_handler = mock_alation.handler
+    rejected = []
+
+    def handler(request):
+        if request.url.path.endswith("/stream") and not rejected:
+            rejected.append(request)
+            return httpx.Response(401, json={"detail": "expired"})
+        return original_handler(request)
+
+    mock_alation.handler = handler
+
+    async def run():
+        async with make_api() as api:
+            api.access_token = "revoked-token"
+            api.access_token_expires_at = time.time() + 3600
+            return [event async for event in api.get_data_sources_tool_stream()]
+
+    assert asyncio.run(run()) == [{"content": "last"}]
+    assert rejected[0].headers["Authorization"] == "Bearer revoked-token"
+    assert mock_alation.token_requests == 1
+
+
+def test_stream_http_error_is_classified(mock_alation):
+    """Test that HTTP errors go through AlationErrorClassifier."""
+    mock_alation.stream_status = 403
+
+    async def run():
+        async with make_api() as api:
+            return [
+                event async for event in api.catalog_context_search_agent_stream("x")
+            ]
+
+    with pytest.raises(AlationAPIError) as exc_info:
+        asyncio.run(run())
+
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.reason == "Forbidden"
+
+
+def test_sdk_returns_error_dict(mock_alation):
+    """Test that the async SDK reports API errors like the sync SDK."""
+    mock_alation.stream_status = 500
+
+    async def run():
+        async with make_sdk() as sdk:
+            return await sdk.catalog_context_search_agent("find sales tables")
+
+    result = asyncio.run(run())
+
+    assert result["error"]["status_code"] == 500
+    assert result["error"]["reason"] == "Internal Server Error"
+
+
+def test_sdk_streaming_returns_async_generator(mock_alation):
+    """Test that enable_streaming returns an async generator from the SDK."""
+
+    async def run():
+        async with make_sdk(enable_streaming=True) as sdk:
+            stream = await sdk.sql_query_agent("count orders", data_product_id="dp")
+            return [event async for event in stream]
+
+    assert asyncio.run(run()) == [{"content": "first"}, {"content": "last"}]
+
+
+def test_iter_lineage_follows_pagination(mock_alation):
+    pages = [
+        {"graph": [{"id": 1, "otype": "table"}], "pagination": {"has_more": True}},
+        {"graph": [{"id": 2, "otype": "table"}], "pagination": {"has_more": False}},
+    ]
+    requested = []
+
+    async def lineage_stream(**kwargs):
+        requested.append(kwargs["pagination"])
+        yield pages[len(requested) - 1]
+
+    async def run():
+        api = make_api()
+        with patch.object(api, "alation_lineage_stream", side_effect=lineage_stream):
+            return [
+                batch
+                async for batch in api.iter_lineage(
+                    {"id": 1, "otype": "table"}, "downstream"
+                )
+            ]
+
+    assert asyncio.run(run()) == [pages[0]["graph"], pages[1]["graph"]]
+    assert requested == [None, {"has_more": True}]
+
+
+def test_lineage_tool_collapses_to_otypes(mock_alation):
+    async def lineage_stream(**kwargs):
+        yield {
+            "graph": [
+                {"id": 1, "otype": "table", "neighbors": [{"id": 9, "otype": "etl"}]},
+                {"id": 9, "otype": "etl", "neighbors": [{"id": 2, "otype": "table"}]},
+            ],
+            "pagination": None,
+        }
+
+    async def run():
+        api = make_api()
+        with patch.object(api, "alation_lineage_stream", side_effect=lineage_stream):
+            return await AlationLineageTool(api).arun(
+                root_node={"id": 1, "otype": "table"},
+                direction="downstream",
+                collapse_to_otypes=["table"],
+            )
+
+    result = asyncio.run(run())
+
+    assert result["graph"] == [
+        {"id": 1, "otype": "table", "neighbors": [{"id": 2, "otype": "table"}]}
+    ]
+
+
+def test_lineage_tool_rejects_collapsing_a_page(mock_alation):
+    async def run():
+        api = make_api()
+        with patch.object(api, "alation_lineage_stream") as lineage_stream:
+            result = await AlationLineageTool(api).arun(
+                root_node={"id": 1, "otype": "table"},
+                direction="downstream",
+                processing_mode="chunked",
+                collapse_to_otypes=["table"],
+            )
+        return result, lineage_stream
+
+    result, lineage_stream = asyncio.run(run())
+
+    assert result["error"]["reason"] == "Invalid Lineage Parameters"
+    lineage_stream.assert_not_called()
+
+
+def test_sdk_validates_bulk_signature(mock_alation):
+    """Test that tool input validation is shared with the sync tools."""
+
+    async def run():
+        async with make_sdk() as sdk:
+            return await sdk.get_bulk_objects(signature=None)
+
+    result = asyncio.run(run())
+
+    assert result["error"]["reason"] == "Missing Required Parameter"
+    assert mock_alation.requests == []
+
+
+def test_instruction_endpoint_served_from_cache(mock_alation):
+    """Test that the async client shares the instruction cache logic."""
+
+    async def run():
+        async with make_sdk(instruction_cache_ttl=900) as sdk:
+            first = await sdk.get_signature_creation_instructions()
+            first["content"] = "mutated by caller"
+            second = await sdk.get_signature_creation_instructions()
+            return first, second
+
+    _, second = asyncio.run(run())
+
+    assert second == {"content": "last"}
+    stream_requests = [
+        r for r in mock_alation.requests if r.url.path.endswith("/stream")
+    ]
+    assert len(stream_requests) == 1
+
+
+def test_unavailable_stream_is_retried(mock_alation):
+    """Test that a 503 before the first byte is retried per the retry policy."""
+    original_handler = mock_alation.handler
+    rejected = []
+
+    def handler(request):
+        if request.url.path.endswith("/stream") and not rejected:
+            rejected.append(request)
+            return httpx.Response(503, headers={"Retry-After": "1"})
+        return original_handler(request)
+
+    mock_alation.handler = handler
+
+    async def run():
+        async with make_api() as api:
+            return [event async for event in api.get_data_sources_tool_stream()]
+
+    with patch("alation_ai_agent_sdk.async_api.asyncio.sleep") as mock_sleep:
+        assert asyncio.run(run()) == [{"content": "last"}]
+
+    assert len(rejected) == 1
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args.args[0] >= 1
+
+
+def test_dropped_stream_is_not_sent_again(mock_alation):
+    """Test that a stream POST the server may have received is not retried."""
+    original_handler = mock_alation.handler
+    dropped = []
+
+    def handler(request):
+        if request.url.path.endswith("/stream"):
+            dropped.append(request)
+            raise httpx.RemoteProtocolError("Server disconnected", request=request)
+        return original_handler(request)
+
+    mock_alation.handler = handler
+
+    async def run():
+        async with make_api() as api:
+            return [event async for event in api.get_data_sources_tool_stream()]
+
+    with patch("alation_ai_agent_sdk.async_api.asyncio.sleep") as mock_sleep:
+        with pytest.raises(AlationAPIError):
+            asyncio.run(run())
+
+    assert len(dropped) == 1
+    mock_sleep.assert_not_called()
+
+
+def test_non_streaming_event_carries_phase_timings(mock_alation):
+    """Test that the async client adds phase timings to the last event."""
+    reported = []
+
+    async def run():
+        async with make_api(
+            skip_instance_info=False,
+            record_phase_timings=True,
+            phase_timings_callback=lambda name, timings: reported.append(name),
+        ) as api:
+            return [event async for event in api.get_data_sources_tool_stream()]
+
+    (event,) = asyncio.run(run())
+
+    assert event["content"] == "last"
+    assert set(event["_meta"]["timings"]) == {
+        "auth",
+        "instance_info",
+        "request",
+        "first_byte",
+        "stream",
+        "decode",
+        "total",
+    }
+    assert reported == ["get_data_sources_tool"]
+
+
+def test_shared_http_client_is_used_and_left_open(mock_alation):
+    """Test that SDKs given one http_client share it and never close it."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(mock_alation.handler))
+
+    async def run():
+        for _ in range(2):
+            async with make_sdk(http_client=client) as sdk:
+                assert sdk.api._get_http_client() is client
+                await sdk.get_custom_fields_definitions()
+        closed = client.is_closed
+        await client.aclose()
+        return closed
+
+    assert asyncio.run(run()) is False
+    assert mock_alation.token_requests == 2
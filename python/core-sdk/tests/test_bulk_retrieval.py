@@ -167,7 +167,7 @@ def test_bulk_retrieval_tool_run_api_error(bulk_retrieval_tool, mock_api):
     assert result["error"]["reason"] == "Bad Request"
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_bulk_retrieval_tool_run_usage_quota_warning(
     mock_requests_post, bulk_retrieval_tool_with_alation_api
 ):
@@ -197,7 +197,7 @@ def test_bulk_retrieval_tool_run_usage_quota_warning(
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.headers = entitlement_headers
-    mock_response.iter_lines.return_value = [sse_data.encode("utf-8")]
+    mock_response.iter_content.return_value = [sse_data.encode("utf-8")]
     mock_response.raise_for_status.return_value = None
 
     # Mock the context manager behavior for requests.post
@@ -226,7 +226,7 @@ def test_bulk_retrieval_tool_run_usage_quota_warning(
     assert result["relevant_tables"][0]["name"] == "orders"
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_bulk_retrieval_tool_run_no_entitlement_warning(
     mock_requests_post, bulk_retrieval_tool_with_alation_api
 ):
@@ -255,7 +255,7 @@ def test_bulk_retrieval_tool_run_no_entitlement_warning(
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.headers = entitlement_headers
-    mock_response.iter_lines.return_value = [sse_data.encode("utf-8")]
+    mock_response.iter_content.return_value = [sse_data.encode("utf-8")]
     mock_response.raise_for_status.return_value = None
 
     # Mock the context manager behavior for requests.post
@@ -287,7 +287,7 @@ def test_bulk_retrieval_tool_run_no_entitlement_warning(
     assert "_meta" not in result
 
 
-@patch("alation_ai_agent_sdk.api.requests.post")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
 def test_bulk_retrieval_tool_with_429_quota_reached(
     mock_requests_post, bulk_retrieval_tool_with_alation_api
 ):
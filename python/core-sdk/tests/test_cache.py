@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+
+from alation_ai_agent_sdk.cache import FileCache, TTLCache
+
+
+def test_get_returns_stored_value():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+    assert cache.get("missing", "default") == "default"
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(maxsize=2, ttl=10)
+    with patch("alation_ai_agent_sdk.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("alation_ai_agent_sdk.cache.time.monotonic", return_value=109.0):
+        assert cache.get("a") == 1
+    with patch("alation_ai_agent_sdk.cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set(("x", 1), 1)
+    cache.set(("x", 2), 2)
+    cache.set(("y", 1), 3)
+
+    assert cache.invalidate(lambda key: key[0] == "x") == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0, ttl=60)
+
+
+def test_file_cache_round_trip(tmp_path):
+    cache = FileCache(directory=str(tmp_path / "nested"), ttl=60)
+    cache.set("https://a.example.com", {"version": {"name": "2025.1"}})
+
+    assert FileCache(directory=str(tmp_path / "nested"), ttl=60).get(
+        "https://a.example.com"
+    ) == {"version": {"name": "2025.1"}}
+    assert cache.get("https://b.example.com") is None
+
+
+def test_file_cache_entries_expire_after_ttl(tmp_path):
+    cache = FileCache(directory=str(tmp_path), ttl=10)
+    with patch("alation_ai_agent_sdk.cache.time.time", return_value=100.0):
+        cache.set("a", 1)
+    with patch("alation_ai_agent_sdk.cache.time.time", return_value=109.0):
+        assert cache.get("a") == 1
+    with patch("alation_ai_agent_sdk.cache.time.time", return_value=110.0):
+        assert cache.get("a", "default") == "default"
+
+
+def test_file_cache_ignores_corrupt_entries(tmp_path):
+    cache = FileCache(directory=str(tmp_path), ttl=60)
+    cache.set("a", 1)
+    for path in tmp_path.iterdir():
+        path.write_text("{not json")
+
+    assert cache.get("a") is None
@@ -30,7 +30,9 @@ def global_network_mocks(monkeypatch):
             return response
         return MagicMock(status_code=200, json=MagicMock(return_value={}))
 
-    monkeypatch.setattr(requests, "post", mock_post)
+    monkeypatch.setattr(
+        requests.Session, "post", lambda _session, *a, **kw: mock_post(*a, **kw)
+    )
 
     # Mock requests.get for license and version
     def mock_get(url, *args, **kwargs):
@@ -50,7 +52,9 @@ def global_network_mocks(monkeypatch):
         response.raise_for_status.return_value = None
         return response
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda _session, *a, **kw: mock_get(*a, **kw)
+    )
 
 
 MOCK_BASE_URL = "https://mock-alation-instance.com"
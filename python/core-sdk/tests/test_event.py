@@ -1,13 +1,22 @@
+import asyncio
+import gc
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 
 from alation_ai_agent_sdk.event import (
+    EVENT_OVERFLOW_SAMPLE,
+    EventQueue,
     ToolEvent,
     send_event,
+    send_events,
     track_tool_execution,
 )
 from alation_ai_agent_sdk.api import AlationAPI
 from alation_ai_agent_sdk.errors import AlationAPIError
+from alation_ai_agent_sdk.metrics import TOOL_IN_FLIGHT
+from alation_ai_agent_sdk.response_stats import current_response_stats
 
 
 class TestToolEvent:
@@ -77,6 +86,24 @@ class TestToolEvent:
         assert payload["status_code"] == 0
         assert payload["error_message"] == "String error message"
 
+    def test_output_is_not_retained(self):
+        """Test that only the size of the output is kept on the event."""
+        output = {"tables": [{"id": i, "name": f"table_{i}"} for i in range(1000)]}
+
+        event = ToolEvent(
+            tool_name="BulkTool",
+            tool_version="1.0.0",
+            input_params={},
+            output=output,
+            duration_ms=100.0,
+            success=True,
+        )
+
+        assert not hasattr(event, "output")
+        assert event.to_payload()["context_char_count"] == pytest.approx(
+            len(str(output)), rel=0.05
+        )
+
     def test_get_tool_metadata(self):
         """Test get_tool_metadata method."""
         input_params = {"kwargs": {"param": "value"}}
@@ -174,6 +201,135 @@ class TestSendEvent:
         assert "Unexpected error sending event" in mock_logger.warning.call_args[0][0]
 
 
+def make_event(tool_name="TestTool"):
+    return ToolEvent(
+        tool_name=tool_name,
+        tool_version="1.0.0",
+        input_params={},
+        output="output",
+        duration_ms=100.0,
+        success=True,
+    )
+
+
+def make_blocking_api():
+    """An API whose post_tool_events waits until `release` is set."""
+    mock_api = Mock(spec=AlationAPI)
+    started = threading.Event()
+    release = threading.Event()
+
+    def post_tool_events(payloads, **kwargs):
+        started.set()
+        release.wait(5)
+        return len(payloads)
+
+    mock_api.post_tool_events.side_effect = post_tool_events
+    return mock_api, started, release
+
+
+class TestEventQueue:
+    """Test cases for the background event queue."""
+
+    def test_queued_events_are_sent_in_one_batch(self):
+        """Test that events waiting in the queue share one post_tool_events call."""
+        mock_api = Mock(spec=AlationAPI)
+        started = threading.Event()
+        release = threading.Event()
+        batches = []
+
+        def post_tool_events(payloads, **kwargs):
+            started.set()
+            release.wait(5)
+            batches.append([payload["tool_name"] for payload in payloads])
+            return len(payloads)
+
+        mock_api.post_tool_events.side_effect = post_tool_events
+        event_queue = EventQueue()
+
+        # The first event occupies the worker while the rest queue up
+        event_queue.submit(mock_api, make_event("first"))
+        assert started.wait(5)
+        for i in range(3):
+            event_queue.submit(mock_api, make_event(f"queued-{i}"))
+        release.set()
+
+        assert event_queue.flush(timeout=5)
+        assert batches[-1] == ["queued-0", "queued-1", "queued-2"]
+        assert event_queue.stats()["sent"] == 4
+        event_queue.close()
+
+    def test_full_queue_drops_events(self):
+        """Test that submit never blocks and counts the dropped events."""
+        mock_api, started, release = make_blocking_api()
+        event_queue = EventQueue(maxsize=2, batch_size=1)
+
+        # The worker holds the first event, the queue takes two more
+        event_queue.submit(mock_api, make_event())
+        assert started.wait(5)
+        results = [event_queue.submit(mock_api, make_event()) for _ in range(9)]
+        release.set()
+        event_queue.flush(timeout=5)
+
+        assert results.count(False) == 7
+        stats = event_queue.stats()
+        assert stats["dropped"] == 7
+        assert stats["enqueued"] == stats["sent"] == 3
+        event_queue.close()
+
+    def test_sample_overflow_keeps_share_of_events(self):
+        """Test that sampling starts once the queue is half full."""
+        mock_api, started, release = make_blocking_api()
+        event_queue = EventQueue(
+            maxsize=4, batch_size=1, overflow=EVENT_OVERFLOW_SAMPLE, sample_rate=0
+        )
+
+        event_queue.submit(mock_api, make_event())
+        assert started.wait(5)
+        for _ in range(9):
+            event_queue.submit(mock_api, make_event())
+        release.set()
+        event_queue.flush(timeout=5)
+
+        stats = event_queue.stats()
+        assert stats["sampled_out"] == 7
+        assert stats["dropped"] == 0
+        event_queue.close()
+
+    def test_close_sends_queued_events_and_rejects_new_ones(self):
+        mock_api = Mock(spec=AlationAPI)
+        mock_api.post_tool_events.side_effect = lambda payloads, **kwargs: len(payloads)
+        event_queue = EventQueue()
+
+        event_queue.submit(mock_api, make_event())
+        event_queue.close()
+
+        assert event_queue.stats()["sent"] == 1
+        assert event_queue.submit(mock_api, make_event()) is False
+
+    def test_failed_events_are_counted(self):
+        mock_api = Mock(spec=AlationAPI)
+        mock_api.post_tool_events.side_effect = AlationAPIError("API Error")
+        event_queue = EventQueue()
+
+        event_queue.submit(mock_api, make_event())
+        event_queue.flush(timeout=5)
+
+        assert event_queue.stats()["failed"] == 1
+        event_queue.close()
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError):
+            EventQueue(overflow="block")
+
+    @patch("alation_ai_agent_sdk.event.logger")
+    def test_send_events_swallows_errors(self, mock_logger):
+        mock_api = Mock(spec=AlationAPI)
+        mock_api.post_tool_events.side_effect = ValueError("Some error")
+
+        assert send_events(mock_api, [make_event()]) == 0
+        mock_logger.warning.assert_called_once()
+
+
 class TestTrackToolExecution:
     """Test cases for track_tool_execution decorator."""
 
@@ -207,9 +363,8 @@ class TestTrackToolExecution:
 
         assert result == "result: test"
 
-    @patch("alation_ai_agent_sdk.event.threading.Timer")
-    @patch("alation_ai_agent_sdk.event.send_event")
-    def test_decorator_successful_execution(self, mock_send_event, mock_timer):
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_successful_execution(self, mock_get_queue):
         """Test decorator with successful function execution."""
 
         @track_tool_execution(timeout=15.0, max_retries=5)
@@ -222,24 +377,23 @@ class TestTrackToolExecution:
         mock_tool.api.dist_version = "test-dist-1.0"
         mock_tool.__class__.__name__ = "TestTool"
 
-        # Mock timer
-        mock_timer_instance = Mock()
-        mock_timer.return_value = mock_timer_instance
-
         with patch("time.time", side_effect=[1000.0, 1000.5]):  # 500ms duration
             result = test_function(mock_tool, "test", param2="custom")
 
         # Verify function result
         assert result == "result: test, custom"
 
-        # Verify timer was set up for background telemetry
-        mock_timer.assert_called_once_with(0.0, mock_timer.call_args[0][1])
-        mock_timer_instance.start.assert_called_once()
-        assert mock_timer_instance.daemon is True
+        # Verify the event was queued for background sending
+        submit = mock_get_queue.return_value.submit
+        submit.assert_called_once()
+        api_arg, event_arg = submit.call_args[0]
+        assert api_arg == mock_tool.api
+        assert event_arg.duration_ms == 500.0
+        assert submit.call_args[1]["timeout"] == 15.0
+        assert submit.call_args[1]["max_retries"] == 5
 
-    @patch("alation_ai_agent_sdk.event.threading.Timer")
-    @patch("alation_ai_agent_sdk.event.send_event")
-    def test_decorator_with_custom_metrics(self, mock_send_event, mock_timer):
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_with_custom_metrics(self, mock_get_queue):
         """Test decorator with custom metrics function."""
 
         def custom_metrics_fn(input_params, output, duration_ms):
@@ -258,30 +412,13 @@ class TestTrackToolExecution:
         mock_tool.api = Mock(spec=AlationAPI)
         mock_tool.__class__.__name__ = "TestTool"
 
-        # Mock timer to capture the background function
-        captured_bg_function = None
-
-        def capture_timer_function(delay, func):
-            nonlocal captured_bg_function
-            captured_bg_function = func
-            timer_mock = Mock()
-            timer_mock.daemon = None
-            return timer_mock
-
-        mock_timer.side_effect = capture_timer_function
-
         with patch("time.time", side_effect=[1000.0, 1000.5]):  # 500ms duration
             test_function(mock_tool, "test", param2="custom")
 
-        # Execute the captured background function to verify custom metrics
-        assert captured_bg_function is not None
-        captured_bg_function()
-
-        # Verify send_event was called with correct parameters
-        mock_send_event.assert_called_once()
-        call_args = mock_send_event.call_args
-
-        api_arg, event_arg = call_args[0]
+        # Verify the queued event carries the custom metrics
+        submit = mock_get_queue.return_value.submit
+        submit.assert_called_once()
+        api_arg, event_arg = submit.call_args[0]
         assert api_arg == mock_tool.api
         assert isinstance(event_arg, ToolEvent)
         assert event_arg.tool_name == "TestTool"
@@ -290,9 +427,8 @@ class TestTrackToolExecution:
         assert event_arg.custom_metrics["output_length"] == len("result: test, custom")
         assert event_arg.custom_metrics["is_slow"] is False
 
-    @patch("alation_ai_agent_sdk.event.threading.Timer")
-    @patch("alation_ai_agent_sdk.event.send_event")
-    def test_decorator_with_exception(self, mock_send_event, mock_timer):
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_with_exception(self, mock_get_queue):
         """Test decorator when decorated function raises an exception."""
 
         @track_tool_execution()
@@ -304,37 +440,18 @@ class TestTrackToolExecution:
         mock_tool.api = Mock(spec=AlationAPI)
         mock_tool.__class__.__name__ = "TestTool"
 
-        # Mock timer to capture the background function
-        captured_bg_function = None
-
-        def capture_timer_function(delay, func):
-            nonlocal captured_bg_function
-            captured_bg_function = func
-            return Mock(daemon=None)
-
-        mock_timer.side_effect = capture_timer_function
-
         with patch("time.time", side_effect=[1000.0, 1000.2]):  # 200ms duration
             with pytest.raises(ValueError, match="Test error"):
                 test_function(mock_tool, "test")
 
-        # Execute the captured background function
-        captured_bg_function()
-
-        # Verify send_event was called with error details
-        mock_send_event.assert_called_once()
-        call_args = mock_send_event.call_args
-
-        event_arg = call_args[0][1]
+        # Verify the queued event has the error details
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
         assert event_arg.success is False
         assert event_arg.error == "Test error"
-        assert event_arg.output == {"error": "Test error"}
+        assert event_arg.output_size == len(str({"error": "Test error"}))
 
-    @patch("alation_ai_agent_sdk.event.threading.Timer")
-    @patch("alation_ai_agent_sdk.event.send_event")
-    def test_decorator_with_unhandled_AlationAPIError(
-        self, mock_send_event, mock_timer
-    ):
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_with_unhandled_AlationAPIError(self, mock_get_queue):
         """Test decorator when an unhandled AlationAPIError occurs."""
 
         @track_tool_execution()
@@ -350,35 +467,18 @@ class TestTrackToolExecution:
         mock_tool.api = Mock(spec=AlationAPI)
         mock_tool.__class__.__name__ = "TestTool"
 
-        # Mock timer to capture the background function
-        captured_bg_function = None
-
-        def capture_timer_function(delay, func):
-            nonlocal captured_bg_function
-            captured_bg_function = func
-            return Mock(daemon=None)
-
-        mock_timer.side_effect = capture_timer_function
-
         with patch("time.time", side_effect=[1000.0, 1000.2]):  # 200ms duration
             with pytest.raises(AlationAPIError, match="Unhandled API error"):
                 test_function(mock_tool, "test")
 
-        # Execute the captured background function
-        captured_bg_function()
-
-        # Verify send_event was called with error details
-        mock_send_event.assert_called_once()
-        call_args = mock_send_event.call_args
-
-        event_arg = call_args[0][1]
+        # Verify the queued event has the error details
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
         assert event_arg.success is False
         assert event_arg.error == "Unhandled API error"
-        assert event_arg.output == {"error": "Unhandled API error"}
+        assert event_arg.output_size == len(str({"error": "Unhandled API error"}))
 
-    @patch("alation_ai_agent_sdk.event.threading.Timer")
-    @patch("alation_ai_agent_sdk.event.send_event")
-    def test_decorator_with_error_in_output(self, mock_send_event, mock_timer):
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_with_error_in_output(self, mock_get_queue):
         """Test decorator when function returns error in output."""
 
         @track_tool_execution()
@@ -390,32 +490,17 @@ class TestTrackToolExecution:
         mock_tool.api = Mock(spec=AlationAPI)
         mock_tool.__class__.__name__ = "TestTool"
 
-        # Mock timer to capture the background function
-        captured_bg_function = None
-
-        def capture_timer_function(delay, func):
-            nonlocal captured_bg_function
-            captured_bg_function = func
-            return Mock(daemon=None)
-
-        mock_timer.side_effect = capture_timer_function
-
         with patch("time.time", side_effect=[1000.0, 1000.1]):
             test_function(mock_tool, "test")
 
-        # Execute the captured background function
-        captured_bg_function()
-
-        # Verify send_event was called with error from output
-        mock_send_event.assert_called_once()
-        event_arg = mock_send_event.call_args[0][1]
-
+        # Verify the queued event has the error from the output
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
         assert event_arg.success is True  # Function didn't raise exception
         assert event_arg.error == "Function returned error"
 
-    @patch("alation_ai_agent_sdk.event.threading.Timer")
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
     @patch("alation_ai_agent_sdk.event.logger")
-    def test_decorator_custom_metrics_exception(self, mock_logger, mock_timer):
+    def test_decorator_custom_metrics_exception(self, mock_logger, mock_get_queue):
         """Test decorator when custom metrics function raises exception."""
 
         def failing_custom_metrics(input_params, output, duration_ms):
@@ -430,29 +515,17 @@ class TestTrackToolExecution:
         mock_tool.api = Mock(spec=AlationAPI)
         mock_tool.__class__.__name__ = "TestTool"
 
-        # Mock timer to capture the background function
-        captured_bg_function = None
-
-        def capture_timer_function(delay, func):
-            nonlocal captured_bg_function
-            captured_bg_function = func
-            return Mock(daemon=None)
-
-        mock_timer.side_effect = capture_timer_function
-
         with patch("time.time", side_effect=[1000.0, 1000.1]):
             test_function(mock_tool, "test")
 
-        # Execute the captured background function
-        captured_bg_function()
-
         # Verify warning was logged about custom metrics failure
         mock_logger.warning.assert_called_once()
         assert "Error getting custom metrics" in mock_logger.warning.call_args[0][0]
+        mock_get_queue.return_value.submit.assert_called_once()
 
     @patch("alation_ai_agent_sdk.event.logger")
-    def test_decorator_timer_creation_fails(self, mock_logger):
-        """Test decorator when timer creation fails."""
+    def test_decorator_queue_submit_fails(self, mock_logger):
+        """Test decorator when queueing the event fails."""
 
         @track_tool_execution()
         def test_function(self, param1):
@@ -464,8 +537,8 @@ class TestTrackToolExecution:
         mock_tool.__class__.__name__ = "TestTool"
 
         with patch(
-            "alation_ai_agent_sdk.event.threading.Timer",
-            side_effect=RuntimeError("Timer failed"),
+            "alation_ai_agent_sdk.event.get_event_queue",
+            side_effect=RuntimeError("Queue failed"),
         ):
             with patch("time.time", side_effect=[1000.0, 1000.1]):
                 result = test_function(mock_tool, "test")
@@ -477,7 +550,8 @@ class TestTrackToolExecution:
         mock_logger.debug.assert_called_once()
         assert "Could not send telemetry event" in mock_logger.debug.call_args[0][0]
 
-    def test_decorator_tool_version_formatting(self):
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tool_version_formatting(self, mock_get_queue):
         """Test that tool version is correctly formatted with dist_version."""
 
         @track_tool_execution()
@@ -490,32 +564,206 @@ class TestTrackToolExecution:
         mock_tool.api.dist_version = "my-dist-2.0"
         mock_tool.__class__.__name__ = "TestTool"
 
-        captured_event = None
-
-        def capture_send_event(api, event, **kwargs):
-            nonlocal captured_event
-            captured_event = event
-
-        with patch(
-            "alation_ai_agent_sdk.event.send_event", side_effect=capture_send_event
-        ):
-            with patch("alation_ai_agent_sdk.event.threading.Timer") as mock_timer:
-                # Set up timer to immediately call the background function
-                def immediate_call(delay, func):
-                    func()  # Call immediately for testing
-                    return Mock(daemon=None, start=Mock())
-
-                mock_timer.side_effect = immediate_call
-
-                with patch("time.time", side_effect=[1000.0, 1000.1]):
-                    test_function(mock_tool)
+        with patch("time.time", side_effect=[1000.0, 1000.1]):
+            test_function(mock_tool)
 
         # Verify tool version includes dist_version
         from alation_ai_agent_sdk.utils import SDK_VERSION
 
+        captured_event = mock_get_queue.return_value.submit.call_args[0][1]
         expected_version = f"my-dist-2.0/sdk-{SDK_VERSION}"
         assert captured_event.tool_version == expected_version
 
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tracks_stream(self, mock_get_queue):
+        """Test that a streamed result is recorded once the stream is exhausted."""
+
+        def stream():
+            for chunk in (b"data: 1\n\n", b"data: 22\n\n"):
+                # Stands in for the SSE reader counting the bytes it reads
+                current_response_stats().bytes_read += len(chunk)
+                yield {"content": chunk.decode()}
+
+        @track_tool_execution()
+        def test_function(self):
+            return stream()
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "TestTool"
+        submit = mock_get_queue.return_value.submit
+
+        with patch("time.time", side_effect=[1000.0, 1000.2, 1000.9]):
+            result = test_function(mock_tool)
+            submit.assert_not_called()
+            events = list(result)
+
+        assert len(events) == 2
+        submit.assert_called_once()
+        event_arg = submit.call_args[0][1]
+        assert event_arg.event_count == 2
+        assert event_arg.early_terminated is False
+        assert event_arg.time_to_first_event_ms == pytest.approx(200)
+        assert event_arg.duration_ms == pytest.approx(900)
+        assert event_arg.response_bytes == 19
+        payload = event_arg.to_payload()
+        assert payload["context_char_count"] == 19
+        assert payload["tool_metadata"]["event_count"] == 2
+        assert payload["tool_metadata"]["time_to_first_event_ms"] == 200
+
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tracks_closed_stream(self, mock_get_queue):
+        """Test that closing a stream early records it and closes the source."""
+        closed = []
+
+        def stream():
+            try:
+                yield {"content": "first"}
+                yield {"content": "second"}
+            finally:
+                closed.append(True)
+
+        @track_tool_execution()
+        def test_function(self):
+            return stream()
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "TestTool"
+
+        result = test_function(mock_tool)
+        assert next(result) == {"content": "first"}
+        result.close()
+
+        assert closed == [True]
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
+        assert event_arg.event_count == 1
+        assert event_arg.early_terminated is True
+        assert event_arg.success is True
+
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tracks_stream_closed_before_first_event(self, mock_get_queue):
+        """Test that a stream closed without being iterated is still recorded."""
+
+        def stream():
+            yield {"content": "never read"}
+
+        @track_tool_execution()
+        def test_function(self):
+            return stream()
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "UnreadStreamTool"
+        submit = mock_get_queue.return_value.submit
+
+        result = test_function(mock_tool)
+        assert TOOL_IN_FLIGHT.get(tool="UnreadStreamTool") == 1
+        result.close()
+        del result
+        gc.collect()
+
+        submit.assert_called_once()
+        event_arg = submit.call_args[0][1]
+        assert event_arg.event_count == 0
+        assert event_arg.early_terminated is True
+        assert TOOL_IN_FLIGHT.get(tool="UnreadStreamTool") == 0
+
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tracks_dropped_async_stream(self, mock_get_queue):
+        """Test that an async stream dropped before its first event is recorded."""
+
+        async def stream():
+            yield {"content": "never read"}
+
+        @track_tool_execution()
+        async def test_function(self):
+            return stream()
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "DroppedAsyncStreamTool"
+
+        async def run():
+            await test_function(mock_tool)
+
+        asyncio.run(run())
+        gc.collect()
+
+        mock_get_queue.return_value.submit.assert_called_once()
+        assert TOOL_IN_FLIGHT.get(tool="DroppedAsyncStreamTool") == 0
+
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tracks_failed_stream(self, mock_get_queue):
+        """Test that an error raised mid-stream is recorded."""
+
+        def stream():
+            yield {"content": "first"}
+            raise AlationAPIError("Stream broke")
+
+        @track_tool_execution()
+        def test_function(self):
+            return stream()
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "TestTool"
+
+        with pytest.raises(AlationAPIError):
+            list(test_function(mock_tool))
+
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
+        assert event_arg.success is False
+        assert event_arg.error == "Stream broke"
+        assert event_arg.early_terminated is False
+
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_tracks_async_stream(self, mock_get_queue):
+        """Test that async generators returned by async tools are tracked."""
+
+        async def stream():
+            current_response_stats().bytes_read += 10
+            yield {"content": "first"}
+            yield {"content": "last"}
+
+        @track_tool_execution()
+        async def test_function(self):
+            return stream()
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "TestTool"
+
+        async def run():
+            result = await test_function(mock_tool)
+            return [event async for event in result]
+
+        assert len(asyncio.run(run())) == 2
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
+        assert event_arg.event_count == 2
+        assert event_arg.response_bytes == 10
+        assert event_arg.output_size == 10
+
+    @patch("alation_ai_agent_sdk.event.get_event_queue")
+    def test_decorator_records_response_bytes(self, mock_get_queue):
+        """Test that bytes read during a non-streaming call are recorded."""
+
+        @track_tool_execution()
+        def test_function(self):
+            current_response_stats().bytes_read += 42
+            return {"content": "result"}
+
+        mock_tool = Mock()
+        mock_tool.api = Mock(spec=AlationAPI)
+        mock_tool.__class__.__name__ = "TestTool"
+
+        test_function(mock_tool)
+
+        event_arg = mock_get_queue.return_value.submit.call_args[0][1]
+        assert event_arg.response_bytes == 42
+        assert event_arg.event_count is None
+        assert current_response_stats() is None
+
     def test_decorator_preserves_function_metadata(self):
         """Test that decorator preserves original function metadata."""
 
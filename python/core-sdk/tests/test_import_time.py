@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+# Summed import time of the SDK's own modules, excluding requests and other
+# dependencies. It is around 15ms on a laptop; the budget leaves room for slow CI.
+IMPORT_BUDGET_IN_SECONDS = 0.1
+
+# Only needed by the async client, tracing, the metrics endpoint or a tool call
+DEFERRED_MODULES = (
+    "alation_ai_agent_sdk.async_api",
+    "alation_ai_agent_sdk.tools",
+    "http.server",
+    "httpx",
+    "opentelemetry",
+)
+
+CREATE_SDK = """
+import sys
+from alation_ai_agent_sdk import AgentSDKOptions, AlationAIAgentSDK
+from alation_ai_agent_sdk import ServiceAccountAuthParams
+
+AlationAIAgentSDK(
+    base_url="https://import-time.example.com",
+    auth_method="service_account",
+    auth_params=ServiceAccountAuthParams("id", "secret"),
+    sdk_options=AgentSDKOptions(skip_instance_info=True),
+)
+print(",".join(sorted(sys.modules)))
+"""
+
+
+def run_python(tmp_path, *args):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def sdk_import_time(importtime_output):
+    """Seconds spent in the SDK's own modules, from `python -X importtime`."""
+    total_us = 0
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative_us, module = line[len("import time:") :].split("|")
+        if module.strip().startswith("alation_ai_agent_sdk"):
+            total_us += int(self_us)
+    return total_us / 1_000_000
+
+
+def test_creating_the_sdk_defers_optional_modules(tmp_path):
+    result = run_python(tmp_path, "-c", CREATE_SDK)
+    modules = result.stdout.strip().split(",")
+
+    assert "alation_ai_agent_sdk.sdk" in modules
+    for deferred in DEFERRED_MODULES:
+        assert deferred not in modules
+
+
+def test_import_time_budget(tmp_path):
+    # The first run writes the bytecode; the fastest of the others is kept
+    import_times = [
+        sdk_import_time(
+            run_python(tmp_path, "-X", "importtime", "-c", CREATE_SDK).stderr
+        )
+        for _ in range(4)
+    ]
+
+    assert min(import_times[1:]) < IMPORT_BUDGET_IN_SECONDS
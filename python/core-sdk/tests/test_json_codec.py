@@ -0,0 +1,83 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from alation_ai_agent_sdk import json_codec
+from alation_ai_agent_sdk.json_codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_json_codec,
+)
+
+
+def available_codecs():
+    codecs = [JSONCodec()]
+    if json_codec.orjson is not None:
+        codecs.append(OrjsonCodec())
+    if json_codec.msgspec is not None:
+        codecs.append(MsgspecCodec())
+    return codecs
+
+
+@pytest.fixture(params=available_codecs(), ids=lambda codec: codec.name)
+def codec(request):
+    return request.param
+
+
+def test_round_trip(codec):
+    value = {"name": "orders", "ids": [1, 2, 3], "nested": {"ok": True, "x": None}}
+
+    assert codec.loads(codec.dumpb(value)) == value
+    assert codec.loads(codec.dumps(value)) == value
+    assert json.loads(codec.dumps(value)) == value
+
+
+def test_output_is_compact(codec):
+    assert codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+
+def test_decodes_bytes_and_str(codec):
+    assert codec.loads(b'{"a": "\xc3\xa9"}') == {"a": "é"}
+    assert codec.loads('{"a": 1}') == {"a": 1}
+
+
+def test_malformed_input_raises_json_decode_error(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"truncated": ')
+
+
+def test_unserializable_value_raises_type_error(codec):
+    with pytest.raises(TypeError):
+        codec.dumpb({"value": object()})
+
+
+def test_auto_prefers_installed_fast_codec():
+    with (
+        patch.object(json_codec, "orjson", None),
+        patch.object(json_codec, "msgspec", None),
+    ):
+        assert type(get_json_codec()) is JSONCodec
+        assert type(get_json_codec("auto")) is JSONCodec
+
+    if json_codec.orjson is not None:
+        assert type(get_json_codec()) is OrjsonCodec
+
+
+def test_get_json_codec_by_name_or_instance():
+    codec = JSONCodec()
+
+    assert get_json_codec(codec) is codec
+    assert type(get_json_codec("json")) is JSONCodec
+
+
+def test_missing_codec_raises_import_error():
+    with patch.object(json_codec, "msgspec", None):
+        with pytest.raises(ImportError, match="msgspec"):
+            get_json_codec("msgspec")
+
+
+def test_unknown_codec_raises_value_error():
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_json_codec("simplejson")
@@ -1,5 +1,7 @@
+import threading
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from alation_ai_agent_sdk.lineage import (
     LineageDesignTimeOptions,
     LineageGraphProcessingOptions,
@@ -13,7 +15,12 @@ from alation_ai_agent_sdk.lineage_filtering import (
     build_filtered_graph,
 )
 from alation_ai_agent_sdk.tools import AlationLineageTool
-from alation_ai_agent_sdk.api import AlationAPIError
+from alation_ai_agent_sdk.api import (
+    AUTH_METHOD_SERVICE_ACCOUNT,
+    AlationAPI,
+    AlationAPIError,
+    ServiceAccountAuthParams,
+)
 
 
 def test_make_lineage_kwargs_creates_defaults():
@@ -385,6 +392,59 @@ def test_alation_lineage_tool_returns_api_errors(get_lineage_tool, mock_api):
     assert result["error"]["reason"] == "Bad Request"
 
 
+def test_alation_lineage_tool_collapses_to_otypes(get_lineage_tool, mock_api):
+    def mock_generator():
+        yield {
+            "graph": [
+                {"id": 1, "otype": "table", "neighbors": [{"id": 9, "otype": "etl"}]},
+                {"id": 9, "otype": "etl", "neighbors": [{"id": 2, "otype": "table"}]},
+            ],
+            "direction": "downstream",
+            "pagination": None,
+        }
+
+    mock_api.alation_lineage_stream.return_value = mock_generator()
+
+    result = get_lineage_tool.run(
+        root_node={"id": 1, "otype": "table"},
+        direction="downstream",
+        collapse_to_otypes=["table"],
+    )
+
+    assert result["graph"] == [
+        {"id": 1, "otype": "table", "neighbors": [{"id": 2, "otype": "table"}]}
+    ]
+    assert "collapse_to_otypes" not in mock_api.alation_lineage_stream.call_args.kwargs
+
+
+@pytest.mark.parametrize(
+    "paging",
+    [
+        {"processing_mode": "chunked"},
+        {
+            "pagination": {
+                "cursor": 2,
+                "request_id": "r",
+                "batch_size": 2,
+                "has_more": True,
+            }
+        },
+    ],
+)
+def test_alation_lineage_tool_rejects_collapsing_a_page(
+    get_lineage_tool, mock_api, paging
+):
+    result = get_lineage_tool.run(
+        root_node={"id": 1, "otype": "table"},
+        direction="downstream",
+        collapse_to_otypes=["table"],
+        **paging,
+    )
+
+    assert result["error"]["reason"] == "Invalid Lineage Parameters"
+    mock_api.alation_lineage_stream.assert_not_called()
+
+
 def test_filtering_allowed_types_on_incomplete_graph():
     allowed_otypes = {"table"}
     response = {
@@ -424,3 +484,125 @@ def test_filtering_allowed_types_on_incomplete_graph():
     assert len(result[0]["neighbors"]) == 2
     for neighbor in result[0]["neighbors"]:
         assert neighbor["otype"] == "table"
+
+
+def make_lineage_pages(page_count, nodes_per_page=2):
+    pages = []
+    for page_index in range(page_count):
+        has_more = page_index < page_count - 1
+        pages.append(
+            {
+                "graph": [
+                    {"id": page_index * nodes_per_page + i, "otype": "table"}
+                    for i in range(nodes_per_page)
+                ],
+                "direction": "downstream",
+                "pagination": {
+                    "cursor": (page_index + 1) * nodes_per_page,
+                    "batch_size": nodes_per_page,
+                    "has_more": has_more,
+                    "request_id": "lineage-request",
+                },
+            }
+        )
+    return pages
+
+
+@pytest.fixture
+def lineage_api():
+    return AlationAPI(
+        base_url="https://mock-alation-instance.com",
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams("client-id", "client-secret"),
+        skip_instance_info=True,
+    )
+
+
+def serve_pages(api, pages, on_request=None):
+    remaining_pages = list(pages)
+
+    def lineage_stream(**kwargs):
+        if on_request is not None:
+            on_request(kwargs)
+        yield remaining_pages.pop(0)
+
+    return patch.object(api, "alation_lineage_stream", side_effect=lineage_stream)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_lineage_follows_pagination(lineage_api, prefetch):
+    pages = make_lineage_pages(3)
+    with serve_pages(lineage_api, pages) as mock_stream:
+        batches = list(
+            lineage_api.iter_lineage(
+                {"id": 1, "otype": "table"}, "downstream", prefetch=prefetch
+            )
+        )
+
+    assert batches == [page["graph"] for page in pages]
+    requests = [call.kwargs for call in mock_stream.call_args_list]
+    assert requests[0]["pagination"] is None
+    assert requests[1]["pagination"] == pages[0]["pagination"]
+    assert requests[2]["pagination"] == pages[1]["pagination"]
+    assert all(
+        request["processing_mode"] == LineageGraphProcessingOptions.CHUNKED
+        for request in requests
+    )
+
+
+def test_iter_lineage_stops_at_max_nodes(lineage_api):
+    pages = make_lineage_pages(5, nodes_per_page=2)
+    with serve_pages(lineage_api, pages) as mock_stream:
+        batches = list(
+            lineage_api.iter_lineage(
+                {"id": 1, "otype": "table"}, "downstream", max_nodes=3
+            )
+        )
+
+    assert [[node["id"] for node in batch] for batch in batches] == [[0, 1], [2]]
+    assert mock_stream.call_count == 2
+
+
+def test_iter_lineage_prefetches_next_page(lineage_api):
+    pages = make_lineage_pages(2)
+    second_request = threading.Event()
+
+    def on_request(kwargs):
+        if kwargs["pagination"] is not None:
+            second_request.set()
+
+    with serve_pages(lineage_api, pages, on_request):
+        batches = lineage_api.iter_lineage({"id": 1, "otype": "table"}, "upstream")
+        assert next(batches) == pages[0]["graph"]
+        # Requested while the caller still holds the first batch
+        assert second_request.wait(timeout=5)
+        assert list(batches) == [pages[1]["graph"]]
+
+
+def test_iter_lineage_collapses_pages_as_they_arrive(lineage_api):
+    pages = make_lineage_pages(2)
+    pages[0]["graph"] = [
+        {"id": 1, "otype": "table", "neighbors": [{"id": 9, "otype": "etl"}]},
+        {"id": 2, "otype": "table", "neighbors": [{"id": 3, "otype": "table"}]},
+    ]
+    pages[1]["graph"] = [
+        {"id": 9, "otype": "etl", "neighbors": [{"id": 3, "otype": "table"}]},
+    ]
+    with serve_pages(lineage_api, pages):
+        batches = list(
+            lineage_api.iter_lineage(
+                {"id": 1, "otype": "table"}, "upstream", collapse_to_otypes=["table"]
+            )
+        )
+
+    # Table 1 waits for the ETL job linking it to table 3
+    assert batches == [
+        [{"id": 2, "otype": "table", "neighbors": [{"id": 3, "otype": "table"}]}],
+        [{"id": 1, "otype": "table", "neighbors": [{"id": 3, "otype": "table"}]}],
+    ]
+
+
+def test_iter_lineage_rejects_unexpected_response(lineage_api):
+    with serve_pages(lineage_api, [{"detail": "oops"}]):
+        with pytest.raises(AlationAPIError, match="Unexpected lineage response"):
+            list(lineage_api.iter_lineage({"id": 1, "otype": "table"}, "upstream"))
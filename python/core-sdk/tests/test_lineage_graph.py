@@ -0,0 +1,277 @@
+import copy
+import random
+
+import pytest
+
+from alation_ai_agent_sdk.lineage_filtering import (
+    build_filtered_graph,
+    filter_graph,
+    get_initial_graph_state,
+    get_node_object_key,
+    resolve_neighbors,
+)
+from alation_ai_agent_sdk.lineage_graph import (
+    LineageCollapser,
+    LineageGraph,
+    collapse_lineage_response,
+)
+
+
+def recursive_filter_graph(nodes, allowed_types):
+    """The recursive implementation filter_graph used to have."""
+    ordered_keys, key_to_node, visited = get_initial_graph_state(nodes)
+    for node in nodes:
+        resolve_neighbors(
+            get_node_object_key(node), key_to_node, visited, allowed_types
+        )
+    kept_keys = {
+        node_key
+        for node_key in visited
+        if key_to_node[node_key]["otype"] in allowed_types
+    }
+    filtered = build_filtered_graph(ordered_keys, kept_keys, key_to_node)
+    # It meant to list each neighbor once but kept one entry per path
+    for node in filtered:
+        unique = {}
+        for neighbor in node["neighbors"]:
+            unique.setdefault(get_node_object_key(neighbor), neighbor)
+        node["neighbors"] = list(unique.values())
+    return filtered
+
+
+def make_random_graph(seed, node_count=60):
+    """A DAG where only some nodes are listed at the top level, like a partial page."""
+    rng = random.Random(seed)
+    otypes = [
+        rng.choice(["table", "table", "etl", "dataflow"]) for _ in range(node_count)
+    ]
+
+    def entry(node_id):
+        return {
+            "id": node_id,
+            "otype": otypes[node_id],
+            "fully_qualified_name": f"7.schema.object_{node_id}",
+        }
+
+    nodes = []
+    for node_id in range(node_count):
+        if rng.random() < 0.2:
+            continue
+        node = entry(node_id)
+        node["is_temp"] = otypes[node_id] != "table"
+        later = range(node_id + 1, node_count)
+        node["neighbors"] = [
+            entry(target) for target in rng.sample(later, min(len(later), 3))
+        ]
+        nodes.append(node)
+    rng.shuffle(nodes)
+    return nodes
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_collapse_matches_the_recursive_filter(seed):
+    nodes = make_random_graph(seed)
+    expected = recursive_filter_graph(copy.deepcopy(nodes), {"table"})
+
+    assert filter_graph(nodes, {"table"}) == expected
+
+
+def node_keys(nodes):
+    return {
+        (node["otype"], node["id"]): [
+            (neighbor["otype"], neighbor["id"]) for neighbor in node["neighbors"]
+        ]
+        for node in nodes
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_collapsing_page_by_page_matches_the_whole_graph(seed):
+    nodes = make_random_graph(seed)
+    expected = LineageGraph(nodes).collapse_to_otypes({"table"})
+
+    collapser = LineageCollapser({"table"})
+    collapsed = []
+    for start in range(0, len(nodes), 7):
+        collapsed += collapser.add_page(nodes[start : start + 7])
+    collapsed += collapser.flush()
+
+    assert node_keys(collapsed) == node_keys(expected)
+    assert len(collapsed) == len(expected)
+
+
+def test_collapser_holds_nodes_until_their_omitted_neighbors_arrive():
+    collapser = LineageCollapser(["table"])
+
+    first = collapser.add_page(
+        [
+            {"id": 1, "otype": "table", "neighbors": [{"id": 10, "otype": "etl"}]},
+            {"id": 2, "otype": "table", "neighbors": [{"id": 3, "otype": "table"}]},
+            {"id": 5, "otype": "etl", "neighbors": []},
+        ]
+    )
+    second = collapser.add_page(
+        [{"id": 10, "otype": "etl", "neighbors": [{"id": 4, "otype": "table"}]}]
+    )
+
+    assert first == [
+        {"id": 2, "otype": "table", "neighbors": [{"id": 3, "otype": "table"}]}
+    ]
+    assert second == [
+        {"id": 1, "otype": "table", "neighbors": [{"id": 4, "otype": "table"}]}
+    ]
+    assert collapser.flush() == []
+
+
+def test_collapser_flush_treats_missing_nodes_as_dead_ends():
+    collapser = LineageCollapser(["table"])
+
+    assert (
+        collapser.add_page(
+            [{"id": 1, "otype": "table", "neighbors": [{"id": 10, "otype": "etl"}]}]
+        )
+        == []
+    )
+    assert collapser.flush() == [{"id": 1, "otype": "table", "neighbors": []}]
+
+
+def test_collapse_lineage_response():
+    response = {
+        "graph": [
+            {"id": 1, "otype": "table", "neighbors": [{"id": 10, "otype": "etl"}]},
+            {"id": 10, "otype": "etl", "neighbors": [{"id": 2, "otype": "table"}]},
+        ],
+        "direction": "downstream",
+        "pagination": None,
+    }
+    error = {"error": {"message": "Not found"}}
+
+    assert collapse_lineage_response(response, ["table"]) == {
+        "graph": [
+            {"id": 1, "otype": "table", "neighbors": [{"id": 2, "otype": "table"}]}
+        ],
+        "direction": "downstream",
+        "pagination": None,
+    }
+    assert collapse_lineage_response(error, ["table"]) is error
+
+
+def test_filter_graph_leaves_nodes_unchanged():
+    nodes = make_random_graph(0)
+    original = copy.deepcopy(nodes)
+
+    filter_graph(nodes, {"table"})
+
+    assert nodes == original
+
+
+def test_collapse_handles_deep_chains():
+    # Far deeper than the recursion limit
+    depth = 20_000
+    nodes = [
+        {
+            "id": node_id,
+            "otype": "table" if node_id in (0, depth) else "etl",
+            "neighbors": [
+                {"id": node_id + 1, "otype": "table" if node_id + 1 == depth else "etl"}
+            ],
+        }
+        for node_id in range(depth)
+    ]
+
+    filtered = LineageGraph(nodes).collapse_to_otypes({"table"})
+
+    assert filtered == [
+        {"id": 0, "otype": "table", "neighbors": [{"id": depth, "otype": "table"}]}
+    ]
+
+
+def test_collapse_skips_cycles_of_omitted_nodes():
+    nodes = [
+        {"id": 1, "otype": "table", "neighbors": [{"id": 2, "otype": "etl"}]},
+        {
+            "id": 2,
+            "otype": "etl",
+            "neighbors": [{"id": 3, "otype": "etl"}, {"id": 4, "otype": "table"}],
+        },
+        {"id": 3, "otype": "etl", "neighbors": [{"id": 2, "otype": "etl"}]},
+    ]
+
+    filtered = LineageGraph(nodes).collapse_to_otypes({"table"})
+
+    assert filtered[0]["neighbors"] == [{"id": 4, "otype": "table"}]
+
+
+def test_collapse_expands_cycles_entered_from_two_nodes():
+    nodes = [
+        {"id": 1, "otype": "table", "neighbors": [{"id": 2, "otype": "etl"}]},
+        {"id": 5, "otype": "table", "neighbors": [{"id": 3, "otype": "etl"}]},
+        {
+            "id": 2,
+            "otype": "etl",
+            "neighbors": [{"id": 3, "otype": "etl"}, {"id": 4, "otype": "table"}],
+        },
+        {
+            "id": 3,
+            "otype": "etl",
+            "neighbors": [{"id": 2, "otype": "etl"}, {"id": 6, "otype": "table"}],
+        },
+    ]
+
+    filtered = LineageGraph(nodes).collapse_to_otypes({"table"})
+
+    assert node_keys(filtered) == {
+        ("table", 1): [("table", 6), ("table", 4)],
+        ("table", 5): [("table", 6), ("table", 4)],
+    }
+
+
+def test_graph_interns_nodes_across_pages():
+    graph = LineageGraph(
+        [{"id": 1, "otype": "table", "neighbors": [{"id": 2, "otype": "table"}]}]
+    )
+    graph.add_nodes(
+        [
+            {
+                "id": 2,
+                "otype": "table",
+                "is_temp": False,
+                "neighbors": [{"id": 3, "otype": "etl"}],
+            }
+        ]
+    )
+
+    assert len(graph) == 3
+    two = graph.node_id("table", 2)
+    # The top level entry replaces the neighbor entry seen first
+    assert graph.data(two)["is_temp"] is False
+    assert list(graph.roots) == [graph.node_id("table", 1), two]
+    assert list(graph.neighbors(two)) == [graph.node_id("etl", 3)]
+    assert graph.otype(graph.node_id("etl", 3)) == "etl"
+    assert graph.node_id("table", 99) is None
+
+
+def test_walk_is_breadth_first_and_bounded():
+    nodes = [
+        {
+            "id": 1,
+            "otype": "table",
+            "neighbors": [{"id": 2, "otype": "table"}, {"id": 3, "otype": "table"}],
+        },
+        {"id": 2, "otype": "table", "neighbors": [{"id": 4, "otype": "table"}]},
+        {"id": 3, "otype": "table", "neighbors": [{"id": 4, "otype": "table"}]},
+        {"id": 4, "otype": "table", "neighbors": [{"id": 1, "otype": "table"}]},
+    ]
+    graph = LineageGraph(nodes)
+
+    walked = [
+        (graph.data(node_id)["id"], depth)
+        for node_id, depth in graph.walk(graph.node_id("table", 1))
+    ]
+    bounded = [
+        graph.data(node_id)["id"]
+        for node_id, _ in graph.walk(graph.node_id("table", 1), max_depth=1)
+    ]
+
+    assert walked == [(1, 0), (2, 1), (3, 1), (4, 2)]
+    assert bounded == [1, 2, 3]
@@ -0,0 +1,166 @@
+import urllib.request
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from alation_ai_agent_sdk.api import AlationAPI, AUTH_METHOD_SERVICE_ACCOUNT
+from alation_ai_agent_sdk.event import track_tool_execution
+from alation_ai_agent_sdk.metrics import (
+    HTTP_REQUESTS,
+    TOOL_CALLS,
+    TOOL_DURATION,
+    TOOL_IN_FLIGHT,
+    MetricsRegistry,
+    endpoint_label,
+    get_metrics,
+    render_openmetrics,
+    serve_openmetrics,
+)
+from alation_ai_agent_sdk.types import ServiceAccountAuthParams
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_histogram_buckets_and_quantiles(registry):
+    histogram = registry.histogram("latency", "Latency.", ["tool"], buckets=(1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value, tool="t")
+
+    snapshot = histogram.get(tool="t")
+
+    assert snapshot["count"] == 5
+    assert snapshot["sum"] == 16.5
+    assert snapshot["buckets"] == {1: 1, 2: 3, 4: 4, float("inf"): 5}
+    assert snapshot["p50"] == pytest.approx(1.75)
+    # Beyond the largest bound the quantile is capped at that bound
+    assert snapshot["p99"] == 4
+
+
+def test_counter_and_gauge(registry):
+    counter = registry.counter("calls", "Calls.", ["status"])
+    gauge = registry.gauge("in_flight", "In flight.")
+
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert counter.get(status="ok") == 3
+    assert counter.get(status="error") == 0
+    assert gauge.get() == 1
+
+
+def test_get_metrics_snapshot(registry):
+    registry.counter("calls", "Calls.", ["tool"]).inc(tool="search")
+
+    metrics = get_metrics(registry)
+
+    assert metrics == {
+        "calls": {
+            "type": "counter",
+            "help": "Calls.",
+            "samples": [{"labels": {"tool": "search"}, "value": 1}],
+        }
+    }
+
+
+def test_render_openmetrics(registry):
+    registry.counter("calls", "Tool calls.", ["tool"]).inc(tool='say "hi"')
+    registry.histogram("latency_seconds", "Latency.", buckets=(0.5,), unit="seconds")
+    registry.histogram("size", "Size.", buckets=(10,)).observe(3)
+
+    text = render_openmetrics(registry)
+
+    assert text.splitlines() == [
+        "# TYPE calls counter",
+        "# HELP calls Tool calls.",
+        'calls_total{tool="say \\"hi\\""} 1',
+        "# TYPE latency_seconds histogram",
+        "# UNIT latency_seconds seconds",
+        "# HELP latency_seconds Latency.",
+        "# TYPE size histogram",
+        "# HELP size Size.",
+        'size_bucket{le="10.0"} 1',
+        'size_bucket{le="+Inf"} 1',
+        "size_count 1",
+        "size_sum 3.0",
+        "# EOF",
+    ]
+
+
+def test_serve_openmetrics(registry):
+    registry.gauge("in_flight", "In flight.").set(2)
+    server = serve_openmetrics(0, registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "in_flight 2" in body
+    assert content_type.startswith("application/openmetrics-text")
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/integration/v2/table/", "/integration/v2/table/"),
+        ("/integration/v2/table/42/", "/integration/v2/table/:id/"),
+        (
+            "/api/v1/chats/0b6f4f6e-3c1a-4c3b-9d7e-2f1a3b4c5d6e",
+            "/api/v1/chats/:id",
+        ),
+        ("/api/v2/tool/v1", "/api/v2/tool/v1"),
+    ],
+)
+def test_endpoint_label(path, expected):
+    assert endpoint_label(path) == expected
+
+
+@patch("alation_ai_agent_sdk.event.get_event_queue")
+def test_tool_calls_are_recorded(mock_get_queue):
+    class MetricsTestTool:
+        def __init__(self):
+            self.api = Mock(spec=AlationAPI)
+
+        @track_tool_execution()
+        def run(self, fail=False):
+            assert TOOL_IN_FLIGHT.get(tool="MetricsTestTool") == 1
+            return {"error": "nope"} if fail else {"result": 1}
+
+    tool = MetricsTestTool()
+    calls_before = TOOL_CALLS.get(tool="MetricsTestTool", status="success")
+    errors_before = TOOL_CALLS.get(tool="MetricsTestTool", status="error")
+
+    tool.run()
+    tool.run(fail=True)
+
+    assert TOOL_CALLS.get(tool="MetricsTestTool", status="success") == calls_before + 1
+    assert TOOL_CALLS.get(tool="MetricsTestTool", status="error") == errors_before + 1
+    assert TOOL_IN_FLIGHT.get(tool="MetricsTestTool") == 0
+    assert TOOL_DURATION.get(tool="MetricsTestTool")["count"] >= 2
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_http_requests_are_recorded(mock_get):
+    api = AlationAPI(
+        base_url="https://metrics.example.com",
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams("id", "secret"),
+        skip_instance_info=True,
+    )
+    api.access_token = "token"
+    mock_get.return_value = MagicMock(status_code=200)
+    labels = {"method": "GET", "endpoint": "/integration/v2/table/:id/"}
+    before = HTTP_REQUESTS.get(status=200, **labels)
+
+    api._send_request("get", "https://metrics.example.com/integration/v2/table/7/")
+
+    assert HTTP_REQUESTS.get(status=200, **labels) == before + 1
@@ -0,0 +1,44 @@
+import pytest
+
+from alation_ai_agent_sdk.response_stats import estimate_output_size
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "search results",
+        "",
+        None,
+        True,
+        42,
+        3.5,
+        [],
+        {},
+        {"error": "Something went wrong"},
+        {"a": 1, "b": [1, 2, "x"], "c": {"d": None, "e": False}},
+        [{"id": 1, "name": "orders"}, ("x", 2)],
+    ],
+)
+def test_estimate_matches_str_for_small_values(value):
+    assert estimate_output_size(value) == len(str(value))
+
+
+def test_estimate_extrapolates_large_containers():
+    value = {
+        "graph": [
+            {"id": 10_000 + i, "otype": "table", "neighbors": [{"id": 20_000 + i}]}
+            for i in range(10_000)
+        ]
+    }
+
+    estimate = estimate_output_size(value, sample_size=100)
+
+    assert estimate == pytest.approx(len(str(value)), rel=0.05)
+
+
+def test_estimate_falls_back_to_str_for_other_types():
+    class Custom:
+        def __str__(self):
+            return "custom"
+
+    assert estimate_output_size(Custom()) == len("custom")
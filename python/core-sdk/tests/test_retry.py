@@ -0,0 +1,108 @@
+import email.utils
+import time
+from unittest.mock import patch
+
+import pytest
+
+from alation_ai_agent_sdk.retry import RetryPolicy, parse_retry_after
+
+
+def test_backoff_doubles_up_to_max_without_jitter():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3, jitter=False)
+
+    assert [policy.get_backoff(n) for n in range(5)] == [0.5, 1, 2, 3, 3]
+
+
+def test_backoff_jitter_stays_within_bound():
+    policy = RetryPolicy(backoff_base=1, backoff_max=10)
+
+    for n in range(6):
+        assert 0 <= policy.get_backoff(n) <= min(10, 2**n)
+
+
+def test_next_delay_stops_after_max_attempts():
+    retry = RetryPolicy(max_attempts=3, jitter=False).start()
+
+    assert retry.next_delay() == 0.5
+    assert retry.next_delay() == 1
+    assert retry.next_delay() is None
+    assert retry.attempts == 3
+
+
+def test_retry_after_raises_delay():
+    retry = RetryPolicy(jitter=False).start()
+
+    assert retry.next_delay(retry_after=4) == 4
+
+
+def test_retry_after_ignored_when_disabled():
+    retry = RetryPolicy(jitter=False, respect_retry_after=False).start()
+
+    assert retry.next_delay(retry_after=4) == 0.5
+
+
+def test_retry_after_beyond_backoff_max_gives_up():
+    retry = RetryPolicy(backoff_max=10).start()
+
+    assert retry.next_delay(retry_after=60) is None
+
+
+def test_deadline_stops_retries():
+    retry = RetryPolicy(jitter=False, deadline=5).start()
+
+    with patch("alation_ai_agent_sdk.retry.time.monotonic") as monotonic:
+        monotonic.return_value = retry.started_at + 4.8
+        assert retry.next_delay() is None
+        monotonic.return_value = retry.started_at + 4
+        assert retry.next_delay() == 0.5
+
+
+@pytest.mark.parametrize(
+    "method, retry_non_idempotent, expected",
+    [
+        ("GET", False, {429, 502, 503, 504}),
+        ("post", False, {429, 503}),
+        ("POST", True, {429, 502, 503, 504}),
+    ],
+)
+def test_retried_statuses_depend_on_method(method, retry_non_idempotent, expected):
+    retry = RetryPolicy(retry_non_idempotent=retry_non_idempotent).start(method)
+
+    statuses = (400, 429, 500, 502, 503, 504)
+    assert {s for s in statuses if retry.should_retry_status(s)} == expected
+
+
+def test_replace_keeps_other_settings():
+    policy = RetryPolicy(backoff_base=2, retry_statuses={503})
+
+    replaced = policy.replace(max_attempts=7)
+
+    assert replaced.max_attempts == 7
+    assert replaced.backoff_base == 2
+    assert replaced.retry_statuses == {503}
+    assert policy.max_attempts == 3
+
+
+def test_max_attempts_must_be_positive():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("", None), ("12", 12.0), (" 3 ", 3.0), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+    assert 28 <= parse_retry_after(value) <= 30
+
+
+def test_parse_retry_after_past_date():
+    value = email.utils.formatdate(time.time() - 30, usegmt=True)
+
+    assert parse_retry_after(value) == 0
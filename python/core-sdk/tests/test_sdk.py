@@ -3,6 +3,7 @@ import requests
 from unittest.mock import MagicMock, patch
 
 from alation_ai_agent_sdk.sdk import (
+    AgentSDKOptions,
     AlationAIAgentSDK,
     AlationTools,
 )
@@ -43,7 +44,7 @@ CONTEXT_RESPONSE_SUCCESS = {"some_context_key": "some_context_value"}
 
 @pytest.fixture
 def mock_requests_post(monkeypatch):
-    """Mocks requests.post for all relevant endpoints."""
+    """Mocks pooled session POSTs for all relevant endpoints."""
     mock_post_responses = {}
 
     def _add_mock_response(
@@ -113,13 +114,15 @@ def mock_requests_post(monkeypatch):
         )
         return fallback_response
 
-    monkeypatch.setattr(requests, "post", mock_post_router)
+    monkeypatch.setattr(
+        requests.Session, "post", lambda _session, *a, **kw: mock_post_router(*a, **kw)
+    )
     return _add_mock_response
 
 
 @pytest.fixture
 def mock_requests_get(monkeypatch):
-    """Mocks requests.get for all relevant endpoints."""
+    """Mocks pooled session GETs for all relevant endpoints."""
     mock_get_responses = {}
 
     def _add_mock_response(
@@ -174,7 +177,9 @@ def mock_requests_get(monkeypatch):
         )
         return fallback_response
 
-    monkeypatch.setattr(requests, "get", mock_get_router)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda _session, *a, **kw: mock_get_router(*a, **kw)
+    )
     return _add_mock_response
 
 
@@ -261,7 +266,7 @@ def test_sdk_invalid_initialization(
             AUTH_METHOD_SERVICE_ACCOUNT,
             ServiceAccountAuthParams(MOCK_CLIENT_ID, MOCK_CLIENT_SECRET),
             [True, False, True, True, True],
-            4,
+            2,
         ),
     ],
 )
@@ -273,7 +278,7 @@ def test_token_reuse_and_refresh(
     side_effect,
     expected_token_valid_calls,
 ):
-    """Test token reuse and refresh for both auth methods."""
+    """Test token reuse and refresh when the token is validated on the server."""
     mock_requests_post(
         "createAPIAccessToken", response_json=REFRESH_TOKEN_RESPONSE_SUCCESS
     )
@@ -293,7 +298,9 @@ def test_token_reuse_and_refresh(
         auth_method=auth_method,
         auth_params=auth_params,
         dist_version="test-dist-version",
+        sdk_options=AgentSDKOptions(validate_token_on_server=True),
     )
+    sdk.api.ensure_instance_info()
     sdk.api.access_token = "mock-access-token"  # Ensure access_token is set
 
     with (
@@ -308,6 +315,8 @@ def test_token_reuse_and_refresh(
             wraps=sdk.api._generate_new_token,
         ) as spy_generate_token,
         patch("alation_ai_agent_sdk.tools.logger.warning") as mock_logger_warning,
+        # Telemetry validates the token from the background worker; leave it out
+        patch("alation_ai_agent_sdk.event.get_event_queue"),
     ):
         sdk.get_context("first question")  # Valid token reused
         sdk.get_context("second question")  # Token refreshed
@@ -320,6 +329,42 @@ def test_token_reuse_and_refresh(
         assert spy_generate_token.call_count == 1
 
 
+def test_token_reuse_with_local_expiry(mock_requests_post, mock_requests_get):
+    """Test that a token with a known expiry is reused without server validation."""
+    mock_requests_post("oauth/v2/token", response_json=JWT_RESPONSE_SUCCESS)
+    mock_requests_get("license", response_json={"is_cloud": True})
+    mock_requests_get(
+        "full_version", response_json={"ALATION_RELEASE_NAME": "2025.1.2"}
+    )
+    mock_requests_post(
+        "alation_context_tool/stream", response_json=CONTEXT_RESPONSE_SUCCESS
+    )
+    mock_requests_post("ai_agent/tool/event", response_json={"status": "success"})
+
+    sdk = AlationAIAgentSDK(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams(MOCK_CLIENT_ID, MOCK_CLIENT_SECRET),
+    )
+    sdk.api.ensure_instance_info()
+    assert sdk.api.access_token == JWT_RESPONSE_SUCCESS["access_token"]
+    assert sdk.api.access_token_expires_at is not None
+
+    with (
+        patch.object(sdk.api, "_token_is_valid_on_server") as mock_token_valid,
+        patch.object(
+            sdk.api,
+            "_generate_new_token",
+            wraps=sdk.api._generate_new_token,
+        ) as spy_generate_token,
+    ):
+        sdk.get_context("first question")
+        sdk.get_context("second question")
+
+        mock_token_valid.assert_not_called()
+        spy_generate_token.assert_not_called()
+
+
 def test_error_handling_in_token_validation(mock_requests_post, mock_requests_get):
     """Test that errors in token validation raise AlationAPIError."""
     # Mock all required endpoints for SDK initialization
@@ -383,7 +428,28 @@ def test_lineage_beta_tools_disabled_by_default(
     assert AlationTools.LINEAGE not in sdk.enabled_beta_tools
 
 
-@patch("alation_ai_agent_sdk.api.requests.get")
+def test_tools_are_built_on_first_use():
+    sdk = AlationAIAgentSDK(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams(MOCK_CLIENT_ID, MOCK_CLIENT_SECRET),
+        enabled_tools={AlationTools.AGGREGATED_CONTEXT, AlationTools.BULK_RETRIEVAL},
+        sdk_options=AgentSDKOptions(skip_instance_info=True),
+    )
+    assert not [name for name in vars(sdk) if name.endswith("_tool")]
+
+    tools = sdk.get_tools()
+
+    assert tools == [sdk.context_tool, sdk.bulk_retrieval_tool]
+    assert sorted(name for name in vars(sdk) if name.endswith("_tool")) == [
+        "bulk_retrieval_tool",
+        "context_tool",
+    ]
+    assert tools[0].api is sdk.api
+    assert sdk.get_tools()[0] is tools[0]
+
+
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
 def test_user_agent_header_populated_in_api_calls(
     mock_requests_get_patch, mock_requests_post, mock_requests_get
 ):
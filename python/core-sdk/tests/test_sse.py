@@ -0,0 +1,70 @@
+from alation_ai_agent_sdk.sse import SSEDecoder, SSEEvent
+
+
+def decode(stream: bytes, chunk_size: int):
+    decoder = SSEDecoder()
+    events = []
+    for i in range(0, len(stream), chunk_size):
+        events += decoder.feed(stream[i : i + chunk_size])
+    return events + decoder.flush()
+
+
+def test_single_line_events():
+    stream = b'data: {"a": 1}\n\ndata: {"b": 2}\n\n'
+
+    assert decode(stream, len(stream)) == [
+        SSEEvent(data=b'{"a": 1}'),
+        SSEEvent(data=b'{"b": 2}'),
+    ]
+
+
+def test_fields_and_comments():
+    stream = (
+        b": heartbeat\n"
+        b"event: delta\n"
+        b"id: 42\n"
+        b"retry: 1500\n"
+        b"data: first\n"
+        b"data:second\n"
+        b"\n"
+        b"data: next\n"
+        b"\n"
+    )
+
+    assert decode(stream, len(stream)) == [
+        SSEEvent(data=b"first\nsecond", event="delta", id="42", retry=1500),
+        # The last event id carries over, the event type does not
+        SSEEvent(data=b"next", event="message", id="42", retry=1500),
+    ]
+
+
+def test_every_line_ending_and_chunk_boundary():
+    stream = b"data: a\r\ndata: b\r\n\r\ndata: c\rdata: d\r\rdata: e\n\n"
+    expected = [
+        SSEEvent(data=b"a\nb"),
+        SSEEvent(data=b"c\nd"),
+        SSEEvent(data=b"e"),
+    ]
+
+    for chunk_size in range(1, len(stream) + 1):
+        assert decode(stream, chunk_size) == expected
+
+
+def test_empty_data_is_not_dispatched():
+    stream = b"data\n\nevent: ignored\n\ndata\ndata\n\n"
+
+    assert decode(stream, len(stream)) == [SSEEvent(data=b"\n")]
+
+
+def test_invalid_fields_are_ignored():
+    stream = b"id: bad\x00id\nretry: soon\nunknown: x\ndata: ok\n\n"
+
+    assert decode(stream, len(stream)) == [SSEEvent(data=b"ok")]
+
+
+def test_flush_dispatches_trailing_event():
+    decoder = SSEDecoder()
+
+    assert decoder.feed(b"data: partial\ndata: end") == []
+    assert decoder.flush() == [SSEEvent(data=b"partial\nend")]
+    assert decoder.flush() == []
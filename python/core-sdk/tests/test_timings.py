@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+import pytest
+
+from alation_ai_agent_sdk.timings import PhaseTimings
+
+
+@pytest.fixture
+def clock():
+    with patch("alation_ai_agent_sdk.timings.time.perf_counter") as perf_counter:
+        perf_counter.return_value = 100.0
+        yield perf_counter
+
+
+def test_mark_closes_phases(clock):
+    timings = PhaseTimings("tool")
+    clock.return_value = 100.25
+    timings.mark("auth")
+    clock.return_value = 101.0
+    timings.mark("request")
+
+    assert timings.as_dict() == {"auth": 250.0, "request": 750.0, "total": 1000.0}
+
+
+def test_timed_work_is_kept_out_of_the_enclosing_phase(clock):
+    timings = PhaseTimings("tool")
+
+    def decode():
+        clock.return_value += 0.5
+
+    decode = timings.timed("decode", decode)
+    clock.return_value = 101.0
+    decode()
+    decode()
+    clock.return_value += 1
+    timings.mark("stream")
+
+    assert timings.as_dict() == {"decode": 1000.0, "stream": 2000.0, "total": 3000.0}
+
+
+def test_timed_passes_arguments_and_result():
+    timings = PhaseTimings("tool")
+
+    assert timings.timed("decode", lambda a, b=0: a + b)(1, b=2) == 3
+    assert set(timings.phases) == {"decode"}
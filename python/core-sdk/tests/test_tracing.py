@@ -0,0 +1,204 @@
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from alation_ai_agent_sdk import tracing
+from alation_ai_agent_sdk.api import AlationAPI, AUTH_METHOD_SERVICE_ACCOUNT
+from alation_ai_agent_sdk.event import track_tool_execution
+from alation_ai_agent_sdk.types import ServiceAccountAuthParams
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:
+    TracerProvider = None
+
+requires_otel_sdk = pytest.mark.skipif(
+    TracerProvider is None, reason="opentelemetry-sdk is not installed"
+)
+
+MOCK_BASE_URL = "https://tracing.example.com"
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+TRACEPARENT = f"00-{TRACE_ID}-b7ad6b7169203331-01"
+
+_exporter = None
+
+
+@pytest.fixture
+def spans():
+    """Finished spans, recorded by a tracer provider installed once per session."""
+    global _exporter
+    if _exporter is None:
+        _exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(_exporter))
+        trace.set_tracer_provider(provider)
+    _exporter.clear()
+    return _exporter
+
+
+@pytest.fixture
+def api():
+    api = AlationAPI(
+        base_url=MOCK_BASE_URL,
+        auth_method=AUTH_METHOD_SERVICE_ACCOUNT,
+        auth_params=ServiceAccountAuthParams("id", "secret"),
+        skip_instance_info=True,
+    )
+    api.access_token = "token"
+    api.access_token_expires_at = time.time() + 3600
+    return api
+
+
+def make_response(status_code, chunks=()):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"".join(chunks) if chunks else b"{}"
+    response._content_consumed = True
+    response.raw = MagicMock(chunked=False)
+    return response
+
+
+def get_span(spans, name):
+    (span,) = [span for span in spans.get_finished_spans() if span.name == name]
+    return span
+
+
+def test_helpers_do_nothing_without_opentelemetry():
+    def func():
+        return "done"
+
+    stream = iter([])
+    headers = {}
+    with (
+        patch("alation_ai_agent_sdk.tracing._tracer", None),
+        patch("alation_ai_agent_sdk.tracing._load_opentelemetry", return_value=False),
+    ):
+        assert tracing.traced("name")(func)() == "done"
+        assert tracing.trace_stream("name", stream) is stream
+        assert tracing.start_span("name") is None
+        with tracing.start_http_span("get", MOCK_BASE_URL) as span:
+            assert span is None
+        tracing.inject_trace_context(headers)
+
+    assert headers == {}
+
+
+def test_nothing_is_traced_until_an_sdk_is_configured():
+    otel_trace = pytest.importorskip("opentelemetry.trace")
+    stream = iter([])
+    with patch.object(
+        otel_trace,
+        "get_tracer_provider",
+        return_value=otel_trace.ProxyTracerProvider(),
+    ):
+        assert not tracing.tracing_enabled()
+        assert tracing.trace_stream("name", stream) is stream
+        assert tracing.start_span("name") is None
+
+
+@requires_otel_sdk
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_http_call_is_a_client_span_with_traceparent(mock_get, api, spans):
+    mock_get.return_value = make_response(200)
+
+    api._send_request("get", f"{MOCK_BASE_URL}/integration/v2/table/7/?name=x")
+
+    span = get_span(spans, "GET /integration/v2/table/:id/")
+    assert span.kind == trace.SpanKind.CLIENT
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["server.address"] == "tracing.example.com"
+    traceparent = mock_get.call_args.kwargs["headers"]["traceparent"]
+    assert traceparent.split("-")[1:3] == [
+        f"{span.context.trace_id:032x}",
+        f"{span.context.span_id:016x}",
+    ]
+
+
+@requires_otel_sdk
+@patch("alation_ai_agent_sdk.api.requests.Session.get")
+def test_token_remint_is_a_child_span(mock_get, api, spans):
+    mock_get.side_effect = [make_response(401), make_response(200)]
+
+    with patch.object(api, "_generate_new_token"):
+        api._send_request("get", f"{MOCK_BASE_URL}/integration/v2/table/")
+
+    http_span = get_span(spans, "GET /integration/v2/table/")
+    refresh_span = get_span(spans, "alation.auth.refresh")
+    assert refresh_span.parent.span_id == http_span.context.span_id
+
+
+@requires_otel_sdk
+@patch("alation_ai_agent_sdk.event.get_event_queue")
+@patch("alation_ai_agent_sdk.api.requests.Session.post")
+def test_streamed_tool_run_spans(mock_post, mock_get_queue, api, spans):
+    events = [{"step": 1}, {"step": 2}]
+    mock_post.return_value = make_response(
+        200, [f"data: {json.dumps(event)}\n\n".encode() for event in events]
+    )
+    api.enable_streaming = True
+
+    class TracedTool:
+        def __init__(self, api):
+            self.api = api
+
+        @track_tool_execution()
+        def run(self):
+            return self.api._safe_sse_post_request(
+                tool_name="traced_tool", url=f"{MOCK_BASE_URL}/stream", payload={}
+            )
+
+    stream = TracedTool(api).run()
+    assert next(stream) == {"step": 1}
+    # The tool span stays open while the stream is being consumed
+    assert not [span for span in spans.get_finished_spans() if "tool" in span.name]
+    assert list(stream) == [{"step": 2}]
+
+    tool_span = get_span(spans, "alation.tool TracedTool")
+    sse_span = get_span(spans, "alation.sse traced_tool")
+    http_span = get_span(spans, "POST /stream")
+    assert sse_span.parent.span_id == tool_span.context.span_id
+    assert http_span.parent.span_id == sse_span.context.span_id
+    assert sse_span.attributes["alation.stream.event_count"] == 2
+
+
+@requires_otel_sdk
+def test_tool_error_marks_span(api, spans):
+    class FailingTool:
+        def __init__(self, api):
+            self.api = api
+
+        @track_tool_execution()
+        def run(self):
+            return {"error": {"message": "Not found"}}
+
+    with patch("alation_ai_agent_sdk.event.get_event_queue"):
+        FailingTool(api).run()
+
+    span = get_span(spans, "alation.tool FailingTool")
+    assert span.status.status_code == trace.StatusCode.ERROR
+    assert span.status.description == "Not found"
+
+
+@requires_otel_sdk
+def test_traced_joins_the_incoming_trace(spans):
+    @tracing.traced(
+        "mcp.tool search",
+        kind=tracing.SPAN_KIND_SERVER,
+        get_carrier=lambda: {"traceparent": TRACEPARENT},
+    )
+    def handler():
+        return "done"
+
+    assert handler() == "done"
+
+    span = get_span(spans, "mcp.tool search")
+    assert f"{span.context.trace_id:032x}" == TRACE_ID
+    assert span.kind == trace.SpanKind.SERVER
@@ -3,7 +3,9 @@ Authentication module for Alation MCP Server.
 
 This module provides authentication functionality for both STDIO and HTTP modes:
 
-- AlationTokenVerifier: Validates OAuth tokens against Alation's userinfo endpoint
+- AlationTokenVerifier: Validates OAuth tokens against Alation's userinfo endpoint,
+  or locally as JWTs signed with the keys of the instance (--token-verification jwt)
+- AlationJWKS: Cached signing keys (JWKS) of the Alation instance
 - get_stdio_auth_params(): Loads authentication configuration from environment variables
 
 STDIO Mode Authentication:
@@ -13,7 +15,7 @@ STDIO Mode Authentication:
 HTTP Mode Authentication:
 - Validates incoming Bearer tokens via AlationTokenVerifier
 - Integrates with FastMCP's authentication middleware
-- Per-request token validation and user identification
+- Per-request token validation and user identification, cached per token
 
 Environment Variables:
 
@@ -29,27 +31,177 @@ Optional configuration:
 - ALATION_DISABLED_TOOLS: Comma-separated list of tools to disable
 - ALATION_ENABLED_BETA_TOOLS: Comma-separated list of beta tools to enable
 - MCP_EXTERNAL_URL: External URL for HTTP mode load balancer support
+- ALATION_JWKS_URL: JWKS endpoint for JWT verification, when it can't be discovered
+  from the OAuth metadata of the instance
+- ALATION_JWT_ISSUER: Issuer expected in JWTs, when it can't be discovered from the
+  OAuth metadata of the instance
 
 Note: HTTP mode uses OAuth headers instead of authentication environment variables
 """
 
+import asyncio
+import hashlib
 import os
 import time
 import logging
+from collections.abc import Callable
 
 import httpx
+import jwt
 from fastmcp.server.auth import AccessToken
 from fastmcp.server.auth import TokenVerifier
 
-from alation_ai_agent_sdk import ServiceAccountAuthParams
+from alation_ai_agent_sdk import ServiceAccountAuthParams, TTLCache
+
+# Lifetime given to tokens verified with the userinfo endpoint, which doesn't
+# report an expiry
+DEFAULT_TOKEN_LIFETIME_IN_SECONDS = 3600
+# Tokens accepted by the userinfo endpoint are trusted this long before it is asked
+# again, which bounds how long a revoked or logged-out token keeps working
+DEFAULT_OPAQUE_TOKEN_TTL_IN_SECONDS = 300
+# Rejected tokens are remembered this long so retries don't reach Alation
+DEFAULT_REJECTED_TOKEN_TTL_IN_SECONDS = 30
+DEFAULT_VERIFICATION_CACHE_MAXSIZE = 1024
+DEFAULT_VERIFICATION_TIMEOUT_IN_SECONDS = 5.0
+
+# Signing keys are refetched this often to pick up added and revoked keys
+DEFAULT_JWKS_REFRESH_INTERVAL_IN_SECONDS = 3600
+# Tokens signed with an unknown key trigger a refetch at most this often
+DEFAULT_JWKS_MIN_REFRESH_INTERVAL_IN_SECONDS = 60
+# Clock skew tolerated when checking exp, nbf and iat
+DEFAULT_JWT_LEEWAY_IN_SECONDS = 30
+# RFC 8414 metadata, where the instance advertises its jwks_uri and issuer
+OAUTH_METADATA_PATH = "/.well-known/oauth-authorization-server"
+
+
+class AlationJWKS:
+    """
+    Signing keys of an Alation instance, fetched from its JWKS endpoint and cached.
+
+    Keys are refetched every `refresh_interval` seconds. A token signed with a key
+    id that isn't cached triggers an early refetch, at most once per
+    `min_refresh_interval` seconds, which picks up rotated keys without letting
+    bogus key ids flood the endpoint. When a refetch fails, the keys already
+    cached stay in use. Concurrent refetches share one request.
+
+    The endpoint and the expected token issuer, unless given, are read from the
+    OAuth authorization server metadata of the instance. With `jwks_url`, keys are
+    still loaded when the metadata can't be fetched, but the issuer stays unknown.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        get_client: Callable[[], httpx.AsyncClient],
+        jwks_url: str | None = None,
+        issuer: str | None = None,
+        refresh_interval: float = DEFAULT_JWKS_REFRESH_INTERVAL_IN_SECONDS,
+        min_refresh_interval: float = DEFAULT_JWKS_MIN_REFRESH_INTERVAL_IN_SECONDS,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.jwks_url = jwks_url
+        self.issuer = issuer
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self._get_client = get_client
+        self._keys: dict[str | None, jwt.PyJWK] = {}
+        # Monotonic times of the last successful and the last attempted fetch
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._refresh: asyncio.Task | None = None
+
+    async def get_key(self, kid: str | None) -> jwt.PyJWK | None:
+        """
+        The signing key with id `kid`, or None when the instance has no such key.
+        A token without a key id may use the only key of the instance.
+        """
+        now = time.monotonic()
+        stale = (
+            self._fetched_at is None or now - self._fetched_at >= self.refresh_interval
+        )
+        throttled = (
+            self._attempted_at is not None
+            and now - self._attempted_at < self.min_refresh_interval
+        )
+        if (stale or self._find(kid) is None) and not throttled:
+            await self.refresh()
+        return self._find(kid)
+
+    async def refresh(self) -> None:
+        """Refetch the keys, sharing the request with concurrent callers."""
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._fetch())
+            self._refresh.add_done_callback(self._refresh_done)
+        await asyncio.shield(self._refresh)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh = None
+
+    def _find(self, kid: str | None) -> jwt.PyJWK | None:
+        if kid is None and len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(kid)
+
+    async def _fetch(self) -> None:
+        self._attempted_at = time.monotonic()
+        client = self._get_client()
+        try:
+            if self.jwks_url is None or self.issuer is None:
+                await self._fetch_metadata(client)
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+            keys = {}
+            for key_data in response.json().get("keys", []):
+                if key_data.get("use", "sig") != "sig":
+                    continue
+                try:
+                    key = jwt.PyJWK(key_data)
+                except jwt.PyJWKError as e:
+                    logging.warning(f"Skipping unusable signing key: {e}")
+                    continue
+                keys[key.key_id] = key
+        except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logging.error(f"Failed to fetch the signing keys of {self.base_url}: {e}")
+            return
+        if not keys:
+            logging.error(f"No signing keys found at {self.jwks_url}")
+            return
+        self._keys = keys
+        self._fetched_at = self._attempted_at
+        logging.info(f"Loaded {len(keys)} signing key(s) from {self.jwks_url}")
+
+    async def _fetch_metadata(self, client: httpx.AsyncClient) -> None:
+        try:
+            response = await client.get(f"{self.base_url}{OAUTH_METADATA_PATH}")
+            response.raise_for_status()
+            metadata = response.json()
+            if self.jwks_url is None:
+                self.jwks_url = metadata["jwks_uri"]
+            if self.issuer is None:
+                self.issuer = metadata.get("issuer")
+        except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+            if self.jwks_url is None:
+                raise
+            logging.error(
+                f"Failed to discover the token issuer of {self.base_url}: {e}"
+            )
 
 
 class AlationTokenVerifier(TokenVerifier):
-    """Token verifier for Alation OAuth authentication."""
+    """
+    Token verifier for Alation OAuth authentication.
+
+    With token_verification="opaque" tokens are checked with the userinfo endpoint.
+    With "jwt" they are verified in-process: the signature against the cached keys
+    of the instance (see AlationJWKS), then the expiry and the issuer.
+
+    Verification results are cached by a hash of the token: accepted JWTs until
+    they expire, tokens accepted by the userinfo endpoint for `opaque_token_ttl`
+    seconds and rejected ones for `rejected_token_ttl` seconds. Concurrent requests with the same
+    unverified token share one call to Alation, and calls reuse the connections of
+    a long-lived client. Call aclose() to release it.
+    """
 
-    # NOTE: this logic works for opaque token, but if JWT is enabled, we should consider
-    # using the /introspect flow as it doesn't require the userinfo endpoint
-    #
     # See if you can pass base_url value dynamically either from the JWT payload or header
 
     def __init__(
@@ -58,6 +210,12 @@ class AlationTokenVerifier(TokenVerifier):
         token_verification: str = "opaque",
         userinfo_path: str = "/integration/v1/userinfo/",
         jwt_introspect_path: str = "/oauth/v2/introspect/",
+        cache_maxsize: int = DEFAULT_VERIFICATION_CACHE_MAXSIZE,
+        rejected_token_ttl: float = DEFAULT_REJECTED_TOKEN_TTL_IN_SECONDS,
+        opaque_token_ttl: float = DEFAULT_OPAQUE_TOKEN_TTL_IN_SECONDS,
+        jwks_url: str | None = None,
+        issuer: str | None = None,
+        audience: str | None = None,
     ) -> None:
         # DESIGN DECISION: base_url is not validated to require HTTPS.
         # This allows for local development and testing with HTTP endpoints.
@@ -69,63 +227,196 @@ class AlationTokenVerifier(TokenVerifier):
         # Required by FastMCP RemoteAuthProvider
         # Neither auth modes require specific OAuth scopes
         self.required_scopes: list[str] = []
+        # Entries also hold the token expiry, checked on every hit. Opaque tokens
+        # have no real expiry, so they are only kept for opaque_token_ttl; 0
+        # verifies each request with Alation.
+        verified_ttl = (
+            DEFAULT_TOKEN_LIFETIME_IN_SECONDS
+            if token_verification == "jwt"
+            else opaque_token_ttl
+        )
+        self._verified = (
+            TTLCache(maxsize=cache_maxsize, ttl=verified_ttl)
+            if verified_ttl > 0
+            else None
+        )
+        # A rejected_token_ttl of 0 disables caching rejections
+        self._rejected = (
+            TTLCache(maxsize=cache_maxsize, ttl=rejected_token_ttl)
+            if rejected_token_ttl > 0
+            else None
+        )
+        self._pending: dict[str, asyncio.Task] = {}
+        self._client: httpx.AsyncClient | None = None
+        # JWT verification only. The issuer defaults to the one advertised by the
+        # instance, and tokens are rejected while it is unknown; the audience isn't
+        # checked unless given.
+        self.issuer = issuer or os.getenv("ALATION_JWT_ISSUER")
+        self.jwks = AlationJWKS(
+            base_url,
+            self._get_client,
+            jwks_url or os.getenv("ALATION_JWKS_URL"),
+            self.issuer,
+        )
+        self.audience = audience
+
+    async def aclose(self) -> None:
+        """Close the HTTP client; a new one is created by the next verification."""
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.aclose()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=DEFAULT_VERIFICATION_TIMEOUT_IN_SECONDS)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
 
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify OAuth token with Alation userinfo endpoint."""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        access_token = self._verified.get(key) if self._verified is not None else None
+        if access_token is not None:
+            if access_token.expires_at is None or access_token.expires_at > time.time():
+                return access_token
+            self._verified.invalidate(lambda cached_key: cached_key == key)
+        if self._rejected is not None and self._rejected.get(key):
+            return None
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._verify_and_cache(key, token))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shielded so a caller that goes away doesn't cancel the others' call
+        return await asyncio.shield(pending)
+
+    async def _verify_and_cache(self, key: str, token: str) -> AccessToken | None:
+        if self.token_verification == "jwt":
+            access_token, rejected = await self._verify_jwt(token)
+        else:
+            access_token, rejected = await self._verify_with_userinfo(token)
+        if access_token is not None:
+            if self._verified is not None:
+                self._verified.set(key, access_token)
+        elif rejected and self._rejected is not None:
+            self._rejected.set(key, True)
+        return access_token
+
+    async def _verify_jwt(self, token: str) -> tuple[AccessToken | None, bool]:
+        """Verify a JWT in-process. Returns the same as _verify_with_userinfo."""
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.InvalidTokenError as e:
+            logging.warning(f"Token verification failed: Not a valid JWT: {e}")
+            return None, True
+        key = await self.jwks.get_key(kid)
+        if key is None:
+            if not self.jwks._keys:
+                # The keys couldn't be fetched, which says nothing about the token
+                return None, False
+            logging.warning(f"Token verification failed: Unknown signing key {kid}")
+            return None, True
+        issuer = self.jwks.issuer
+        if issuer is None:
+            # jwt.decode skips the issuer check without one, which would accept
+            # tokens issued by anyone trusted with these keys
+            logging.error(
+                "Token verification failed: Unknown token issuer, set ALATION_JWT_ISSUER"
+            )
+            return None, False
+        try:
+            claims = jwt.decode(
+                token,
+                key=key,
+                # Only the algorithm of the key, so a token can't pick a weaker one
+                algorithms=[key.algorithm_name],
+                audience=self.audience,
+                issuer=issuer,
+                leeway=DEFAULT_JWT_LEEWAY_IN_SECONDS,
+                options={
+                    "require": ["exp"],
+                    "verify_aud": self.audience is not None,
+                },
+            )
+        except jwt.InvalidTokenError as e:
+            logging.warning(f"Token verification failed: {e}")
+            return None, True
+        client_id = claims.get("client_id") or claims.get("azp") or claims.get("sub")
+        scope = claims.get("scope") or claims.get("scp") or "openid"
+        return (
+            AccessToken(
+                token=token,
+                client_id=str(client_id or "alation_client_id"),
+                scopes=scope.split() if isinstance(scope, str) else list(scope),
+                expires_at=int(claims["exp"]),
+                claims=claims,
+            ),
+            False,
+        )
+
+    async def _verify_with_userinfo(
+        self, token: str
+    ) -> tuple[AccessToken | None, bool]:
+        """
+        Returns the access token, or None and whether Alation rejected the token.
+        Failures that say nothing about the token, like timeouts, aren't rejections.
+        """
         userinfo_url = f"{self.base_url}{self.userinfo_path}"
-        # TBD: Figure out how support multiple token_verification flows
-        # - get client id and secret for introspection flow where possible
-        # introspect_url = f"{self.base_url}{self.jwt_introspect_path}"
         headers = {"Authorization": f"Bearer {token}"}
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            try:
-                response = await client.get(userinfo_url, headers=headers)
-                if response.status_code == 200:
-                    userinfo = response.json()
-                    # DESIGN DECISION: Token expiry is hardcoded to 1 hour (3600 seconds).
-                    # This is intentional for simplicity and compatibility with FastMCP's token caching.
-                    # The userinfo endpoint doesn't provide expiry information, and using
-                    # introspection would add unnecessary overhead for each request.
-                    return AccessToken(
+        client = self._get_client()
+        try:
+            response = await client.get(userinfo_url, headers=headers)
+            if response.status_code == 200:
+                userinfo = response.json()
+                # DESIGN DECISION: Token expiry is hardcoded to 1 hour (3600 seconds).
+                # This is intentional for simplicity and compatibility with FastMCP's token caching.
+                # The userinfo endpoint doesn't provide expiry information, and using
+                # introspection would add unnecessary overhead for each request.
+                return (
+                    AccessToken(
                         token=token,
                         client_id=str(userinfo.get("id", "alation_client_id")),
                         scopes=[userinfo.get("role", "openid")],
-                        expires_at=int(time.time()) + 3600,
-                    )
-                elif response.status_code == 401:
-                    logging.warning(
-                        "Token verification failed: Invalid or expired token"
-                    )
-                    return None
-                elif response.status_code == 403:
-                    logging.warning(
-                        "Token verification failed: Insufficient permissions"
-                    )
-                    return None
-                elif response.status_code == 404:
-                    logging.error(
-                        f"Token verification failed: Userinfo endpoint not found at {userinfo_url}"
-                    )
-                    return None
-                else:
-                    logging.warning(
-                        f"Token verification failed with status {response.status_code}: {response.text}"
-                    )
-                    return None
-            except httpx.TimeoutException as e:
-                logging.error(f"Token verification timed out after 5 seconds: {e}")
-                return None
-            except httpx.ConnectError as e:
+                        expires_at=int(time.time()) + DEFAULT_TOKEN_LIFETIME_IN_SECONDS,
+                    ),
+                    False,
+                )
+            elif response.status_code == 401:
+                logging.warning("Token verification failed: Invalid or expired token")
+                return None, True
+            elif response.status_code == 403:
+                logging.warning("Token verification failed: Insufficient permissions")
+                return None, True
+            elif response.status_code == 404:
                 logging.error(
-                    f"Failed to connect to Alation instance at {self.base_url}: {e}"
+                    f"Token verification failed: Userinfo endpoint not found at {userinfo_url}"
+                )
+                return None, False
+            else:
+                logging.warning(
+                    f"Token verification failed with status {response.status_code}: {response.text}"
                 )
-                return None
-            except httpx.RequestError as e:
-                logging.error(f"Network error during token verification: {e}")
-                return None
-            except Exception as e:
-                logging.error(f"Unexpected error verifying token: {e}")
-                return None
+                return None, False
+        except httpx.TimeoutException as e:
+            logging.error(
+                f"Token verification timed out after {DEFAULT_VERIFICATION_TIMEOUT_IN_SECONDS:g} seconds: {e}"
+            )
+            return None, False
+        except httpx.ConnectError as e:
+            logging.error(
+                f"Failed to connect to Alation instance at {self.base_url}: {e}"
+            )
+            return None, False
+        except httpx.RequestError as e:
+            logging.error(f"Network error during token verification: {e}")
+            return None, False
+        except Exception as e:
+            logging.error(f"Unexpected error verifying token: {e}")
+            return None, False
 
 
 def get_stdio_auth_params() -> tuple[str, ServiceAccountAuthParams]:
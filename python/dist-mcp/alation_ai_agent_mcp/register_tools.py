@@ -11,20 +11,31 @@ Key Components:
 
 Authentication Patterns:
 - STDIO mode: Uses a shared, pre-configured AlationAIAgentSDK instance
-- HTTP mode: Creates per-request SDK instances using FastMCP's get_access_token()
+- HTTP mode: Uses the AsyncAlationAIAgentSDK of the request's token, from an SDKPool,
+  using FastMCP's get_access_token()
+
+Handlers are coroutines. Async SDKs run on the event loop, so concurrent HTTP calls
+cost sockets rather than threads; calls to a sync SDK run in a worker thread. At
+most max_concurrent_tool_calls calls run at once, the rest wait for a slot.
+
+Streamed results (the HTTP mode SDKs stream) are consumed as they arrive: each
+event is relayed to the client as an MCP progress notification and only the last
+event, the same result a non-streaming SDK returns, goes back as the tool result.
 
 Each tool is conditionally registered based on SDK configuration. Tools use the
 get_tool_metadata() utility function for consistent metadata retrieval.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import contextlib
+import inspect
 import logging
 
 from alation_ai_agent_sdk import (
-    AgentSDKOptions,
     AlationAIAgentSDK,
     AlationTools,
-    BearerTokenAuthParams,
+    AsyncAlationAIAgentSDK,
 )
 from alation_ai_agent_sdk.utils import is_tool_enabled, get_tool_metadata
 from alation_ai_agent_sdk.tools import (
@@ -45,13 +56,105 @@ from alation_ai_agent_sdk.tools import (
     GetDataSourcesTool,
     CustomAgentTool,
 )
+from alation_ai_agent_sdk.tracing import SPAN_KIND_SERVER, traced
 from fastmcp import FastMCP
-from fastmcp.server.dependencies import get_access_token
+from fastmcp.server.dependencies import (
+    get_access_token,
+    get_context,
+    get_http_headers,
+)
 
+from .sdk_pool import SDKPool
 from .utils import MCP_SERVER_VERSION
 
 logger = logging.getLogger(__name__)
 
+# Tool calls running at once; 0 or None lifts the cap
+DEFAULT_MAX_CONCURRENT_TOOL_CALLS = 64
+# Progress messages are cut to this many characters
+MAX_PROGRESS_MESSAGE_LENGTH = 200
+# Keys of an event tried in order for the text of its progress message
+PROGRESS_MESSAGE_KEYS = ("message", "status", "content", "event", "type")
+
+_END_OF_STREAM = object()
+
+
+def _progress_message(event: Any) -> Optional[str]:
+    """A short line describing a streamed event, if it has any text to show."""
+    if not isinstance(event, dict):
+        return None
+    for key in PROGRESS_MESSAGE_KEYS:
+        value = event.get(key)
+        if isinstance(value, str) and value.strip():
+            text = " ".join(value.split())
+            if len(text) > MAX_PROGRESS_MESSAGE_LENGTH:
+                text = text[: MAX_PROGRESS_MESSAGE_LENGTH - 3] + "..."
+            return text
+    return None
+
+
+async def _relay_stream(events: Any) -> Any:
+    """
+    Consume a streamed result, relaying each event to the MCP client as a progress
+    notification, and return the last event. Events of a sync generator are pulled
+    in a worker thread.
+    """
+    try:
+        context = get_context()
+    except RuntimeError:
+        context = None
+
+    # The pending next() of a sync generator, which outlives a cancelled handler
+    pulling: asyncio.Future | None = None
+
+    async def next_event() -> Any:
+        nonlocal pulling
+        if inspect.isasyncgen(events):
+            return await anext(events, _END_OF_STREAM)
+        pulling = asyncio.ensure_future(asyncio.to_thread(next, events, _END_OF_STREAM))
+        return await asyncio.shield(pulling)
+
+    def close_after_next(future: asyncio.Future) -> None:
+        if not future.cancelled():
+            # Retrieved so a failure of the abandoned next() isn't logged
+            future.exception()
+        asyncio.get_running_loop().run_in_executor(None, events.close)
+
+    last_event = None
+    progress = 0
+    try:
+        while (event := await next_event()) is not _END_OF_STREAM:
+            last_event = event
+            progress += 1
+            if context is not None:
+                # Only sent when the client asked for progress with a progressToken
+                await context.report_progress(
+                    progress, message=_progress_message(event)
+                )
+    finally:
+        if inspect.isasyncgen(events):
+            await events.aclose()
+        elif pulling is None or pulling.done():
+            await asyncio.to_thread(events.close)
+        else:
+            # The handler was cancelled while next() runs in the worker thread, and
+            # a generator can't be closed while it executes
+            pulling.add_done_callback(close_after_next)
+    return last_event
+
+
+def _trace_handler(tool_name: str):
+    """
+    Run an MCP tool handler in a span when OpenTelemetry is installed. In HTTP mode
+    the span joins the trace of the client's request when it sends a traceparent.
+    """
+    return traced(
+        f"mcp.tool {tool_name}",
+        kind=SPAN_KIND_SERVER,
+        attributes={"mcp.tool.name": tool_name},
+        get_carrier=get_http_headers,
+    )
+
 
 def register_tools(
     mcp: FastMCP,
@@ -60,6 +163,8 @@ def register_tools(
     enabled_tools: set[str] | None = None,
     disabled_tools: set[str] | None = None,
     enabled_beta_tools: set[str] | None = None,
+    sdk_pool: SDKPool | None = None,
+    max_concurrent_tool_calls: int | None = DEFAULT_MAX_CONCURRENT_TOOL_CALLS,
 ) -> None:
     """
     Register Alation tools with the MCP server.
@@ -68,6 +173,9 @@ def register_tools(
         mcp: FastMCP server instance
         alation_sdk: Pre-configured SDK instance for STDIO mode (optional)
         base_url: Base URL for HTTP mode (required for HTTP mode)
+        sdk_pool: SDKs for HTTP mode (optional, created for base_url by default;
+            the caller closes it with aclose())
+        max_concurrent_tool_calls: Cap on tool calls running at once (0 or None: no cap)
         disabled_tools: Set of disabled tools (required)
         enabled_beta_tools: Set of enabled beta tools (required)
     """
@@ -77,18 +185,32 @@ def register_tools(
     config_disabled = disabled_tools or set()
     config_enabled_beta = enabled_beta_tools or set()
 
+    if alation_sdk is None and sdk_pool is None and base_url:
+        sdk_pool = SDKPool(
+            base_url,
+            dist_version=f"mcp-{MCP_SERVER_VERSION}",
+            enable_streaming=True,
+            sdk_class=AsyncAlationAIAgentSDK,
+        )
+
+    limiter = (
+        asyncio.Semaphore(max_concurrent_tool_calls)
+        if max_concurrent_tool_calls
+        else contextlib.nullcontext()
+    )
+
     def create_sdk_for_tool() -> AlationAIAgentSDK:
         """Create SDK instance for tool execution with appropriate authentication."""
         if alation_sdk:
             # STDIO mode: use the shared SDK instance
             return alation_sdk
         else:
-            # HTTP mode: create per-request SDK instance
+            # HTTP mode: the pooled SDK of the request's token
             return _create_http_sdk()
 
     def _create_http_sdk() -> AlationAIAgentSDK:
-        """Create SDK for HTTP mode using request authentication."""
-        if not base_url:
+        """Get the SDK for HTTP mode using request authentication."""
+        if sdk_pool is None:
             raise ValueError("Base URL required for HTTP mode")
 
         try:
@@ -96,15 +218,7 @@ def register_tools(
             if access_token is None:
                 raise ValueError("No authenticated user found. Authorization required.")
 
-            auth_params = BearerTokenAuthParams(access_token.token)
-
-            return AlationAIAgentSDK(
-                base_url=base_url,
-                auth_method="bearer_token",
-                auth_params=auth_params,
-                dist_version=f"mcp-{MCP_SERVER_VERSION}",
-                sdk_options=AgentSDKOptions(enable_streaming=True),
-            )
+            return sdk_pool.get(access_token.token, access_token.expires_at)
         except ValueError as e:
             logger.error(f"Authentication error in HTTP mode: {e}")
             raise  # Re-raise ValueError as-is
@@ -112,6 +226,42 @@ def register_tools(
             logger.error(f"Failed to create HTTP SDK: {e}")
             raise RuntimeError(f"SDK initialization failed: {e}") from e
 
+    async def run_with_sdk(
+        get_call: Callable[[AlationAIAgentSDK], Callable[..., Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run the call picked by get_call from the SDK of the request, awaiting it on
+        an async SDK and in a worker thread on a sync one. Streamed results are
+        relayed as progress and reduced to their last event.
+        """
+        async with limiter:
+            sdk = create_sdk_for_tool()
+            call = get_call(sdk)
+            if isinstance(sdk, AsyncAlationAIAgentSDK):
+                result = await call(*args, **kwargs)
+            else:
+                result = await asyncio.to_thread(call, *args, **kwargs)
+            if inspect.isasyncgen(result) or inspect.isgenerator(result):
+                return await _relay_stream(result)
+            return result
+
+    async def call_sdk(method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Call an SDK method such as get_context."""
+        return await run_with_sdk(
+            lambda sdk: getattr(sdk, method_name), *args, **kwargs
+        )
+
+    async def call_tool(tool_name: str, **kwargs: Any) -> Any:
+        """Run a tool of the SDK such as lineage_tool with run() or arun()."""
+
+        def get_call(sdk: AlationAIAgentSDK) -> Callable[..., Any]:
+            tool = getattr(sdk, tool_name)
+            return tool.arun if isinstance(sdk, AsyncAlationAIAgentSDK) else tool.run
+
+        return await run_with_sdk(get_call, **kwargs)
+
     """
       Previously we could get away with simply exporting everything that wasn't disabled.
       That is no longer the case as we're clocking in at 28 tools (including agents as tools).
@@ -145,14 +295,13 @@ def register_tools(
         metadata = get_tool_metadata(AlationContextTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def alation_context(
+        @_trace_handler(metadata["name"])
+        async def alation_context(
             question: str,
             signature: Optional[Dict[str, Any]] = None,
             chat_id: Optional[str] = None,
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_context(question, signature, chat_id=chat_id)
-            return result
+            return await call_sdk("get_context", question, signature, chat_id=chat_id)
 
     if is_tool_enabled(
         AlationTools.BULK_RETRIEVAL,
@@ -163,12 +312,11 @@ def register_tools(
         metadata = get_tool_metadata(AlationBulkRetrievalTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def alation_bulk_retrieval(
+        @_trace_handler(metadata["name"])
+        async def alation_bulk_retrieval(
             signature: Optional[dict] = None, chat_id: Optional[str] = None
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_bulk_objects(signature, chat_id=chat_id)
-            return result
+            return await call_sdk("get_bulk_objects", signature, chat_id=chat_id)
 
     if is_tool_enabled(
         AlationTools.GET_DATA_PRODUCT,
@@ -179,12 +327,11 @@ def register_tools(
         metadata = get_tool_metadata(AlationGetDataProductTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_data_products(
+        @_trace_handler(metadata["name"])
+        async def get_data_products(
             product_id: Optional[str] = None, query: Optional[str] = None
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_data_products(product_id, query)
-            return result
+            return await call_sdk("get_data_products", product_id, query)
 
     if is_tool_enabled(
         AlationTools.LINEAGE, config_enabled, config_disabled, config_enabled_beta
@@ -204,7 +351,8 @@ def register_tools(
         metadata = get_tool_metadata(AlationLineageTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_lineage(
+        @_trace_handler(metadata["name"])
+        async def get_lineage(
             root_node: LineageRootNode,
             direction: LineageDirectionType,
             limit: int | None = 1000,
@@ -219,9 +367,10 @@ def register_tools(
             time_from: LineageTimestampType | None = None,
             time_to: LineageTimestampType | None = None,
             chat_id: str | None = None,
+            collapse_to_otypes: LineageOTypeFilterType | None = None,
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.lineage_tool.run(
+            return await call_tool(
+                "lineage_tool",
                 root_node=root_node,
                 direction=direction,
                 limit=limit,
@@ -236,8 +385,8 @@ def register_tools(
                 time_from=time_from,
                 time_to=time_to,
                 chat_id=chat_id,
+                collapse_to_otypes=collapse_to_otypes,
             )
-            return result
 
     if is_tool_enabled(
         AlationTools.DATA_QUALITY, config_enabled, config_disabled, config_enabled_beta
@@ -245,7 +394,8 @@ def register_tools(
         metadata = get_tool_metadata(CheckDataQualityTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def check_data_quality(
+        @_trace_handler(metadata["name"])
+        async def check_data_quality(
             table_ids: list | None = None,
             sql_query: Optional[str] = None,
             db_uri: Optional[str] = None,
@@ -256,8 +406,8 @@ def register_tools(
             dq_score_threshold: int | None = None,
             chat_id: Optional[str] = None,
         ) -> dict | str:
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.check_data_quality(
+            return await call_sdk(
+                "check_data_quality",
                 table_ids=table_ids,
                 sql_query=sql_query,
                 db_uri=db_uri,
@@ -268,7 +418,6 @@ def register_tools(
                 dq_score_threshold=dq_score_threshold,
                 chat_id=chat_id,
             )
-            return result
 
     if is_tool_enabled(
         AlationTools.GENERATE_DATA_PRODUCT,
@@ -279,10 +428,9 @@ def register_tools(
         metadata = get_tool_metadata(GenerateDataProductTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def generate_data_product() -> dict:
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.generate_data_product()
-            return result
+        @_trace_handler(metadata["name"])
+        async def generate_data_product() -> dict:
+            return await call_sdk("generate_data_product")
 
     if is_tool_enabled(
         AlationTools.GET_CUSTOM_FIELDS_DEFINITIONS,
@@ -293,10 +441,9 @@ def register_tools(
         metadata = get_tool_metadata(GetCustomFieldsDefinitionsTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_custom_fields_definitions(chat_id: Optional[str] = None):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_custom_fields_definitions(chat_id=chat_id)
-            return result
+        @_trace_handler(metadata["name"])
+        async def get_custom_fields_definitions(chat_id: Optional[str] = None):
+            return await call_sdk("get_custom_fields_definitions", chat_id=chat_id)
 
     if is_tool_enabled(
         AlationTools.GET_DATA_DICTIONARY_INSTRUCTIONS,
@@ -307,10 +454,9 @@ def register_tools(
         metadata = get_tool_metadata(GetDataDictionaryInstructionsTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_data_dictionary_instructions():
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_data_dictionary_instructions()
-            return result
+        @_trace_handler(metadata["name"])
+        async def get_data_dictionary_instructions():
+            return await call_sdk("get_data_dictionary_instructions")
 
     if is_tool_enabled(
         AlationTools.SIGNATURE_CREATION,
@@ -321,10 +467,11 @@ def register_tools(
         metadata = get_tool_metadata(SignatureCreationTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_signature_creation_instructions(chat_id: Optional[str] = None):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_signature_creation_instructions(chat_id=chat_id)
-            return result
+        @_trace_handler(metadata["name"])
+        async def get_signature_creation_instructions(chat_id: Optional[str] = None):
+            return await call_sdk(
+                "get_signature_creation_instructions", chat_id=chat_id
+            )
 
     if is_tool_enabled(
         AlationTools.GET_CONTEXT_BY_ID,
@@ -335,13 +482,14 @@ def register_tools(
         metadata = get_tool_metadata(GetContextByIdTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_context_by_id(
+        @_trace_handler(metadata["name"])
+        async def get_context_by_id(
             signature: Dict[str, Any],
             chat_id: Optional[str] = None,
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_context_by_id(signature=signature, chat_id=chat_id)
-            return result
+            return await call_sdk(
+                "get_context_by_id", signature=signature, chat_id=chat_id
+            )
 
     if is_tool_enabled(
         AlationTools.ANALYZE_CATALOG_QUESTION,
@@ -352,10 +500,11 @@ def register_tools(
         metadata = get_tool_metadata(AnalyzeCatalogQuestionTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def analyze_catalog_question(question: str, chat_id: Optional[str] = None):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.analyze_catalog_question(question, chat_id=chat_id)
-            return result
+        @_trace_handler(metadata["name"])
+        async def analyze_catalog_question(
+            question: str, chat_id: Optional[str] = None
+        ):
+            return await call_sdk("analyze_catalog_question", question, chat_id=chat_id)
 
     # Catalog Search Tools
     if is_tool_enabled(
@@ -367,12 +516,13 @@ def register_tools(
         metadata = get_tool_metadata(CatalogContextSearchAgentTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def catalog_context_search_agent(message: str, chat_id: Optional[str] = None):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.catalog_context_search_agent(
-                message=message, chat_id=chat_id
+        @_trace_handler(metadata["name"])
+        async def catalog_context_search_agent(
+            message: str, chat_id: Optional[str] = None
+        ):
+            return await call_sdk(
+                "catalog_context_search_agent", message=message, chat_id=chat_id
             )
-            return result
 
     if is_tool_enabled(
         AlationTools.GET_DATA_SOURCES,
@@ -383,10 +533,11 @@ def register_tools(
         metadata = get_tool_metadata(GetDataSourcesTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def get_data_sources_tool(limit: int = 100, chat_id: Optional[str] = None):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.get_data_sources(limit=limit, chat_id=chat_id)
-            return result
+        @_trace_handler(metadata["name"])
+        async def get_data_sources_tool(
+            limit: int = 100, chat_id: Optional[str] = None
+        ):
+            return await call_sdk("get_data_sources", limit=limit, chat_id=chat_id)
 
     # SQL and Query Tools
     if is_tool_enabled(
@@ -398,14 +549,16 @@ def register_tools(
         metadata = get_tool_metadata(SqlQueryAgentTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def sql_query_agent(
+        @_trace_handler(metadata["name"])
+        async def sql_query_agent(
             message: str, data_product_id: str, chat_id: Optional[str] = None
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.sql_query_agent(
-                message=message, data_product_id=data_product_id, chat_id=chat_id
+            return await call_sdk(
+                "sql_query_agent",
+                message=message,
+                data_product_id=data_product_id,
+                chat_id=chat_id,
             )
-            return result
 
     if is_tool_enabled(
         AlationTools.QUERY_FLOW_AGENT,
@@ -416,14 +569,16 @@ def register_tools(
         metadata = get_tool_metadata(QueryFlowAgentTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def query_flow_agent(
+        @_trace_handler(metadata["name"])
+        async def query_flow_agent(
             message: str, marketplace_id: str, chat_id: Optional[str] = None
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.query_flow_agent(
-                message=message, marketplace_id=marketplace_id, chat_id=chat_id
+            return await call_sdk(
+                "query_flow_agent",
+                message=message,
+                marketplace_id=marketplace_id,
+                chat_id=chat_id,
             )
-            return result
 
     # Custom Agent Tool
     if is_tool_enabled(
@@ -432,11 +587,13 @@ def register_tools(
         metadata = get_tool_metadata(CustomAgentTool)
 
         @mcp.tool(name=metadata["name"], description=metadata["description"])
-        def custom_agent(
+        @_trace_handler(metadata["name"])
+        async def custom_agent(
             agent_config_id: str, payload: dict, chat_id: Optional[str] = None
         ):
-            alation_sdk = create_sdk_for_tool()
-            result = alation_sdk.execute_custom_agent(
-                agent_config_id=agent_config_id, payload=payload, chat_id=chat_id
+            return await call_sdk(
+                "execute_custom_agent",
+                agent_config_id=agent_config_id,
+                payload=payload,
+                chat_id=chat_id,
             )
-            return result
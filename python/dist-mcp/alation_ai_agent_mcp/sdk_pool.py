@@ -0,0 +1,170 @@
+"""
+SDK pool for HTTP mode.
+
+In HTTP mode every tool call carries the bearer token of the MCP client. Instead
+of building an AlationAIAgentSDK for each call, SDKPool keeps one per token, keyed
+by a hash of the token, for as long as the token is valid. The least recently used
+SDK is dropped once the pool is full.
+
+All pooled SDKs share one HTTP connection pool, so calls reuse keep-alive
+connections to Alation whoever makes them, and one cache of the instance info
+(license and version), so it is fetched once per process rather than once per SDK.
+Responses of the instruction tools are cached per user in a shared cache as well.
+
+With sdk_class=AsyncAlationAIAgentSDK the pool holds async SDKs, which share one
+httpx.AsyncClient instead, so calls run on the event loop of the server.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import httpx
+from alation_ai_agent_sdk import (
+    AgentSDKOptions,
+    AlationAIAgentSDK,
+    AsyncAlationAIAgentSDK,
+    BearerTokenAuthParams,
+    TTLCache,
+)
+from alation_ai_agent_sdk.api import (
+    AUTH_METHOD_BEARER_TOKEN,
+    DEFAULT_INSTANCE_INFO_CACHE_TTL_IN_SECONDS,
+    DEFAULT_INSTRUCTION_CACHE_TTL_IN_SECONDS,
+    DEFAULT_KEEPALIVE_IDLE_TIMEOUT_IN_SECONDS,
+    DEFAULT_POOL_MAXSIZE,
+    create_http_session,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of SDKs (distinct tokens) kept
+DEFAULT_SDK_POOL_MAXSIZE = 256
+# An SDK is kept at most this long, and never past the expiry of its token
+DEFAULT_SDK_POOL_TTL_IN_SECONDS = 3600
+# Keep-alive connections to Alation shared by all pooled SDKs
+DEFAULT_SDK_POOL_CONNECTIONS = 4 * DEFAULT_POOL_MAXSIZE
+
+
+class SDKPool:
+    """
+    Thread-safe LRU pool of AlationAIAgentSDK instances, one per bearer token.
+
+    Extra keyword arguments are passed to AgentSDKOptions for every SDK. Call
+    close(), or aclose() for a pool of async SDKs, to release the SDKs and the
+    shared connection pools.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        dist_version: Optional[str] = None,
+        maxsize: int = DEFAULT_SDK_POOL_MAXSIZE,
+        ttl: float = DEFAULT_SDK_POOL_TTL_IN_SECONDS,
+        pool_maxsize: int = DEFAULT_SDK_POOL_CONNECTIONS,
+        sdk_class: type[AlationAIAgentSDK] = AlationAIAgentSDK,
+        **sdk_options: Any,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.base_url = base_url
+        self.dist_version = dist_version
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sdk_class = sdk_class
+        self.sdk_options = sdk_options
+        self.http_session = create_http_session(pool_maxsize=pool_maxsize)
+        self.http_client: Optional[httpx.AsyncClient] = None
+        if issubclass(sdk_class, AsyncAlationAIAgentSDK):
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize,
+                    keepalive_expiry=DEFAULT_KEEPALIVE_IDLE_TIMEOUT_IN_SECONDS,
+                )
+            )
+        # Keyed by base_url, so one entry for the whole pool
+        self.instance_info_cache = TTLCache(
+            maxsize=1, ttl=DEFAULT_INSTANCE_INFO_CACHE_TTL_IN_SECONDS
+        )
+        # Keyed by endpoint and token, room for the few instruction tools per token
+        self.instruction_cache = TTLCache(
+            maxsize=4 * maxsize, ttl=DEFAULT_INSTRUCTION_CACHE_TTL_IN_SECONDS
+        )
+        # Token hash -> (monotonic time the entry expires at, SDK)
+        self._entries: "OrderedDict[str, tuple[float, AlationAIAgentSDK]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, token: str, expires_at: Optional[float] = None) -> AlationAIAgentSDK:
+        """
+        The SDK for `token`, created if the pool has none. `expires_at` (epoch
+        seconds) is the expiry of the token; the SDK is not kept past it.
+        """
+        key = hashlib.sha256(token.encode()).hexdigest()
+        now = time.monotonic()
+        released = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_expires_at, sdk = entry
+                if now < entry_expires_at:
+                    self._entries.move_to_end(key)
+                    return sdk
+                del self._entries[key]
+                released.append(sdk)
+            sdk = self._create_sdk(token)
+            ttl = self.ttl
+            if expires_at is not None:
+                ttl = min(ttl, expires_at - time.time())
+            # A token that is about to expire is not worth keeping
+            if ttl > 0:
+                self._entries[key] = (now + ttl, sdk)
+                while len(self._entries) > self.maxsize:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    released.append(evicted)
+        for old_sdk in released:
+            old_sdk.close()
+        return sdk
+
+    def close(self) -> None:
+        """
+        Close every pooled SDK and the shared requests session. The shared
+        httpx.AsyncClient of async SDKs is left to aclose().
+        """
+        with self._lock:
+            sdks = [sdk for _, sdk in self._entries.values()]
+            self._entries.clear()
+        for sdk in sdks:
+            sdk.close()
+        self.http_session.close()
+        logger.debug("SDK pool closed")
+
+    async def aclose(self) -> None:
+        """Close the pool along with the shared httpx.AsyncClient."""
+        self.close()
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    def _create_sdk(self, token: str) -> AlationAIAgentSDK:
+        return self.sdk_class(
+            base_url=self.base_url,
+            auth_method=AUTH_METHOD_BEARER_TOKEN,
+            auth_params=BearerTokenAuthParams(token),
+            dist_version=self.dist_version,
+            sdk_options=AgentSDKOptions(
+                http_session=self.http_session,
+                instance_info_cache=self.instance_info_cache,
+                instruction_cache=self.instruction_cache,
+                http_client=self.http_client,
+                **self.sdk_options,
+            ),
+        )
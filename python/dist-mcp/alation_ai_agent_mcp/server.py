@@ -9,11 +9,13 @@ It supports two transport modes:
 
 Architecture:
 - STDIO mode creates a shared SDK instance with pre-configured authentication
-- HTTP mode uses per-request authentication via FastMCP's dependency injection
+- HTTP mode uses per-request authentication via FastMCP's dependency injection,
+  with one pooled SDK per token
 - All Alation tools are registered dynamically based on enabled/disabled configuration
 """
 
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Optional
+from contextlib import asynccontextmanager
 from functools import partial
 import logging
 
@@ -23,13 +25,16 @@ from fastmcp.server.auth import RemoteAuthProvider
 from pydantic import AnyHttpUrl
 import uvicorn
 
-from alation_ai_agent_sdk import AlationAIAgentSDK
+from alation_ai_agent_sdk import AlationAIAgentSDK, AsyncAlationAIAgentSDK
 
 from .auth import get_stdio_auth_params, AlationTokenVerifier
 from .register_tools import (
+    DEFAULT_MAX_CONCURRENT_TOOL_CALLS,
     register_tools,
 )
+from .sdk_pool import SDKPool
 from .utils import (
+    get_max_concurrent_tool_calls,
     validate_cloud_instance,
     log_initialization_info,
     setup_logging,
@@ -46,6 +51,7 @@ def create_fastmcp_server(
     host: str = "localhost",
     port: int = 8000,
     external_url: Optional[str] = None,
+    lifespan: Optional[Callable[[FastMCP], Any]] = None,
 ) -> FastMCP:
     """
     Create a FastMCP server instance based on transport mode.
@@ -60,6 +66,7 @@ def create_fastmcp_server(
         host: Host for HTTP server (only used in HTTP mode)
         port: Port for HTTP server (only used in HTTP mode)
         external_url: External URL for OAuth resource_server_url (use for production hosted MCP server)
+        lifespan: FastMCP lifespan run around the server's lifetime (only used in HTTP mode)
 
     Returns:
         FastMCP server instance configured for the specified transport
@@ -87,12 +94,32 @@ def create_fastmcp_server(
         return FastMCP(
             name="Alation MCP Server",
             auth=auth_provider,
+            lifespan=lifespan,
         )
 
     else:
         raise ValueError(f"Unknown transport mode: {transport_mode}")
 
 
+def _close_on_shutdown(sdk_pool: SDKPool) -> Callable[[FastMCP], Any]:
+    """
+    FastMCP lifespan releasing the connections of the SDK pool and of the token
+    verifier when the server shuts down.
+    """
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+        try:
+            yield {}
+        finally:
+            await sdk_pool.aclose()
+            token_verifier = getattr(server.auth, "token_verifier", None)
+            if isinstance(token_verifier, AlationTokenVerifier):
+                await token_verifier.aclose()
+
+    return lifespan
+
+
 def create_server(
     transport: str,
     base_url: Optional[str] = None,
@@ -103,6 +130,7 @@ def create_server(
     port: int = 8000,
     external_url: Optional[str] = None,
     token_verification: Optional[str] = "opaque",
+    max_concurrent_tool_calls: Optional[int] = None,
 ) -> FastMCP:
     """
     Create and configure an MCP server for the specified transport mode.
@@ -115,6 +143,9 @@ def create_server(
         host: Host for HTTP server (only used in HTTP mode)
         port: Port for HTTP server (only used in HTTP mode)
         external_url: External URL for OAuth resource_server_url (only used in HTTP mode)
+        token_verification: "opaque" or "jwt" (only used in HTTP mode)
+        max_concurrent_tool_calls: Cap on tool calls running at once, 0 for no cap
+            (defaults to ALATION_MAX_CONCURRENT_TOOL_CALLS, then 64)
 
     Returns:
         Configured FastMCP server instance
@@ -124,9 +155,26 @@ def create_server(
         base_url, enabled_tools_str, disabled_tools_str, enabled_beta_tools_str
     )
 
+    max_concurrent_tool_calls = get_max_concurrent_tool_calls(max_concurrent_tool_calls)
+    if max_concurrent_tool_calls is None:
+        max_concurrent_tool_calls = DEFAULT_MAX_CONCURRENT_TOOL_CALLS
+
+    # HTTP mode: each tool call uses the pooled async SDK of its token, so calls
+    # don't block the event loop. The pool lives as long as the server.
+    sdk_pool = None
+    lifespan = None
+    if transport == "http":
+        sdk_pool = SDKPool(
+            base_url,
+            dist_version=f"mcp-{MCP_SERVER_VERSION}",
+            enable_streaming=True,
+            sdk_class=AsyncAlationAIAgentSDK,
+        )
+        lifespan = _close_on_shutdown(sdk_pool)
+
     # Create FastMCP server based on transport mode
     mcp = create_fastmcp_server(
-        base_url, transport, token_verification, host, port, external_url
+        base_url, transport, token_verification, host, port, external_url, lifespan
     )
 
     if transport == "stdio":
@@ -151,18 +199,20 @@ def create_server(
             enabled_tools=set(tools_enabled),
             disabled_tools=set(tools_disabled),
             enabled_beta_tools=set(beta_tools_enabled),
+            max_concurrent_tool_calls=max_concurrent_tool_calls,
         )
 
     elif transport == "http":
-        # HTTP mode: No shared SDK - each tool call creates its own SDK instance
-        # Authentication happens per-request via FastMCP's get_access_token()
+        # HTTP mode: No shared SDK - authentication happens per-request via
+        # FastMCP's get_access_token()
         # Register tools with explicit tool configuration
         register_tools(
             mcp,
-            base_url=base_url,
+            sdk_pool=sdk_pool,
             enabled_tools=set(tools_enabled),
             disabled_tools=set(tools_disabled),
             enabled_beta_tools=set(beta_tools_enabled),
+            max_concurrent_tool_calls=max_concurrent_tool_calls,
         )
 
     else:
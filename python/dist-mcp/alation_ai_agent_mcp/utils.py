@@ -217,6 +217,35 @@ def get_tool_configuration(
     return tools_enabled, tools_disabled, beta_tools_enabled
 
 
+def get_max_concurrent_tool_calls(
+    max_concurrent_tool_calls: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Get the cap on tool calls running at once from the provided value or the
+    ALATION_MAX_CONCURRENT_TOOL_CALLS environment variable.
+
+    Returns:
+        The cap, 0 for no cap, or None when neither is set (use the default)
+
+    Raises:
+        ValueError: If the environment variable is not a non-negative integer
+    """
+    if max_concurrent_tool_calls is not None:
+        return max_concurrent_tool_calls
+    value = os.getenv("ALATION_MAX_CONCURRENT_TOOL_CALLS")
+    if not value:
+        return None
+    try:
+        max_concurrent_tool_calls = int(value)
+    except ValueError:
+        max_concurrent_tool_calls = -1
+    if max_concurrent_tool_calls < 0:
+        raise ValueError(
+            f"ALATION_MAX_CONCURRENT_TOOL_CALLS must be a non-negative integer, got {value!r}"
+        )
+    return max_concurrent_tool_calls
+
+
 def prepare_server_config(
     base_url: Optional[str] = None,
     enabled_tools_str: Optional[str] = None,
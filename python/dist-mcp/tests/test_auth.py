@@ -0,0 +1,287 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from alation_ai_agent_mcp.auth import AlationTokenVerifier
+
+BASE_URL = "https://mock-alation.com"
+
+
+class MockUserinfo:
+    """Answers userinfo requests with `status` and counts them."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        # Give concurrent verifications the chance to pile up
+        await asyncio.sleep(0.01)
+        if self.status == "timeout":
+            raise httpx.ReadTimeout("timed out", request=request)
+        if self.status != 200:
+            return httpx.Response(self.status, json={"detail": "nope"})
+        return httpx.Response(200, json={"id": 7, "role": "Server Admin"})
+
+
+@pytest.fixture
+def userinfo():
+    server = MockUserinfo()
+
+    def create_client(verifier):
+        return httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+
+    with patch.object(AlationTokenVerifier, "_create_client", create_client):
+        yield server
+
+
+def verify(verifier, *tokens):
+    async def run():
+        try:
+            return await asyncio.gather(*(verifier.verify_token(t) for t in tokens))
+        finally:
+            await verifier.aclose()
+
+    return asyncio.run(run())
+
+
+def test_verified_token_is_cached(userinfo):
+    verifier = AlationTokenVerifier(BASE_URL)
+
+    first, second = verify(verifier, "token-a", "token-a")
+    (third,) = verify(verifier, "token-a")
+
+    assert first.client_id == "7"
+    assert first.scopes == ["Server Admin"]
+    assert second is first
+    assert third is first
+    assert len(userinfo.requests) == 1
+    assert userinfo.requests[0].headers["Authorization"] == "Bearer token-a"
+
+
+def test_concurrent_verifications_are_coalesced(userinfo):
+    verifier = AlationTokenVerifier(BASE_URL)
+
+    results = verify(verifier, *(["token-a"] * 10 + ["token-b"] * 10))
+
+    assert len(userinfo.requests) == 2
+    assert {result.client_id for result in results} == {"7"}
+
+
+def test_expired_token_is_verified_again(userinfo):
+    verifier = AlationTokenVerifier(BASE_URL)
+    (first,) = verify(verifier, "token-a")
+
+    with patch(
+        "alation_ai_agent_mcp.auth.time.time", return_value=first.expires_at + 1
+    ):
+        verify(verifier, "token-a")
+
+    assert len(userinfo.requests) == 2
+
+
+def test_opaque_token_is_verified_again_after_ttl(userinfo):
+    verifier = AlationTokenVerifier(BASE_URL, opaque_token_ttl=0.05)
+    (access_token,) = verify(verifier, "token-a")
+    assert verify(verifier, "token-a") == [access_token]
+    userinfo.status = 401
+
+    time.sleep(0.1)
+    assert verify(verifier, "token-a") == [None]
+
+    assert len(userinfo.requests) == 2
+
+
+def test_opaque_token_caching_can_be_disabled(userinfo):
+    verifier = AlationTokenVerifier(BASE_URL, opaque_token_ttl=0)
+
+    verify(verifier, "token-a")
+    verify(verifier, "token-a")
+
+    assert len(userinfo.requests) == 2
+
+
+def test_rejected_token_is_cached_briefly(userinfo):
+    userinfo.status = 401
+    verifier = AlationTokenVerifier(BASE_URL, rejected_token_ttl=30)
+
+    assert verify(verifier, "token-a", "token-a") == [None, None]
+    assert verify(verifier, "token-a") == [None]
+    assert len(userinfo.requests) == 1
+
+
+@pytest.mark.parametrize("status", [500, "timeout"])
+def test_failed_verification_is_not_cached(userinfo, status):
+    userinfo.status = status
+    verifier = AlationTokenVerifier(BASE_URL)
+
+    assert verify(verifier, "token-a") == [None]
+    userinfo.status = 200
+    (access_token,) = verify(verifier, "token-a")
+
+    assert access_token is not None
+    assert access_token.expires_at > time.time()
+    assert len(userinfo.requests) == 2
+
+
+ISSUER = "https://mock-alation.com/oauth"
+
+
+class MockJWKSServer:
+    """Serves OAuth metadata and a JWKS, signs tokens and counts key fetches."""
+
+    def __init__(self):
+        self.keys = {}
+        self.jwks_requests = 0
+        self.metadata_available = True
+        self.rotate("key-1")
+
+    def rotate(self, kid):
+        self.kid = kid
+        self.keys[kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def sign(self, kid=None, **claims):
+        kid = kid or self.kid
+        payload = {
+            "iss": ISSUER,
+            "sub": "7",
+            "client_id": "mcp-client",
+            "scope": "openid profile",
+            "exp": int(time.time()) + 600,
+            **claims,
+        }
+        return jwt.encode(payload, self.keys[kid], "RS256", headers={"kid": kid})
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/.well-known/oauth-authorization-server":
+            if not self.metadata_available:
+                return httpx.Response(404)
+            return httpx.Response(
+                200, json={"issuer": ISSUER, "jwks_uri": f"{BASE_URL}/oauth/jwks"}
+            )
+        if request.url.path == "/oauth/jwks":
+            self.jwks_requests += 1
+            keys = []
+            for kid, key in self.keys.items():
+                jwk = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+                keys.append({**jwk, "kid": kid, "alg": "RS256", "use": "sig"})
+            return httpx.Response(200, json={"keys": keys})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def jwks_server():
+    server = MockJWKSServer()
+
+    def create_client(verifier):
+        return httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+
+    with patch.object(AlationTokenVerifier, "_create_client", create_client):
+        yield server
+
+
+def test_jwt_is_verified_with_cached_keys(jwks_server):
+    verifier = AlationTokenVerifier(BASE_URL, token_verification="jwt")
+    tokens = [jwks_server.sign(jti=str(i)) for i in range(5)]
+
+    results = verify(verifier, *tokens)
+
+    assert all(result is not None for result in results)
+    assert results[0].client_id == "mcp-client"
+    assert results[0].scopes == ["openid", "profile"]
+    assert results[0].claims["sub"] == "7"
+    assert jwks_server.jwks_requests == 1
+
+
+def test_jwt_signed_with_rotated_key_is_accepted(jwks_server):
+    verifier = AlationTokenVerifier(BASE_URL, token_verification="jwt")
+    verify(verifier, jwks_server.sign())
+
+    jwks_server.rotate("key-2")
+    with patch("alation_ai_agent_mcp.auth.time.monotonic", return_value=1e12):
+        (result,) = verify(verifier, jwks_server.sign())
+
+    assert result is not None
+    assert jwks_server.jwks_requests == 2
+
+
+def test_unknown_key_refetch_is_throttled(jwks_server):
+    verifier = AlationTokenVerifier(BASE_URL, token_verification="jwt")
+    token = jwks_server.sign()
+    jwks_server.keys.clear()
+    jwks_server.rotate("key-2")
+
+    assert verify(verifier, token) == [None]
+    assert verify(verifier, jwks_server.sign(jti="other")) != [None]
+    jwks_server.rotate("key-3")
+    assert verify(verifier, jwks_server.sign(jti="new")) == [None]
+    assert jwks_server.jwks_requests == 1
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": int(time.time()) - 3600},
+        {"iss": "https://someone-else.com"},
+    ],
+)
+def test_invalid_jwt_is_rejected(jwks_server, claims):
+    verifier = AlationTokenVerifier(BASE_URL, token_verification="jwt")
+
+    assert verify(verifier, jwks_server.sign(**claims)) == [None]
+
+
+def test_jwt_with_bad_signature_is_rejected(jwks_server):
+    verifier = AlationTokenVerifier(BASE_URL, token_verification="jwt")
+    header, payload, signature = jwks_server.sign().split(".")
+    tampered = f"{header}.{payload}.{signature[::-1]}"
+
+    assert verify(verifier, tampered, "not-a-jwt") == [None, None]
+
+
+def test_issuer_is_checked_with_overridden_jwks_url(jwks_server):
+    verifier = AlationTokenVerifier(
+        BASE_URL, token_verification="jwt", jwks_url=f"{BASE_URL}/oauth/jwks"
+    )
+
+    results = verify(verifier, jwks_server.sign(), jwks_server.sign(iss="https://x"))
+
+    assert results[0] is not None
+    assert results[1] is None
+
+
+def test_configured_issuer_survives_refresh(jwks_server):
+    verifier = AlationTokenVerifier(
+        BASE_URL, token_verification="jwt", issuer="https://configured"
+    )
+
+    results = verify(verifier, jwks_server.sign(iss="https://configured"))
+    asyncio.run(verifier.jwks.refresh())
+
+    assert results[0] is not None
+    assert verifier.jwks.issuer == "https://configured"
+    assert verify(verifier, jwks_server.sign(jti="other")) == [None]
+
+
+def test_jwt_is_rejected_while_issuer_is_unknown(jwks_server):
+    jwks_server.metadata_available = False
+    jwks_url = f"{BASE_URL}/oauth/jwks"
+    verifier = AlationTokenVerifier(
+        BASE_URL, token_verification="jwt", jwks_url=jwks_url
+    )
+
+    assert verify(verifier, jwks_server.sign()) == [None]
+
+    verifier = AlationTokenVerifier(
+        BASE_URL, token_verification="jwt", jwks_url=jwks_url, issuer=ISSUER
+    )
+
+    assert verify(verifier, jwks_server.sign()) != [None]
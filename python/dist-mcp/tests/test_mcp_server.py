@@ -1,8 +1,12 @@
+import asyncio
 import requests
 import pytest
 import os
 from unittest.mock import patch, MagicMock
+from fastmcp import Client
 from alation_ai_agent_mcp import server
+from alation_ai_agent_mcp.auth import AlationTokenVerifier
+from alation_ai_agent_mcp.sdk_pool import SDKPool
 from alation_ai_agent_mcp.utils import MCP_SERVER_VERSION
 from alation_ai_agent_sdk import (
     AlationTools,
@@ -25,7 +29,9 @@ def global_network_mocks(monkeypatch):
             return response
         return MagicMock(status_code=200, json=MagicMock(return_value={}))
 
-    monkeypatch.setattr(requests, "post", mock_post)
+    monkeypatch.setattr(
+        requests.Session, "post", lambda _session, *a, **kw: mock_post(*a, **kw)
+    )
 
     # Mock requests.get for license and version
     def mock_get(url, *args, **kwargs):
@@ -41,7 +47,9 @@ def global_network_mocks(monkeypatch):
             return response
         return MagicMock(status_code=200, json=MagicMock(return_value={}))
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda _session, *a, **kw: mock_get(*a, **kw)
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -351,3 +359,24 @@ def test_run_server_cli_with_arguments(mock_create_server):
         mock_create_server.assert_called_with(
             "stdio", None, None, "tool1,tool2", "tool3", None, None, None, None
         )
+
+
+def test_http_server_closes_connections_on_shutdown(manage_environment_variables):
+    """
+    Test that the HTTP server releases the SDK pool and token verifier when it
+    shuts down.
+    """
+    mcp = server.create_server("http")
+
+    async def run():
+        async with Client(mcp):
+            pass
+
+    with (
+        patch.object(SDKPool, "aclose") as mock_pool_aclose,
+        patch.object(AlationTokenVerifier, "aclose") as mock_verifier_aclose,
+    ):
+        asyncio.run(run())
+
+    mock_pool_aclose.assert_awaited_once()
+    mock_verifier_aclose.assert_awaited_once()
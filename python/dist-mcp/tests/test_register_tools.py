@@ -0,0 +1,170 @@
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.server.auth import AccessToken
+
+from alation_ai_agent_sdk import AlationTools, AsyncAlationAIAgentSDK
+from alation_ai_agent_mcp.register_tools import _relay_stream, register_tools
+from alation_ai_agent_mcp.sdk_pool import SDKPool
+
+BASE_URL = "https://mock-alation.com"
+
+
+def call_tools(mcp, name, calls, progress_handler=None):
+    async def run():
+        async with Client(mcp) as client:
+            return await asyncio.gather(
+                *(
+                    client.call_tool(name, arguments, progress_handler=progress_handler)
+                    for arguments in calls
+                )
+            )
+
+    results = asyncio.run(run())
+    return [json.loads(result.content[0].text) for result in results]
+
+
+@pytest.fixture
+def access_token():
+    token = AccessToken(token="token-a", client_id="7", scopes=[], expires_at=None)
+    with patch(
+        "alation_ai_agent_mcp.register_tools.get_access_token", return_value=token
+    ):
+        yield token
+
+
+def test_http_mode_awaits_pooled_async_sdk(access_token):
+    running = []
+    peak = []
+
+    async def get_data_sources(self, limit=100, chat_id=None):
+        running.append(limit)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+        async def events():
+            yield {"content": "first"}
+            yield {"content": f"last {limit}"}
+
+        return events()
+
+    mcp = FastMCP(name="test")
+    pool = SDKPool(BASE_URL, enable_streaming=True, sdk_class=AsyncAlationAIAgentSDK)
+    register_tools(
+        mcp,
+        sdk_pool=pool,
+        enabled_tools={AlationTools.GET_DATA_SOURCES},
+        max_concurrent_tool_calls=2,
+    )
+
+    with patch.object(AsyncAlationAIAgentSDK, "get_data_sources", get_data_sources):
+        results = call_tools(
+            mcp, "get_data_sources_tool", [{"limit": i} for i in range(6)]
+        )
+
+    assert len(pool) == 1
+    asyncio.run(pool.aclose())
+    assert results == [{"content": f"last {i}"} for i in range(6)]
+    assert max(peak) == 2
+
+
+def test_stdio_sdk_runs_in_worker_thread():
+    sdk = MagicMock()
+    threads = []
+
+    def get_context(question, signature, chat_id=None):
+        threads.append(threading.current_thread())
+        yield {"content": question}
+
+    sdk.get_context.side_effect = get_context
+    mcp = FastMCP(name="test")
+    register_tools(
+        mcp, alation_sdk=sdk, enabled_tools={AlationTools.AGGREGATED_CONTEXT}
+    )
+
+    (result,) = call_tools(mcp, "alation_context", [{"question": "sales tables"}])
+
+    assert result == {"content": "sales tables"}
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_stream_events_are_relayed_as_progress(access_token):
+    progress = []
+    closed = []
+
+    async def catalog_context_search_agent(self, message, chat_id=None):
+        async def events():
+            try:
+                yield {"status": "Searching the catalog"}
+                yield {"message": "Found " + "tables " * 100}
+                yield {"content": "answer", "model_message": "x" * 1000}
+            finally:
+                closed.append(True)
+
+        return events()
+
+    async def progress_handler(value, total, message):
+        progress.append((value, message))
+
+    mcp = FastMCP(name="test")
+    pool = SDKPool(BASE_URL, enable_streaming=True, sdk_class=AsyncAlationAIAgentSDK)
+    register_tools(
+        mcp,
+        sdk_pool=pool,
+        enabled_tools={AlationTools.CATALOG_CONTEXT_SEARCH_AGENT},
+    )
+
+    with patch.object(
+        AsyncAlationAIAgentSDK,
+        "catalog_context_search_agent",
+        catalog_context_search_agent,
+    ):
+        (result,) = call_tools(
+            mcp,
+            "catalog_context_search_agent",
+            [{"message": "sales tables"}],
+            progress_handler=progress_handler,
+        )
+
+    asyncio.run(pool.aclose())
+    assert result == {"content": "answer", "model_message": "x" * 1000}
+    assert [value for value, _ in progress] == [1, 2, 3]
+    assert progress[0][1] == "Searching the catalog"
+    assert len(progress[1][1]) == 200
+    assert progress[1][1].endswith("...")
+    assert progress[2][1] == "answer"
+    assert closed == [True]
+
+
+def test_cancelled_sync_stream_is_closed_once_next_returns():
+    pulling = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+
+    def events():
+        try:
+            yield {"content": "first"}
+            pulling.set()
+            release.wait(timeout=5)
+            yield {"content": "second"}
+        finally:
+            closed.set()
+
+    async def run():
+        relay = asyncio.ensure_future(_relay_stream(events()))
+        await asyncio.to_thread(pulling.wait, 5)
+        relay.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await relay
+        assert not closed.is_set()
+        release.set()
+        await asyncio.to_thread(closed.wait, 5)
+
+    asyncio.run(run())
+
+    assert closed.is_set()
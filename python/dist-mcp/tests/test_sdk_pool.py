@@ -0,0 +1,86 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from alation_ai_agent_mcp.sdk_pool import SDKPool
+
+BASE_URL = "https://mock-alation.com"
+
+
+@pytest.fixture
+def instance_info_requests(monkeypatch):
+    """URLs of the instance info requests made through any session."""
+    urls = []
+
+    def mock_get(_session, url, *args, **kwargs):
+        urls.append(url)
+        response = MagicMock(status_code=200)
+        if "/api/v1/license" in url:
+            response.json.return_value = {"is_cloud": True}
+        else:
+            response.json.return_value = {"ALATION_RELEASE_NAME": "2025.1.2"}
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    return urls
+
+
+@pytest.fixture
+def pool():
+    pool = SDKPool(BASE_URL, enable_streaming=True)
+    yield pool
+    pool.close()
+
+
+def test_pool_reuses_sdk_per_token(pool):
+    first = pool.get("token-a")
+    other = pool.get("token-b")
+
+    assert pool.get("token-a") is first
+    assert other is not first
+    assert first.api.enable_streaming is True
+    # One connection pool for every SDK
+    assert first.api._get_http_session() is pool.http_session
+    assert other.api._get_http_session() is pool.http_session
+
+
+def test_pool_evicts_least_recently_used():
+    small_pool = SDKPool(BASE_URL, maxsize=2)
+    first = small_pool.get("token-a")
+    second = small_pool.get("token-b")
+    small_pool.get("token-a")
+
+    with patch.object(second, "close") as mock_close:
+        small_pool.get("token-c")
+        mock_close.assert_called_once()
+
+    assert len(small_pool) == 2
+    assert small_pool.get("token-a") is first
+    assert small_pool.get("token-b") is not second
+    small_pool.close()
+
+
+def test_pool_does_not_keep_sdk_past_token_expiry(pool):
+    first = pool.get("token-a", expires_at=time.time() + 60)
+    later = time.monotonic() + 61
+
+    with patch("alation_ai_agent_mcp.sdk_pool.time.monotonic", return_value=later):
+        assert pool.get("token-a") is not first
+
+    expired = pool.get("token-b", expires_at=time.time() - 1)
+    assert pool.get("token-b", expires_at=time.time() - 1) is not expired
+
+
+def test_pool_shares_instance_info(pool, instance_info_requests):
+    for token in ("token-a", "token-b", "token-c"):
+        assert pool.get(token).api.alation_release_name == "2025.1.2"
+
+    assert len(instance_info_requests) == 2
+
+
+def test_closing_an_sdk_leaves_the_shared_session_open(pool):
+    with patch.object(pool.http_session, "close") as mock_close:
+        pool.get("token-a").close()
+        mock_close.assert_not_called()